@@ -21,6 +21,7 @@ def analyze_scenario_performance(
     judge_provider: str,
     samples_per_scenario: int = 3,
     judge_budget: Optional[int] = None,
+    judge_pack_size: int = 1,
 ) -> dict:
     """
     Analyze performance across different scenario types.
@@ -33,6 +34,7 @@ def analyze_scenario_performance(
         judge_provider: LLM judge provider (required)
         samples_per_scenario: Number of sessions to judge per scenario
         judge_budget: Maximum number of judge API calls
+        judge_pack_size: Number of sessions sent to the judge in one request
 
     Returns:
         Scenario performance analysis report
@@ -117,20 +119,19 @@ def analyze_scenario_performance(
         )
 
         # Judge samples
-        judge_results = []
-        for session in samples:
-            try:
-                analysis = auth_judge.evaluate_session(
-                    session_id=session["session_id"],
-                    turns=session.get("turns", []),
-                    scenario_tag=scenario_tag,
-                    calibrated_score=session_scores[session["session_id"]],
-                )
-                judge_results.append(analysis)
-                total_judged += 1
-            except Exception as e:
-                print(f"  Warning: Judge failed for {session['session_id']}: {e}")
-                continue
+        judge_results = auth_judge.evaluate_sessions(
+            (
+                {
+                    "session_id": session["session_id"],
+                    "turns": session.get("turns", []),
+                    "scenario_tag": scenario_tag,
+                    "calibrated_score": session_scores[session["session_id"]],
+                }
+                for session in samples
+            ),
+            pack_size=judge_pack_size,
+        )
+        total_judged += len(judge_results)
 
         # Aggregate judge feedback
         judge_scores = [r.score for r in judge_results]
@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import json
-import math
 from pathlib import Path
 from typing import Optional
 
 import numpy as np
 
-from alignmenter.providers.embeddings import load_embedding_provider
+from alignmenter.providers.embeddings import (
+    embed_in_batches,
+    embed_matrix,
+    load_embedding_provider,
+    normalize_rows,
+)
 from alignmenter.utils import load_yaml
 
 
@@ -57,9 +61,7 @@ def estimate_bounds(
     if not exemplar_texts:
         raise ValueError(f"No exemplars found in {persona_path}")
 
-    exemplar_embeddings = [
-        _normalize_vector(emb) for emb in embedder.embed(exemplar_texts)
-    ]
+    exemplar_embeddings = normalize_rows(embed_matrix(embedder, exemplar_texts))
 
     # Compute raw style similarity for all labeled examples
     print(f"Computing style similarity for {len(labeled_data)} examples...")
@@ -67,22 +69,17 @@ def estimate_bounds(
     on_brand_scores = []
     off_brand_scores = []
 
-    for i, example in enumerate(labeled_data):
-        if (i + 1) % 10 == 0:
-            print(f"  Progress: {i + 1}/{len(labeled_data)}")
-
-        text = example.get("text", "")
-        if not text:
-            continue
-
-        # Embed and compute max similarity to exemplars
-        embedding = _normalize_vector(embedder.embed([text])[0])
-        similarities = [
-            _cosine_similarity(embedding, exemplar)
-            for exemplar in exemplar_embeddings
-        ]
-        max_sim = max(similarities) if similarities else 0.0
+    examples = [example for example in labeled_data if example.get("text", "")]
+    embeddings = normalize_rows(embed_in_batches(embedder, [example["text"] for example in examples]))
+    # Max similarity to any exemplar, for every example in one matrix product
+    max_similarities = (
+        np.clip(embeddings @ exemplar_embeddings.T, -1.0, 1.0).max(axis=1)
+        if len(examples)
+        else np.zeros(0, dtype=np.float32)
+    )
 
+    for example, similarity in zip(examples, max_similarities):
+        max_sim = float(similarity)
         raw_style_scores.append(max_sim)
 
         # Track by label
@@ -142,23 +139,6 @@ def estimate_bounds(
     return report
 
 
-def _normalize_vector(vector: list[float]) -> list[float]:
-    """Normalize vector to unit length."""
-    norm = math.sqrt(sum(v * v for v in vector))
-    if not norm:
-        return [0.0] * len(vector)
-    return [v / norm for v in vector]
-
-
-def _cosine_similarity(vec_a: list[float], vec_b: list[float]) -> float:
-    """Compute cosine similarity between two vectors."""
-    length = min(len(vec_a), len(vec_b))
-    if not length:
-        return 0.0
-    dot = sum(vec_a[i] * vec_b[i] for i in range(length))
-    return max(-1.0, min(1.0, dot))
-
-
 def main():
     """CLI entry point for estimate_bounds."""
     import argparse
@@ -20,6 +20,7 @@ def diagnose_calibration_errors(
     embedding_provider: Optional[str] = None,
     judge_provider: str,
     judge_budget: Optional[int] = None,
+    judge_pack_size: int = 1,
 ) -> dict:
     """
     Diagnose calibration errors by analyzing false positives and false negatives.
@@ -31,6 +32,7 @@ def diagnose_calibration_errors(
         embedding_provider: Embedding provider (default: sentence-transformer)
         judge_provider: LLM judge provider (required)
         judge_budget: Maximum number of judge API calls
+        judge_pack_size: Number of sessions sent to the judge in one request
 
     Returns:
         Error analysis report with judge reasoning
@@ -127,35 +129,36 @@ def diagnose_calibration_errors(
     analyzed_fps = []
     analyzed_fns = []
 
-    for error in errors_to_analyze:
-        try:
-            analysis = auth_judge.evaluate_session(
-                session_id=f"error_{error['index']}",
-                turns=[
+    analyses = auth_judge.evaluate_sessions(
+        (
+            {
+                "session_id": f"error_{error['index']}",
+                "turns": [
                     {"role": "user", "text": "validation"},
                     {"role": "assistant", "text": error["text"]},
                 ],
-                calibrated_score=error["calibrated_score"],
-            )
-
-            error_with_analysis = {
-                "text": error["text"][:200],  # Truncate for report
-                "calibrated_score": round(error["calibrated_score"], 3),
-                "true_label": error["true_label"],
-                "judge_score": round(analysis.score, 1),
-                "judge_reasoning": analysis.reasoning,
-                "judge_weaknesses": analysis.weaknesses,
-                "judge_suggestion": analysis.suggestion,
+                "calibrated_score": error["calibrated_score"],
             }
+            for error in errors_to_analyze
+        ),
+        pack_size=judge_pack_size,
+    )
 
-            if error["true_label"] == 0:
-                analyzed_fps.append(error_with_analysis)
-            else:
-                analyzed_fns.append(error_with_analysis)
+    for error, analysis in zip(errors_to_analyze, analyses):
+        error_with_analysis = {
+            "text": error["text"][:200],  # Truncate for report
+            "calibrated_score": round(error["calibrated_score"], 3),
+            "true_label": error["true_label"],
+            "judge_score": round(analysis.score, 1),
+            "judge_reasoning": analysis.reasoning,
+            "judge_weaknesses": analysis.weaknesses,
+            "judge_suggestion": analysis.suggestion,
+        }
 
-        except Exception as e:
-            print(f"  Warning: Judge failed for error {error['index']}: {e}")
-            continue
+        if error["true_label"] == 0:
+            analyzed_fps.append(error_with_analysis)
+        else:
+            analyzed_fns.append(error_with_analysis)
 
     # Get cost summary
     cost_summary = auth_judge.get_cost_summary()
@@ -10,7 +10,12 @@ from typing import Optional
 import numpy as np
 from sklearn.metrics import roc_auc_score, f1_score, confusion_matrix
 
-from alignmenter.providers.embeddings import load_embedding_provider
+from alignmenter.providers.embeddings import (
+    embed_in_batches,
+    embed_matrix,
+    load_embedding_provider,
+    normalize_rows,
+)
 from alignmenter.utils import load_yaml
 
 
@@ -72,6 +77,15 @@ def optimize_weights(
     print(f"Computing component scores for {len(labeled_data)} examples...")
     examples_with_scores = []
 
+    # Exemplars are embedded once and examples in batches, rather than per example
+    exemplar_texts = persona.get("exemplars", [])
+    exemplar_matrix = normalize_rows(embed_matrix(embedder, exemplar_texts)) if exemplar_texts else None
+    text_vectors = (
+        normalize_rows(embed_in_batches(embedder, [example["text"] for example in labeled_data]))
+        if exemplar_texts
+        else None
+    )
+
     for i, example in enumerate(labeled_data):
         if (i + 1) % 10 == 0:
             print(f"  Progress: {i + 1}/{len(labeled_data)}")
@@ -81,6 +95,8 @@ def optimize_weights(
             persona,
             embedder,
             bounds=bounds,
+            exemplar_matrix=exemplar_matrix,
+            text_vector=text_vectors[i] if text_vectors is not None else None,
         )
         examples_with_scores.append({
             "label": example["label"],
@@ -215,11 +231,15 @@ def _compute_component_scores(
     persona: dict,
     embedder,
     bounds: Optional[dict] = None,
+    *,
+    exemplar_matrix: Optional[np.ndarray] = None,
+    text_vector: Optional[np.ndarray] = None,
 ) -> dict:
     """
     Compute style, traits, and lexicon scores for a single text.
 
-    This replicates the scoring logic from authenticity.py.
+    This replicates the scoring logic from authenticity.py. Pass the
+    normalized ``exemplar_matrix`` and ``text_vector`` to skip re-embedding.
     """
     # Tokenize
     import re
@@ -229,15 +249,12 @@ def _compute_component_scores(
     # Style similarity
     exemplar_texts = persona.get("exemplars", [])
     if exemplar_texts:
-        text_embedding = _normalize_vector(embedder.embed([text])[0])
-        exemplar_embeddings = [
-            _normalize_vector(emb) for emb in embedder.embed(exemplar_texts)
-        ]
-        similarities = [
-            _cosine_similarity(text_embedding, ex)
-            for ex in exemplar_embeddings
-        ]
-        raw_style = max(similarities) if similarities else 0.0
+        if text_vector is None:
+            text_vector = normalize_rows(embed_matrix(embedder, [text]))[0]
+        if exemplar_matrix is None:
+            exemplar_matrix = normalize_rows(embed_matrix(embedder, exemplar_texts))
+        similarities = np.clip(exemplar_matrix @ text_vector, -1.0, 1.0)
+        raw_style = float(similarities.max()) if similarities.size else 0.0
 
         # Apply normalization bounds if available
         if bounds:
@@ -290,23 +307,6 @@ def _compute_component_scores(
     }
 
 
-def _normalize_vector(vector: list[float]) -> list[float]:
-    """Normalize vector to unit length."""
-    norm = math.sqrt(sum(v * v for v in vector))
-    if not norm:
-        return [0.0] * len(vector)
-    return [v / norm for v in vector]
-
-
-def _cosine_similarity(vec_a: list[float], vec_b: list[float]) -> float:
-    """Compute cosine similarity between two vectors."""
-    length = min(len(vec_a), len(vec_b))
-    if not length:
-        return 0.0
-    dot = sum(vec_a[i] * vec_b[i] for i in range(length))
-    return max(-1.0, min(1.0, dot))
-
-
 def main():
     """CLI entry point for optimize_weights."""
     import argparse
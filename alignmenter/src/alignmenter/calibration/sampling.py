@@ -2,19 +2,27 @@
 
 from __future__ import annotations
 
-import random
+import hashlib
 from collections import defaultdict
 from typing import Any
 
+DEFAULT_SAMPLING_SEED = 0
+
 
 def select_scenarios_for_judge(
     sessions: list[Any],
     sample_rate: float = 0.2,
     strategy: str = "stratified",
     failure_threshold: float = 0.6,
+    seed: int = DEFAULT_SAMPLING_SEED,
 ) -> list[Any]:
     """Select representative scenarios for LLM judge analysis.
 
+    Sampling is deterministic: sessions are ranked by a stable hash of
+    ``(seed, session_id)`` and the lowest ranks are taken. Reruns therefore
+    pick the same sessions (and hit the judge cache), and a larger sample
+    rate picks a superset of a smaller one.
+
     Args:
         sessions: List of Session objects with attributes:
             - session_id: str
@@ -23,30 +31,31 @@ def select_scenarios_for_judge(
             - (optional) authenticity_score: float
         sample_rate: Fraction of sessions to sample (0.0-1.0)
         strategy: Selection strategy:
-            - "random": Random sample across all sessions
+            - "random": Hash-ranked sample across all sessions
             - "stratified": Equal representation per scenario tag
             - "errors": Only sessions with ambiguous scores (0.4-0.6)
             - "extremes": High confidence cases to verify calibration
             - "on_failure": Only sessions below failure_threshold (most cost-effective)
         failure_threshold: Score threshold for on_failure strategy
+        seed: Seed mixed into the session hash; change it to draw a different sample
 
     Returns:
-        List of selected Session objects
+        List of selected Session objects (sampled strategies in hash-rank order)
     """
     if not sessions:
         return []
 
     if strategy == "random":
         k = max(1, int(len(sessions) * sample_rate))
-        return random.sample(sessions, min(k, len(sessions)))
+        return _hash_sample(sessions, k, seed)
 
     elif strategy == "stratified":
         # Group by scenario tag
         by_scenario = defaultdict(list)
         for session in sessions:
-            # Get first tag or "untagged"
+            # Smallest tag or "untagged"; set order varies with PYTHONHASHSEED
             tags = getattr(session, "scenario_tags", set())
-            tag = next(iter(tags)) if tags else "untagged"
+            tag = min(tags) if tags else "untagged"
             by_scenario[tag].append(session)
 
         # Sample equally from each scenario
@@ -54,7 +63,7 @@ def select_scenarios_for_judge(
         per_scenario = max(1, int(sample_rate * len(sessions) / len(by_scenario)))
         for scenario_sessions in by_scenario.values():
             k = min(per_scenario, len(scenario_sessions))
-            samples.extend(random.sample(scenario_sessions, k))
+            samples.extend(_hash_sample(scenario_sessions, k, seed))
         return samples
 
     elif strategy == "errors":
@@ -67,7 +76,7 @@ def select_scenarios_for_judge(
         # If we have too few ambiguous, fall back to random sample
         if len(ambiguous) == 0:
             k = max(1, int(len(sessions) * sample_rate))
-            return random.sample(sessions, min(k, len(sessions)))
+            return _hash_sample(sessions, k, seed)
         return ambiguous
 
     elif strategy == "extremes":
@@ -80,7 +89,7 @@ def select_scenarios_for_judge(
         # If we have too few extremes, fall back to random sample
         if len(extremes) == 0:
             k = max(1, int(len(sessions) * sample_rate))
-            return random.sample(sessions, min(k, len(sessions)))
+            return _hash_sample(sessions, k, seed)
         return extremes
 
     elif strategy == "on_failure":
@@ -100,6 +109,22 @@ def select_scenarios_for_judge(
         )
 
 
+def session_rank(session: Any, seed: int = DEFAULT_SAMPLING_SEED) -> int:
+    """Return the stable sampling rank of *session* for *seed*."""
+
+    session_id = str(getattr(session, "session_id", ""))
+    digest = hashlib.blake2b(f"{seed}\0{session_id}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def _hash_sample(sessions: list[Any], k: int, seed: int) -> list[Any]:
+    ranked = sorted(
+        range(len(sessions)),
+        key=lambda position: (session_rank(sessions[position], seed), position),
+    )
+    return [sessions[position] for position in ranked[: min(k, len(sessions))]]
+
+
 def estimate_judge_cost(
     num_scenarios: int,
     sample_rate: float,
@@ -25,6 +25,7 @@ def validate_calibration(
     judge_sample_rate: float = 0.0,
     judge_strategy: str = "stratified",
     judge_budget: Optional[int] = None,
+    judge_pack_size: int = 1,
 ) -> dict:
     """
     Validate calibration using train/validation split with optional LLM judge analysis.
@@ -40,6 +41,7 @@ def validate_calibration(
         judge_sample_rate: Fraction of validation sessions to judge (0.0-1.0)
         judge_strategy: Sampling strategy (random, stratified, errors, extremes)
         judge_budget: Maximum number of judge API calls
+        judge_pack_size: Number of sessions sent to the judge in one request
 
     Returns:
         Diagnostics report with metrics and analysis
@@ -174,6 +176,8 @@ def validate_calibration(
             sample_rate=judge_sample_rate,
             strategy=judge_strategy,
             budget=judge_budget,
+            seed=seed,
+            pack_size=judge_pack_size,
         )
         if judge_analysis:
             print(f"  Judged {judge_analysis['sessions_judged']} sessions")
@@ -247,6 +251,8 @@ def _run_judge_analysis(
     sample_rate: float,
     strategy: str,
     budget: Optional[int],
+    seed: int = 42,
+    pack_size: int = 1,
 ) -> Optional[dict]:
     """Run LLM judge analysis on validation sessions."""
     from dataclasses import dataclass
@@ -287,6 +293,7 @@ def _run_judge_analysis(
         sessions=sessions,
         sample_rate=sample_rate,
         strategy=strategy,
+        seed=seed,
     )
 
     # Apply budget if specified
@@ -305,31 +312,29 @@ def _run_judge_analysis(
     )
 
     # Judge selected sessions
-    judge_results = []
+    judge_results = auth_judge.evaluate_sessions(
+        (
+            {
+                "session_id": session.session_id,
+                "turns": session.turns,
+                "calibrated_score": session.authenticity_score,
+            }
+            for session in selected
+        ),
+        pack_size=pack_size,
+    )
     agreements = 0
-    for session in selected:
-        try:
-            analysis = auth_judge.evaluate_session(
-                session_id=session.session_id,
-                turns=session.turns,
-                calibrated_score=session.authenticity_score,
-            )
-            judge_results.append(analysis)
-
-            # Check agreement (judge score 0-10, calibrated score 0-1)
-            # Convert judge score to 0-1 range
-            judge_normalized = analysis.score / 10.0
-            calibrated = session.authenticity_score
-
-            # Agreement if both above/below 0.5 threshold
-            judge_prediction = 1 if judge_normalized >= 0.5 else 0
-            calibrated_prediction = 1 if calibrated >= 0.5 else 0
-            if judge_prediction == calibrated_prediction:
-                agreements += 1
-
-        except Exception as e:
-            print(f"  Warning: Judge failed for {session.session_id}: {e}")
-            continue
+    for analysis in judge_results:
+        # Check agreement (judge score 0-10, calibrated score 0-1)
+        # Convert judge score to 0-1 range
+        judge_normalized = analysis.score / 10.0
+        calibrated = analysis.calibrated_score
+
+        # Agreement if both above/below 0.5 threshold
+        judge_prediction = 1 if judge_normalized >= 0.5 else 0
+        calibrated_prediction = 1 if calibrated >= 0.5 else 0
+        if judge_prediction == calibrated_prediction:
+            agreements += 1
 
     if not judge_results:
         return None
@@ -10,37 +10,36 @@ import sys
 from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
-import requests
 import typer
 import yaml
 
 from alignmenter.config import get_settings
-from alignmenter.providers import load_chat_provider
 from alignmenter.providers.base import parse_provider_model
-from alignmenter.providers.classifiers import load_safety_classifier
-from alignmenter.providers.judges import load_judge_provider
-from alignmenter.providers.openai import OpenAICustomGPTProvider
 from alignmenter.run_config import load_run_options
-from alignmenter.runner import RunConfig, Runner
 from alignmenter.scripts import bootstrap_dataset as bootstrap_dataset_script
-from alignmenter.scripts import calibrate_persona as calibrate_persona_script
 from alignmenter.scripts.sanitize_dataset import sanitize_dataset_file
-from alignmenter.scorers.authenticity import AuthenticityScorer
-from alignmenter.scorers.safety import SafetyScorer
-from alignmenter.scorers.stability import StabilityScorer
+
+if TYPE_CHECKING:  # pragma: no cover
+    from alignmenter.runner import RunConfig
+
+# Scorers, the runner and provider SDKs (numpy, torch, openai, anthropic, ...)
+# are imported inside the commands that need them to keep CLI startup fast.
+
 app = typer.Typer(help="Alignmenter — audit your model's alignment signals.")
 
 persona_app = typer.Typer(help="Persona helper commands.")
 dataset_app = typer.Typer(help="Dataset helper commands.")
 import_app = typer.Typer(help="Import helpers.")
 calibrate_app = typer.Typer(help="Calibration toolkit for optimizing persona parameters.")
+cache_app = typer.Typer(help="Inspect and manage the local cache.")
 
 app.add_typer(persona_app, name="persona")
 app.add_typer(dataset_app, name="dataset")
 app.add_typer(import_app, name="import")
 app.add_typer(calibrate_app, name="calibrate")
+app.add_typer(cache_app, name="cache")
 
 
 @import_app.command("gpt")
@@ -514,15 +513,39 @@ def run(
     embedding: Optional[str] = typer.Option(None, help="Embedding provider identifier (e.g. 'sentence-transformer:all-MiniLM-L6-v2')."),
     judge: Optional[str] = typer.Option(None, help="Safety judge provider identifier (e.g. 'openai:gpt-4o-mini')."),
     judge_budget: Optional[int] = typer.Option(None, help="Maximum LLM judge calls per run."),
+    bootstrap_iterations: Optional[int] = typer.Option(
+        None,
+        "--bootstrap-iterations",
+        help="Bootstrap resamples for authenticity confidence intervals (default 200).",
+    ),
+    concurrency: Optional[int] = typer.Option(
+        None,
+        "--concurrency",
+        help="Sessions generated in parallel per provider with --generate-transcripts (default 4).",
+    ),
     generate_transcripts: bool = typer.Option(
         False,
         "--generate-transcripts",
         help="Call providers to regenerate assistant turns before scoring (default reuses recorded transcripts).",
     ),
+    resume: Optional[str] = typer.Option(
+        None,
+        "--resume",
+        help="Resume an interrupted --generate-transcripts run in this run directory.",
+    ),
 ) -> None:
     """Execute an evaluation run."""
 
     settings = get_settings()
+    resume_dir = None
+    if resume:
+        from alignmenter.runner import JOURNAL_DIR
+
+        resume_dir = _resolve_path(resume)
+        if not (resume_dir / JOURNAL_DIR).is_dir():
+            raise typer.BadParameter(f"No generation journal found in {resume_dir}.", param_hint="--resume")
+        # Only generation runs are journaled, so resuming always regenerates.
+        generate_transcripts = True
     config_options: dict[str, object] = {}
     if config:
         config_path = _resolve_path(config)
@@ -539,6 +562,8 @@ def run(
         judge=judge,
         judge_budget=judge_budget,
         embedding=embedding,
+        bootstrap_iterations=bootstrap_iterations,
+        concurrency=concurrency,
     )
 
     assistant_turns = _lazy_assistant_turn_counter(inputs.dataset_path)
@@ -554,6 +579,8 @@ def run(
         inputs.model_identifier,
         inputs.compare_identifier,
         generate_transcripts,
+        replay_mode=inputs.replay_mode,
+        replay_dir=inputs.replay_dir,
     )
 
     if generate_transcripts and not regenerate:
@@ -563,6 +590,9 @@ def run(
         )
         raise typer.Exit(code=1)
 
+    from alignmenter.providers.classifiers import load_safety_classifier
+    from alignmenter.runner import Runner
+
     safety_classifier = load_safety_classifier(inputs.classifier_identifier)
     judge_provider = _initialise_judge_provider(inputs.judge_identifier)
     scorers, compare_scorers = _build_scorers_for_run(
@@ -570,6 +600,16 @@ def run(
         safety_classifier=safety_classifier,
         judge_provider=judge_provider,
     )
+    pairwise_judge = None
+    if inputs.judge_pairwise and inputs.compare_identifier and judge_provider is not None:
+        from alignmenter.judges.authenticity_judge import AuthenticityJudge
+
+        cost_estimate = inputs.judge_cost.get("cost_per_call_estimate")
+        pairwise_judge = AuthenticityJudge(
+            persona_path=inputs.persona_path,
+            judge_provider=judge_provider,
+            **({"cost_per_call": float(cost_estimate)} if cost_estimate is not None else {}),
+        )
 
     primary_progress, compare_progress = _build_progress_managers(
         inputs,
@@ -589,6 +629,14 @@ def run(
             progress_callback=primary_cb,
             compare_progress_callback=compare_cb,
             thresholds=inputs.thresholds,
+            resume_dir=resume_dir,
+            judge_provider=judge_provider,
+            pairwise_judge=pairwise_judge,
+            pairwise_options={
+                "max_in_flight": inputs.judge_concurrency,
+                "budget": inputs.judge_budget,
+                "budget_usd": inputs.judge_cost.get("budget_usd"),
+            },
         )
 
         try:
@@ -629,7 +677,10 @@ def demo(
         embedding=None,
         judge=None,
         judge_budget=None,
+        bootstrap_iterations=None,
+        concurrency=None,
         generate_transcripts=True,
+        resume=None,
     )
 
 
@@ -1138,6 +1189,7 @@ def calibrate_validate(
     judge_sample: float = typer.Option(0.0, "--judge-sample", help="Fraction of sessions to judge (0.0-1.0)"),
     judge_strategy: str = typer.Option("stratified", "--judge-strategy", help="Sampling strategy: random, stratified, errors, extremes"),
     judge_budget: Optional[int] = typer.Option(None, "--judge-budget", help="Maximum judge API calls"),
+    pack_size: int = typer.Option(1, "--pack-size", min=1, help="Sessions sent to the judge in one request"),
 ) -> None:
     """Validate calibration and generate diagnostics with optional LLM judge analysis."""
     from alignmenter.calibration.validate import validate_calibration
@@ -1154,6 +1206,7 @@ def calibrate_validate(
             judge_sample_rate=judge_sample,
             judge_strategy=judge_strategy,
             judge_budget=judge_budget,
+            judge_pack_size=pack_size,
         )
         # Results already printed by validate_calibration
     except Exception as e:
@@ -1169,6 +1222,7 @@ def calibrate_diagnose_errors(
     embedding: Optional[str] = typer.Option(None, "--embedding", help="Embedding provider"),
     judge: Optional[str] = typer.Option(None, "--judge", help="Judge provider (e.g., 'anthropic:claude-3-5-sonnet-20241022')"),
     judge_budget: Optional[int] = typer.Option(None, "--judge-budget", help="Maximum judge API calls"),
+    pack_size: int = typer.Option(1, "--pack-size", min=1, help="Sessions sent to the judge in one request"),
 ) -> None:
     """Diagnose calibration errors using LLM judge analysis.
 
@@ -1190,6 +1244,7 @@ def calibrate_diagnose_errors(
             embedding_provider=embedding,
             judge_provider=judge,
             judge_budget=judge_budget,
+            judge_pack_size=pack_size,
         )
         typer.secho(f"✓ Error analysis written to {output}", fg=typer.colors.GREEN)
         typer.echo(f"Found {len(report.get('false_positives', []))} false positives, {len(report.get('false_negatives', []))} false negatives")
@@ -1207,6 +1262,7 @@ def analyze_scenarios(
     judge: Optional[str] = typer.Option(None, "--judge", help="Judge provider (e.g., 'anthropic:claude-3-5-sonnet-20241022')"),
     per_scenario: int = typer.Option(3, "--per-scenario", help="Number of sessions to judge per scenario tag"),
     judge_budget: Optional[int] = typer.Option(None, "--judge-budget", help="Maximum judge API calls"),
+    pack_size: int = typer.Option(1, "--pack-size", min=1, help="Sessions sent to the judge in one request"),
 ) -> None:
     """Analyze performance across different scenario types using LLM judge.
 
@@ -1229,6 +1285,7 @@ def analyze_scenarios(
             judge_provider=judge,
             samples_per_scenario=per_scenario,
             judge_budget=judge_budget,
+            judge_pack_size=pack_size,
         )
         typer.secho(f"✓ Scenario analysis written to {output}", fg=typer.colors.GREEN)
         scenarios = report.get("scenario_performance", {})
@@ -1250,6 +1307,8 @@ def calibrate_persona_command(
 ) -> None:
     """Fit persona-specific trait weights from labeled data."""
 
+    from alignmenter.scripts import calibrate_persona as calibrate_persona_script
+
     try:
         calibrate_persona_script.calibrate(
             persona_path=str(persona_path),
@@ -1267,6 +1326,122 @@ def calibrate_persona_command(
         raise typer.Exit(1) from exc
 
 
+@cache_app.command("stats")
+def cache_stats_command(
+    cache_dir: Optional[Path] = typer.Option(None, "--cache-dir", help="Cache directory (defaults to ALIGNMENTER_CACHE_DIR)."),
+) -> None:
+    """Show how much is stored in the embedding and judge caches."""
+
+    from alignmenter.providers.embedding_cache import cache_stats
+    from alignmenter.providers.judge_cache import judge_cache_stats
+
+    root = _resolve_cache_dir(cache_dir)
+    stats = cache_stats(root)
+    typer.echo(f"Cache directory: {_humanize_path(root)}")
+    if not stats["namespaces"]:
+        typer.echo("Embedding cache is empty.")
+    else:
+        for entry in stats["namespaces"].values():
+            typer.echo(
+                f"  {entry['provider']}:{entry['model']} — {entry['entries']} vectors, "
+                f"{entry['shards']} shards, {_format_bytes(entry['bytes'])}"
+            )
+        typer.echo(f"Total: {stats['entries']} vectors, {_format_bytes(stats['bytes'])}")
+
+    judge_stats = judge_cache_stats(root)
+    if not judge_stats["entries"]:
+        typer.echo("Judge cache is empty.")
+        return
+    typer.echo("Judge responses:")
+    for model, count in judge_stats["models"].items():
+        typer.echo(f"  {model} — {count} responses")
+    typer.echo(f"Total: {judge_stats['entries']} responses, {_format_bytes(judge_stats['bytes'])}")
+
+
+@cache_app.command("prune")
+def cache_prune_command(
+    max_size: Optional[str] = typer.Option(None, "--max-size", help="Shrink the cache to this size (e.g. 500MB, 2GB)."),
+    older_than: Optional[float] = typer.Option(None, "--older-than", help="Remove entries older than this many days."),
+    cache_dir: Optional[Path] = typer.Option(None, "--cache-dir", help="Cache directory (defaults to ALIGNMENTER_CACHE_DIR)."),
+) -> None:
+    """Evict the oldest cached embeddings (and, with --older-than, judge responses)."""
+
+    from alignmenter.providers.embedding_cache import prune_cache
+    from alignmenter.providers.judge_cache import prune_judge_cache
+
+    if max_size is None and older_than is None:
+        raise typer.BadParameter("Provide --max-size and/or --older-than.")
+    try:
+        max_bytes = _parse_size(max_size) if max_size is not None else None
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
+    root = _resolve_cache_dir(cache_dir)
+    older_than_seconds = older_than * 86400 if older_than is not None else None
+    result = prune_cache(root, max_bytes=max_bytes, older_than_seconds=older_than_seconds)
+    typer.secho(
+        f"✓ Removed {result['removed_shards']} shards ({_format_bytes(result['freed_bytes'])})",
+        fg=typer.colors.GREEN,
+    )
+    if older_than_seconds is not None:
+        judge_result = prune_judge_cache(root, older_than_seconds=older_than_seconds)
+        typer.secho(f"✓ Removed {judge_result['removed_entries']} judge responses", fg=typer.colors.GREEN)
+
+
+@cache_app.command("clear")
+def cache_clear_command(
+    yes: bool = typer.Option(False, "--yes", "-y", help="Skip the confirmation prompt."),
+    judge: bool = typer.Option(False, "--judge", help="Clear cached judge responses instead of embeddings."),
+    cache_dir: Optional[Path] = typer.Option(None, "--cache-dir", help="Cache directory (defaults to ALIGNMENTER_CACHE_DIR)."),
+) -> None:
+    """Delete every cached embedding (or, with --judge, every judge response)."""
+
+    from alignmenter.providers.embedding_cache import clear_cache
+    from alignmenter.providers.judge_cache import clear_judge_cache
+
+    root = _resolve_cache_dir(cache_dir)
+    kind = "judge responses" if judge else "embeddings"
+    if not yes and not typer.confirm(f"Delete cached {kind} under {_humanize_path(root)}?", default=False):
+        raise typer.Exit(0)
+    if judge:
+        judge_result = clear_judge_cache(root)
+        typer.secho(
+            f"✓ Cleared {judge_result['removed_entries']} judge responses ({_format_bytes(judge_result['freed_bytes'])})",
+            fg=typer.colors.GREEN,
+        )
+        return
+    result = clear_cache(root)
+    typer.secho(
+        f"✓ Cleared {result['removed_shards']} shards ({_format_bytes(result['freed_bytes'])})",
+        fg=typer.colors.GREEN,
+    )
+
+
+def _resolve_cache_dir(cache_dir: Optional[Path]) -> Path:
+    if cache_dir is not None:
+        return cache_dir.expanduser()
+    return Path(get_settings().cache_dir).expanduser()
+
+
+def _parse_size(value: str) -> int:
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([kmgt]?i?b?)?\s*", value, flags=re.IGNORECASE)
+    if not match:
+        raise ValueError(f"Invalid size: {value!r} (expected e.g. 500MB or 2GB)")
+    number = float(match.group(1))
+    unit = (match.group(2) or "").lower().rstrip("b").rstrip("i")
+    multiplier = {"": 1, "k": 1024, "m": 1024**2, "g": 1024**3, "t": 1024**4}[unit]
+    return int(number * multiplier)
+
+
+def _format_bytes(value: int) -> str:
+    size = float(value)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"  # pragma: no cover
+
+
 def _load_env(path: Path) -> dict[str, str]:
     if not path.exists():
         return {}
@@ -1539,6 +1714,20 @@ class RunInputs:
     judge_cost: dict[str, float | int]
     classifier_identifier: str
     thresholds: dict[str, dict[str, float]]
+    embedding_batch_size: int = 64
+    bootstrap_iterations: int = 200
+    ci_method: str = "percentile"
+    classifier_batch_size: int = 32
+    judge_strategy: str = "sequential"
+    safety_cascade: Optional[dict[str, Any]] = None
+    judge_concurrency: int = 8
+    judge_pack_size: int = 1
+    judge_pairwise: bool = False
+    replay_mode: Optional[str] = None
+    replay_dir: Optional[Path] = None
+    stability_mode: str = "batch"
+    stability_window: int = 5
+    stability_drift_threshold: float = 0.4
 
 
 def _prepare_run_inputs(
@@ -1554,7 +1743,21 @@ def _prepare_run_inputs(
     judge: Optional[str],
     judge_budget: Optional[int],
     embedding: Optional[str],
+    bootstrap_iterations: Optional[int] = None,
+    concurrency: Optional[int] = None,
 ) -> tuple[RunInputs, RunConfig]:
+    from alignmenter.judges.executor import DEFAULT_JUDGE_CONCURRENCY
+    from alignmenter.providers.classifiers import DEFAULT_CLASSIFIER_BATCH_SIZE
+    from alignmenter.providers.replay import REPLAY_MODES
+    from alignmenter.runner import DEFAULT_CONCURRENCY, ContextPolicy, RunConfig
+    from alignmenter.scorers.authenticity import CI_METHODS, DEFAULT_BOOTSTRAP_ITERATIONS
+    from alignmenter.scorers.safety import DEFAULT_JUDGE_STRATEGY, JUDGE_STRATEGIES, SafetyCascade
+    from alignmenter.scorers.stability import (
+        DEFAULT_DRIFT_THRESHOLD,
+        DEFAULT_DRIFT_WINDOW,
+        STABILITY_MODES,
+    )
+
     model_identifier = model or config_options.get("model") or settings.default_model
     try:
         parse_provider_model(model_identifier)
@@ -1589,6 +1792,62 @@ def _prepare_run_inputs(
         or settings.safety_classifier
         or "auto"
     )
+    embedding_batch_size = int(
+        config_options.get("embedding_batch_size") or settings.embedding_batch_size
+    )
+    resolved_bootstrap_iterations = int(
+        bootstrap_iterations or config_options.get("bootstrap_iterations") or DEFAULT_BOOTSTRAP_ITERATIONS
+    )
+    if resolved_bootstrap_iterations < 1:
+        raise typer.BadParameter("--bootstrap-iterations must be at least 1.")
+    resolved_concurrency = int(concurrency or config_options.get("concurrency") or DEFAULT_CONCURRENCY)
+    if resolved_concurrency < 1:
+        raise typer.BadParameter("--concurrency must be at least 1.")
+    try:
+        context_policy = ContextPolicy.from_config(config_options.get("context_policy"))
+    except (TypeError, ValueError) as exc:
+        raise typer.BadParameter(f"Invalid providers.context: {exc}") from exc
+    replay_mode = config_options.get("replay_mode")
+    if replay_mode is not None and replay_mode not in REPLAY_MODES:
+        raise typer.BadParameter(
+            f"Unknown replay mode '{replay_mode}' (expected one of: {', '.join(REPLAY_MODES)})."
+        )
+    ci_method = str(config_options.get("ci_method") or "percentile")
+    if ci_method not in CI_METHODS:
+        raise typer.BadParameter(
+            f"Unknown ci_method '{ci_method}' (expected one of: {', '.join(CI_METHODS)})."
+        )
+    classifier_batch_size = int(config_options.get("classifier_batch_size") or DEFAULT_CLASSIFIER_BATCH_SIZE)
+    if classifier_batch_size < 1:
+        raise typer.BadParameter("scorers.safety.classifier_batch_size must be at least 1.")
+    judge_strategy = str(config_options.get("judge_strategy") or DEFAULT_JUDGE_STRATEGY)
+    if judge_strategy not in JUDGE_STRATEGIES:
+        raise typer.BadParameter(
+            f"Unknown judge strategy '{judge_strategy}' (expected one of: {', '.join(JUDGE_STRATEGIES)})."
+        )
+    judge_concurrency = int(config_options.get("judge_max_in_flight") or DEFAULT_JUDGE_CONCURRENCY)
+    if judge_concurrency < 1:
+        raise typer.BadParameter("judge.max_in_flight must be at least 1.")
+    judge_pack_size = config_options.get("judge_pack_size")
+    judge_pack_size = 1 if judge_pack_size is None else int(judge_pack_size)
+    if judge_pack_size < 1:
+        raise typer.BadParameter("judge.pack_size must be at least 1.")
+    safety_cascade = config_options.get("safety_cascade")
+    try:
+        SafetyCascade.from_config(safety_cascade)
+    except (TypeError, ValueError) as exc:
+        raise typer.BadParameter(f"Invalid scorers.safety.cascade: {exc}") from exc
+    stability_mode = str(config_options.get("stability_mode") or "batch")
+    if stability_mode not in STABILITY_MODES:
+        raise typer.BadParameter(
+            f"Unknown stability mode '{stability_mode}' (expected one of: {', '.join(STABILITY_MODES)})."
+        )
+    stability_window = int(config_options.get("stability_window") or DEFAULT_DRIFT_WINDOW)
+    if stability_window < 1:
+        raise typer.BadParameter("scorers.stability.window must be at least 1.")
+    stability_drift_threshold = _safe_float(config_options.get("stability_drift_threshold"))
+    if stability_drift_threshold is None:
+        stability_drift_threshold = DEFAULT_DRIFT_THRESHOLD
 
     raw_thresholds = config_options.get("thresholds") or {}
     thresholds: dict[str, dict[str, float]] = {}
@@ -1616,6 +1875,8 @@ def _prepare_run_inputs(
         report_out_dir=out_dir,
         run_id=run_id,
         include_raw=bool(include_raw) if include_raw is not None else True,
+        concurrency=resolved_concurrency,
+        context_policy=context_policy,
     )
 
     inputs = RunInputs(
@@ -1633,6 +1894,20 @@ def _prepare_run_inputs(
         judge_cost=judge_cost,
         classifier_identifier=classifier_identifier,
         thresholds=thresholds,
+        embedding_batch_size=embedding_batch_size,
+        bootstrap_iterations=resolved_bootstrap_iterations,
+        ci_method=ci_method,
+        classifier_batch_size=classifier_batch_size,
+        judge_strategy=judge_strategy,
+        safety_cascade=safety_cascade,
+        judge_concurrency=judge_concurrency,
+        judge_pack_size=judge_pack_size,
+        judge_pairwise=bool(config_options.get("judge_pairwise", False)),
+        replay_mode=replay_mode,
+        replay_dir=config_options.get("replay_dir"),
+        stability_mode=stability_mode,
+        stability_window=stability_window,
+        stability_drift_threshold=stability_drift_threshold,
     )
 
     return inputs, run_config
@@ -1685,6 +1960,9 @@ def _initialise_providers(
     model_identifier: str,
     compare_identifier: Optional[str],
     regenerate: bool,
+    *,
+    replay_mode: Optional[str] = None,
+    replay_dir: Optional[Path] = None,
 ) -> tuple[bool, Optional[Any], Optional[Any]]:
     provider = None
     compare_provider = None
@@ -1692,8 +1970,31 @@ def _initialise_providers(
     if not regenerate:
         return False, provider, compare_provider
 
+    from alignmenter.providers import load_chat_provider
+
+    replay_cache = None
+    if replay_mode:
+        from alignmenter.providers.replay import open_replay_cache
+
+        replay_cache = open_replay_cache(replay_dir or Path(get_settings().cache_dir))
+
+    def _load(identifier: str) -> Optional[Any]:
+        if replay_cache is None:
+            return load_chat_provider(identifier)
+        from alignmenter.providers.replay import ReplayChatProvider
+
+        try:
+            base = load_chat_provider(identifier)
+        except Exception:  # noqa: BLE001 - replay needs no credentials
+            if replay_mode != "replay":
+                raise
+            base = None
+        if base is None and replay_mode != "replay":
+            return None
+        return ReplayChatProvider.from_model_identifier(identifier, base, replay_cache, mode=replay_mode)
+
     try:
-        provider = load_chat_provider(model_identifier)
+        provider = _load(model_identifier)
     except Exception as exc:  # noqa: BLE001 - surface friendly guidance
         typer.secho(
             f"Unable to initialise provider '{model_identifier}': {exc}",
@@ -1707,7 +2008,7 @@ def _initialise_providers(
 
     if compare_identifier:
         try:
-            compare_provider = load_chat_provider(str(compare_identifier))
+            compare_provider = _load(str(compare_identifier))
         except Exception as exc:  # noqa: BLE001 - surface friendly guidance
             typer.secho(
                 f"Unable to initialise compare provider '{compare_identifier}': {exc}",
@@ -1725,6 +2026,8 @@ def _initialise_providers(
 def _initialise_judge_provider(judge_identifier: Optional[str]):
     if not judge_identifier:
         return None
+    from alignmenter.providers.judges import load_judge_provider
+
     try:
         return load_judge_provider(judge_identifier)
     except RuntimeError as exc:
@@ -1742,20 +2045,41 @@ def _build_scorers_for_run(
     safety_classifier: Any,
     judge_provider: Optional[Any],
 ) -> tuple[list[Any], Optional[list[Any]]]:
+    from alignmenter.scorers.authenticity import AuthenticityScorer
+    from alignmenter.scorers.safety import SafetyCascade, SafetyScorer
+    from alignmenter.scorers.stability import StabilityScorer
+
     scorer_kwargs = {"embedding": inputs.embedding_identifier}
     judge_callable = judge_provider.evaluate if judge_provider else None
 
     def _bundle() -> list[Any]:
         return [
-            AuthenticityScorer(persona_path=inputs.persona_path, **scorer_kwargs),
+            AuthenticityScorer(
+                persona_path=inputs.persona_path,
+                batch_size=inputs.embedding_batch_size,
+                bootstrap_iterations=inputs.bootstrap_iterations,
+                ci_method=inputs.ci_method,
+                **scorer_kwargs,
+            ),
             SafetyScorer(
                 keyword_path=inputs.keywords_path,
                 judge=judge_callable,
                 judge_budget=inputs.judge_budget,
                 cost_config=inputs.judge_cost,
                 classifier=safety_classifier,
+                classifier_batch_size=inputs.classifier_batch_size,
+                judge_strategy=inputs.judge_strategy,
+                cascade=SafetyCascade.from_config(inputs.safety_cascade),
+                judge_concurrency=inputs.judge_concurrency,
+                judge_pack_size=inputs.judge_pack_size,
+            ),
+            StabilityScorer(
+                batch_size=inputs.embedding_batch_size,
+                mode=inputs.stability_mode,
+                window=inputs.stability_window,
+                drift_threshold=inputs.stability_drift_threshold,
+                **scorer_kwargs,
             ),
-            StabilityScorer(**scorer_kwargs),
         ]
 
     scorers = _bundle()
@@ -1856,6 +2180,8 @@ def _fetch_custom_gpt_metadata(
 ) -> tuple[dict[str, Any], Optional[str]]:
     if not api_key:
         return {}, "OPENAI_API_KEY not configured; generating persona stub."
+    from alignmenter.providers.openai import OpenAICustomGPTProvider
+
     try:
         provider = OpenAICustomGPTProvider(gpt_id)
     except RuntimeError as exc:
@@ -1885,6 +2211,8 @@ def _fetch_custom_gpt_metadata_http(
         "Authorization": f"Bearer {api_key}",
         "OpenAI-Beta": "gpts=2024-11-14",
     }
+    import requests
+
     try:
         response = requests.get(url, headers=headers, timeout=10)
     except requests.RequestException as exc:  # pragma: no cover - network failure
@@ -2048,6 +2376,8 @@ def _describe_gpt_via_conversation(
     if not api_key:
         return {}, None
 
+    from alignmenter.providers.openai import OpenAICustomGPTProvider
+
     try:
         provider = OpenAICustomGPTProvider(gpt_id)
     except RuntimeError as exc:
@@ -2133,6 +2463,13 @@ def _print_run_summary(
             typer.echo(f"Loading dataset: {turns} turns across {sessions} sessions")
         if thresholds is None and isinstance(run_meta.get("thresholds"), dict):
             thresholds = run_meta.get("thresholds")
+        judge_cache = run_meta.get("judge_cache")
+        all_calls = judge_cache.get("all_calls") if isinstance(judge_cache, dict) else None
+        if isinstance(all_calls, dict) and isinstance(all_calls.get("hit_rate"), (int, float)):
+            typer.echo(
+                f"Judge cache: {all_calls.get('hits', 0)} hits, {all_calls.get('misses', 0)} misses "
+                f"({all_calls['hit_rate']:.0%} hit rate)"
+            )
 
     results = _safe_read_json(run_dir / "results.json")
     if not results:
@@ -52,6 +52,10 @@ class Settings(BaseSettings):
         default=str(DATA_DIR / "configs" / "safety_keywords.yaml"),
         validation_alias=AliasChoices("ALIGNMENTER_DEFAULT_KEYWORDS"),
     )
+    embedding_batch_size: int = Field(
+        default=64,
+        validation_alias=AliasChoices("ALIGNMENTER_EMBEDDING_BATCH_SIZE"),
+    )
     judge_provider: Optional[str] = Field(
         default=None,
         validation_alias=AliasChoices("ALIGNMENTER_JUDGE_PROVIDER"),
@@ -92,6 +96,26 @@ class Settings(BaseSettings):
         default="auto",
         validation_alias=AliasChoices("ALIGNMENTER_SAFETY_CLASSIFIER"),
     )
+    cache_dir: str = Field(
+        default=str(Path("~/.cache/alignmenter").expanduser()),
+        validation_alias=AliasChoices("ALIGNMENTER_CACHE_DIR"),
+    )
+    embedding_cache: bool = Field(
+        default=True,
+        validation_alias=AliasChoices("ALIGNMENTER_EMBEDDING_CACHE"),
+    )
+    judge_cache: bool = Field(
+        default=True,
+        validation_alias=AliasChoices("ALIGNMENTER_JUDGE_CACHE"),
+    )
+    judge_cache_ttl_hours: Optional[float] = Field(
+        default=None,
+        validation_alias=AliasChoices("ALIGNMENTER_JUDGE_CACHE_TTL_HOURS"),
+    )
+    cache_max_mb: Optional[float] = Field(
+        default=2048.0,
+        validation_alias=AliasChoices("ALIGNMENTER_CACHE_MAX_MB"),
+    )
 
 
 @lru_cache(maxsize=1)
@@ -6,12 +6,21 @@ from .authenticity_judge import (
     AuthenticityJudge,
     JudgeAnalysis,
     JudgeCostSummary,
+    PairwiseAnalysis,
     extract_json_from_text,
+    summarize_pairwise,
 )
+from .executor import DEFAULT_JUDGE_CONCURRENCY, JudgeCall, JudgeExecutor, JudgeRun
 
 __all__ = [
     "AuthenticityJudge",
     "JudgeAnalysis",
     "JudgeCostSummary",
+    "PairwiseAnalysis",
     "extract_json_from_text",
+    "summarize_pairwise",
+    "DEFAULT_JUDGE_CONCURRENCY",
+    "JudgeCall",
+    "JudgeExecutor",
+    "JudgeRun",
 ]
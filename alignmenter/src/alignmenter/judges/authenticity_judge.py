@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Optional
 
 from alignmenter.providers.base import JudgeProvider
 from alignmenter.utils import load_yaml
-from .prompts import format_authenticity_prompt
+from .executor import DEFAULT_JUDGE_CONCURRENCY, JudgeExecutor
+from .packing import format_authenticity_pack, parse_packed_response
+from .prompts import render_pairwise_suffix, render_persona_prefix, render_session_suffix
 
 LOGGER = logging.getLogger(__name__)
 
@@ -87,6 +91,19 @@ class JudgeAnalysis:
     cost: Optional[float] = None  # API cost for this call
 
 
+@dataclass
+class PairwiseAnalysis:
+    """LLM judge comparison of the primary and compare versions of a session."""
+
+    session_id: str
+    primary_score: Optional[float]  # 0-10 scale, None if the judge call failed
+    compare_score: Optional[float]  # 0-10 scale, None if the judge call failed
+    preference: Optional[str]  # "primary", "compare", "tie", or None if the judge call failed
+    reasoning: str
+    primary_first: bool  # Whether the primary transcript was shown as assistant A
+    cost: Optional[float] = None  # API cost for this call
+
+
 @dataclass
 class JudgeCostSummary:
     """Summary of LLM judge API costs."""
@@ -148,9 +165,22 @@ class AuthenticityJudge:
         # Extract exemplars (can be "examples" or "exemplars")
         self.exemplars = persona.get("exemplars", persona.get("examples", []))
 
+        # The persona block is identical for every session, so render it once
+        # and send it as a cacheable prefix.
+        self.persona_prefix = render_persona_prefix(
+            persona_id=self.persona_id,
+            persona_description=self.persona_description,
+            persona_tone=self.persona_tone,
+            persona_formality=self.persona_formality,
+            preferred_words=self.preferred_words,
+            avoided_words=self.avoided_words,
+            exemplars=self.exemplars,
+        )
+
         # Track costs
         self.total_cost = 0.0
         self.calls_made = 0
+        self._cost_lock = threading.Lock()
 
     def evaluate_session(
         self,
@@ -170,15 +200,8 @@ class AuthenticityJudge:
         Returns:
             JudgeAnalysis with score, reasoning, and suggestions
         """
-        # Format the prompt
-        prompt = format_authenticity_prompt(
-            persona_id=self.persona_id,
-            persona_description=self.persona_description,
-            persona_tone=self.persona_tone,
-            persona_formality=self.persona_formality,
-            preferred_words=self.preferred_words,
-            avoided_words=self.avoided_words,
-            exemplars=self.exemplars,
+        # Format the per-session part of the prompt
+        suffix = render_session_suffix(
             scenario_tag=scenario_tag or "untagged",
             session_id=session_id,
             conversation_turns=turns,
@@ -186,12 +209,13 @@ class AuthenticityJudge:
 
         # Call the judge
         try:
-            response = self.judge_provider.evaluate(prompt)
-            self.calls_made += 1
+            response = self._request(suffix)
 
-            # Extract cost from usage if available
-            call_cost = self._calculate_cost(response.get("usage"))
-            self.total_cost += call_cost
+            # Extract cost from usage if available; cached responses are free
+            call_cost = 0.0 if response.get("cached") else self._calculate_cost(response.get("usage"))
+            with self._cost_lock:
+                self.calls_made += 1
+                self.total_cost += call_cost
 
             # Parse the response
             analysis = self._parse_response(
@@ -218,6 +242,208 @@ class AuthenticityJudge:
                 cost=0.0,
             )
 
+    def evaluate_sessions(
+        self,
+        sessions: Iterable[dict[str, Any]],
+        *,
+        max_in_flight: int = DEFAULT_JUDGE_CONCURRENCY,
+        budget: Optional[int] = None,
+        budget_usd: Optional[float] = None,
+        pack_size: int = 1,
+    ) -> list[JudgeAnalysis]:
+        """Evaluate several sessions concurrently.
+
+        Args:
+            sessions: Keyword arguments for :meth:`evaluate_session`, one dict per session
+            max_in_flight: Maximum number of judge calls running at once
+            budget: Optional cap on the number of sessions judged
+            budget_usd: Optional spend limit; admission stops once reached
+            pack_size: Number of sessions sent to the judge in one request
+
+        Returns:
+            Analyses for the sessions that were judged, in input order
+        """
+        requests = list(sessions)
+        pack_size = max(1, pack_size)
+        positions = range(len(requests) if budget is None else min(budget, len(requests)))
+        packs = [tuple(positions[start : start + pack_size]) for start in range(0, len(positions), pack_size)]
+        executor = JudgeExecutor(
+            max_in_flight=max_in_flight,
+            cost_limit=budget_usd,
+            cost_estimate=self.cost_per_call * pack_size,
+        )
+        run = executor.run(
+            lambda pack: self._evaluate_pack([requests[position] for position in pack]),
+            packs,
+            cost_of=lambda results: sum(analysis.cost or 0.0 for analysis in results),
+        )
+        if run.stopped:
+            LOGGER.info("Judge %s limit reached after %d requests", run.stopped, len(run.completed))
+        analyses = {
+            position: analysis
+            for call in run.completed
+            for position, analysis in zip(call.item, call.result)
+        }
+        return [analyses[position] for position in sorted(analyses)]
+
+    def compare_session(
+        self,
+        session_id: str,
+        primary_turns: list[dict],
+        compare_turns: list[dict],
+        scenario_tag: Optional[str] = None,
+        seed: int = 0,
+    ) -> PairwiseAnalysis:
+        """Judge the primary and compare versions of a session in one call.
+
+        Which transcript is shown first is derived from a hash of *seed* and
+        *session_id*, so across sessions each side leads about half the time
+        and the judge's position bias cancels out in aggregate.
+
+        Args:
+            session_id: Session identifier
+            primary_turns: Conversation turns from the primary model
+            compare_turns: Conversation turns from the compare model
+            scenario_tag: Optional scenario tag for context
+            seed: Seed for the A/B order
+
+        Returns:
+            PairwiseAnalysis with per-side scores and a preference
+        """
+        primary_first = pairwise_primary_first(session_id, seed)
+        turns_a, turns_b = (primary_turns, compare_turns) if primary_first else (compare_turns, primary_turns)
+        suffix = render_pairwise_suffix(
+            scenario_tag=scenario_tag or "untagged",
+            session_id=session_id,
+            turns_a=turns_a,
+            turns_b=turns_b,
+        )
+
+        try:
+            response = self._request(suffix)
+        except Exception as e:
+            LOGGER.error(f"Pairwise judge evaluation failed for session {session_id}: {e}")
+            return _failed_pairwise(session_id, primary_first, f"Judge evaluation failed: {str(e)}", 0.0)
+
+        call_cost = 0.0 if response.get("cached") else self._calculate_cost(response.get("usage"))
+        with self._cost_lock:
+            self.calls_made += 1
+            self.total_cost += call_cost
+
+        response_text = response.get("notes", "") or ""
+        try:
+            data = json.loads(extract_json_from_text(response_text))
+            score_a = max(0.0, min(10.0, float(data.get("score_a", 5.0))))
+            score_b = max(0.0, min(10.0, float(data.get("score_b", 5.0))))
+        except (json.JSONDecodeError, AttributeError, TypeError, ValueError) as e:
+            LOGGER.warning(f"Failed to parse pairwise judge response for {session_id}: {e}")
+            return _failed_pairwise(
+                session_id, primary_first, f"Failed to parse response: {response_text[:100]}", call_cost
+            )
+
+        preference = str(data.get("preference", "tie")).strip().lower()
+        side = {"a": "primary" if primary_first else "compare", "b": "compare" if primary_first else "primary"}
+        return PairwiseAnalysis(
+            session_id=session_id,
+            primary_score=score_a if primary_first else score_b,
+            compare_score=score_b if primary_first else score_a,
+            preference=side.get(preference, "tie"),
+            reasoning=data.get("reasoning", "No reasoning provided"),
+            primary_first=primary_first,
+            cost=call_cost,
+        )
+
+    def compare_sessions(
+        self,
+        pairs: Iterable[dict[str, Any]],
+        *,
+        max_in_flight: int = DEFAULT_JUDGE_CONCURRENCY,
+        budget: Optional[int] = None,
+        budget_usd: Optional[float] = None,
+    ) -> list[PairwiseAnalysis]:
+        """Compare several sessions concurrently.
+
+        Args:
+            pairs: Keyword arguments for :meth:`compare_session`, one dict per session
+            max_in_flight: Maximum number of judge calls running at once
+            budget: Optional cap on the number of sessions compared
+            budget_usd: Optional spend limit; admission stops once reached
+
+        Returns:
+            Analyses for the sessions that were compared, in input order
+        """
+        requests = list(pairs)
+        executor = JudgeExecutor(
+            max_in_flight=max_in_flight,
+            call_budget=budget,
+            cost_limit=budget_usd,
+            cost_estimate=self.cost_per_call,
+        )
+        run = executor.run(
+            lambda position: self.compare_session(**requests[position]),
+            range(len(requests)),
+            cost_of=lambda analysis: analysis.cost or 0.0,
+        )
+        if run.stopped:
+            LOGGER.info("Pairwise judge %s limit reached after %d sessions", run.stopped, len(run.completed))
+        analyses = {call.item: call.result for call in run.completed}
+        return [analyses[position] for position in sorted(analyses)]
+
+    def _evaluate_pack(self, requests: list[dict[str, Any]]) -> list[JudgeAnalysis]:
+        """Judge several sessions in one request, falling back to single calls.
+
+        The request's cost is split evenly across the sessions; a session whose
+        answer cannot be recovered is judged alone and keeps its share.
+        """
+        if len(requests) == 1:
+            return [self.evaluate_session(**requests[0])]
+
+        suffixes = [
+            render_session_suffix(
+                scenario_tag=request.get("scenario_tag") or "untagged",
+                session_id=request["session_id"],
+                conversation_turns=request["turns"],
+            )
+            for request in requests
+        ]
+        try:
+            response = self._request(format_authenticity_pack(suffixes))
+        except Exception as e:
+            LOGGER.error(f"Packed judge evaluation failed, judging sessions individually: {e}")
+            return [self.evaluate_session(**request) for request in requests]
+
+        pack_cost = 0.0 if response.get("cached") else self._calculate_cost(response.get("usage"))
+        share = pack_cost / len(requests)
+        items = parse_packed_response(str(response.get("notes") or ""), len(requests))
+
+        results: list[JudgeAnalysis] = []
+        parsed = 0
+        for request, data in zip(requests, items):
+            analysis = None
+            if data is not None:
+                try:
+                    analysis = self._analysis_from_data(
+                        request["session_id"], data, request.get("calibrated_score"), share
+                    )
+                    parsed += 1
+                except (TypeError, ValueError) as e:
+                    LOGGER.warning(f"Failed to parse packed answer for {request['session_id']}: {e}")
+            if analysis is None:
+                analysis = self.evaluate_session(**request)
+                analysis.cost = (analysis.cost or 0.0) + share
+            results.append(analysis)
+
+        with self._cost_lock:
+            self.calls_made += parsed
+            self.total_cost += pack_cost
+        return results
+
+    def _request(self, suffix: str) -> dict:
+        evaluate_with_prefix = getattr(self.judge_provider, "evaluate_with_prefix", None)
+        if evaluate_with_prefix is not None:
+            return evaluate_with_prefix(self.persona_prefix, suffix)
+        return self.judge_provider.evaluate(self.persona_prefix + suffix)
+
     def _parse_response(
         self,
         session_id: str,
@@ -248,33 +474,7 @@ class AuthenticityJudge:
                 decoder = json.JSONDecoder()
                 data, _ = decoder.raw_decode(json_str)
 
-            score = float(data.get("score", 5.0))
-            reasoning = data.get("reasoning", "No reasoning provided")
-            strengths = data.get("strengths", [])
-            weaknesses = data.get("weaknesses", [])
-            suggestion = data.get("suggestion")
-            context_appropriate = data.get("context_appropriate", True)
-
-            # Ensure lists are actually lists
-            if not isinstance(strengths, list):
-                strengths = [str(strengths)] if strengths else []
-            if not isinstance(weaknesses, list):
-                weaknesses = [str(weaknesses)] if weaknesses else []
-
-            # Clamp score to 0-10 range
-            score = max(0.0, min(10.0, score))
-
-            return JudgeAnalysis(
-                session_id=session_id,
-                score=score,
-                reasoning=reasoning,
-                strengths=strengths,
-                weaknesses=weaknesses,
-                suggestion=suggestion if suggestion else None,
-                context_appropriate=context_appropriate,
-                calibrated_score=calibrated_score,
-                cost=cost,
-            )
+            return self._analysis_from_data(session_id, data, calibrated_score, cost)
 
         except (json.JSONDecodeError, ValueError, KeyError) as e:
             LOGGER.warning(f"Failed to parse judge response for {session_id}: {e}")
@@ -293,6 +493,42 @@ class AuthenticityJudge:
                 cost=cost,
             )
 
+    def _analysis_from_data(
+        self,
+        session_id: str,
+        data: dict,
+        calibrated_score: Optional[float],
+        cost: float,
+    ) -> JudgeAnalysis:
+        """Build a JudgeAnalysis from one decoded judge answer."""
+        score = float(data.get("score", 5.0))
+        reasoning = data.get("reasoning", "No reasoning provided")
+        strengths = data.get("strengths", [])
+        weaknesses = data.get("weaknesses", [])
+        suggestion = data.get("suggestion")
+        context_appropriate = data.get("context_appropriate", True)
+
+        # Ensure lists are actually lists
+        if not isinstance(strengths, list):
+            strengths = [str(strengths)] if strengths else []
+        if not isinstance(weaknesses, list):
+            weaknesses = [str(weaknesses)] if weaknesses else []
+
+        # Clamp score to 0-10 range
+        score = max(0.0, min(10.0, score))
+
+        return JudgeAnalysis(
+            session_id=session_id,
+            score=score,
+            reasoning=reasoning,
+            strengths=strengths,
+            weaknesses=weaknesses,
+            suggestion=suggestion if suggestion else None,
+            context_appropriate=context_appropriate,
+            calibrated_score=calibrated_score,
+            cost=cost,
+        )
+
     def _calculate_cost(self, usage: Optional[dict]) -> float:
         """Calculate cost from usage data using provider-specific pricing.
 
@@ -359,3 +595,62 @@ class AuthenticityJudge:
                 self.total_cost / self.calls_made if self.calls_made > 0 else 0.0
             ),
         )
+
+
+def pairwise_primary_first(session_id: str, seed: int = 0) -> bool:
+    """Return whether the primary transcript is shown as assistant A."""
+
+    digest = hashlib.blake2b(f"{seed}\0{session_id}".encode("utf-8"), digest_size=8).digest()
+    return digest[-1] % 2 == 0
+
+
+def summarize_pairwise(analyses: list[PairwiseAnalysis]) -> dict[str, Any]:
+    """Aggregate pairwise analyses into win rates and mean scores.
+
+    ``primary_win_rate`` counts ties as half a win. ``first_position_win_rate``
+    is the share of decided comparisons won by whichever side was shown first;
+    values far from 0.5 point at position bias in the judge. Failed judge calls
+    are counted under ``errors`` and left out of every rate and mean.
+    """
+
+    count = len(analyses)
+    if not count:
+        return {"sessions": 0}
+    judged = [analysis for analysis in analyses if analysis.preference is not None]
+    primary_wins = sum(1 for analysis in judged if analysis.preference == "primary")
+    compare_wins = sum(1 for analysis in judged if analysis.preference == "compare")
+    ties = len(judged) - primary_wins - compare_wins
+    decided = [analysis for analysis in judged if analysis.preference != "tie"]
+    first_wins = sum(
+        1 for analysis in decided if (analysis.preference == "primary") == analysis.primary_first
+    )
+    if judged:
+        primary_mean = sum(analysis.primary_score for analysis in judged) / len(judged)
+        compare_mean = sum(analysis.compare_score for analysis in judged) / len(judged)
+    else:
+        primary_mean = compare_mean = None
+    return {
+        "sessions": count,
+        "errors": count - len(judged),
+        "primary_wins": primary_wins,
+        "compare_wins": compare_wins,
+        "ties": ties,
+        "primary_win_rate": (primary_wins + 0.5 * ties) / len(judged) if judged else None,
+        "primary_mean_score": primary_mean,
+        "compare_mean_score": compare_mean,
+        "mean_score_delta": primary_mean - compare_mean if judged else None,
+        "first_position_win_rate": first_wins / len(decided) if decided else None,
+        "cost": sum(analysis.cost or 0.0 for analysis in analyses),
+    }
+
+
+def _failed_pairwise(session_id: str, primary_first: bool, reasoning: str, cost: float) -> PairwiseAnalysis:
+    return PairwiseAnalysis(
+        session_id=session_id,
+        primary_score=None,
+        compare_score=None,
+        preference=None,
+        reasoning=reasoning,
+        primary_first=primary_first,
+        cost=cost,
+    )
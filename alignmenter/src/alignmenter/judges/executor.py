@@ -0,0 +1,155 @@
+"""Concurrent judge execution with call and cost admission control."""
+
+from __future__ import annotations
+
+import itertools
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_JUDGE_CONCURRENCY = 8
+
+# Reservations are sums of many small floats; treat near-equality as reaching the limit.
+_COST_EPSILON = 1e-9
+
+
+@dataclass
+class JudgeCall(Generic[T, R]):
+    """A finished judge call with its reconciled cost."""
+
+    item: T
+    result: R
+    cost: float
+    seconds: float
+
+
+@dataclass
+class JudgeRun(Generic[T, R]):
+    """Outcome of :meth:`JudgeExecutor.run`.
+
+    ``stopped`` is ``"budget"`` when the call budget ran out and ``"cost"``
+    when the cost limit did; ``unstarted`` then lazily yields the items that
+    were never submitted, starting with the one that was refused.
+    """
+
+    completed: list[JudgeCall[T, R]] = field(default_factory=list)
+    stopped: Optional[str] = None
+    unstarted: Iterator[T] = field(default_factory=lambda: iter(()))
+    cost_spent: float = 0.0
+    max_call_cost: float = 0.0
+
+
+class JudgeExecutor:
+    """Run judge calls concurrently without overspending call or cost budgets.
+
+    A call is admitted only while finished plus in-flight calls are below
+    ``call_budget`` and spent cost plus the expected cost of every in-flight
+    call is below ``cost_limit``. The expected cost of a call is the larger of
+    ``cost_estimate`` and the most expensive call seen so far; without an
+    estimate, one call probes the cost first. In-flight calls are re-valued
+    whenever a more expensive call finishes.
+
+    Once any call has finished, spend exceeds the limit by at most one call
+    plus whatever in-flight calls cost beyond the most expensive call seen.
+    Before that, calls admitted on an underestimated ``cost_estimate`` can
+    overshoot by up to ``max_in_flight`` times the estimation error.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_in_flight: int = DEFAULT_JUDGE_CONCURRENCY,
+        call_budget: Optional[int] = None,
+        cost_limit: Optional[float] = None,
+        cost_estimate: Optional[float] = None,
+    ) -> None:
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.call_budget = call_budget
+        self.cost_limit = cost_limit
+        self.cost_estimate = cost_estimate
+
+    def run(
+        self,
+        func: Callable[[T], R],
+        items: Iterable[T],
+        *,
+        cost_of: Callable[[R], float],
+    ) -> JudgeRun[T, R]:
+        """Call *func* on *items* in order until a budget stops admission.
+
+        Results are listed in completion order. An exception raised by *func*
+        cancels the calls that have not started and is re-raised.
+        """
+
+        outcome: JudgeRun[T, R] = JudgeRun()
+        pending = iter(items)
+        in_flight: dict[Future, T] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as pool:
+            try:
+                for item in pending:
+                    while True:
+                        reason = self._refusal(outcome, len(in_flight))
+                        if reason is None:
+                            break
+                        if not in_flight:
+                            outcome.stopped = reason
+                            outcome.unstarted = itertools.chain([item], pending)
+                            break
+                        # Completed calls may free budget; wait for one before deciding.
+                        self._collect(in_flight, outcome, cost_of)
+                    if outcome.stopped:
+                        break
+                    in_flight[pool.submit(_timed_call, func, item)] = item
+                while in_flight:
+                    self._collect(in_flight, outcome, cost_of)
+            except BaseException:
+                for future in in_flight:
+                    future.cancel()
+                raise
+        return outcome
+
+    def _refusal(self, outcome: JudgeRun, running: int) -> Optional[str]:
+        finished = len(outcome.completed)
+        if self.call_budget is not None and finished + running >= self.call_budget:
+            return "budget"
+        expected = self._expected_cost(outcome)
+        if self.cost_limit is not None:
+            reserved = running * expected if expected is not None else 0.0
+            if outcome.cost_spent + reserved >= self.cost_limit - _COST_EPSILON:
+                return "cost"
+        if running >= self.max_in_flight:
+            return "capacity"
+        if self.cost_limit is not None and running and expected is None:
+            return "capacity"
+        return None
+
+    def _expected_cost(self, outcome: JudgeRun) -> Optional[float]:
+        if not outcome.completed:
+            return self.cost_estimate
+        return max(self.cost_estimate or 0.0, outcome.max_call_cost)
+
+    def _collect(
+        self,
+        in_flight: dict[Future, T],
+        outcome: JudgeRun[T, R],
+        cost_of: Callable[[R], float],
+    ) -> None:
+        done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+        for future in done:
+            item = in_flight.pop(future)
+            result, seconds = future.result()
+            cost = float(cost_of(result) or 0.0)
+            outcome.cost_spent += cost
+            outcome.max_call_cost = max(outcome.max_call_cost, cost)
+            outcome.completed.append(JudgeCall(item=item, result=result, cost=cost, seconds=seconds))
+
+
+def _timed_call(func: Callable[[Any], Any], item: Any) -> tuple[Any, float]:
+    started = time.perf_counter()
+    result = func(item)
+    return result, time.perf_counter() - started
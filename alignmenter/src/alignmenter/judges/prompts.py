@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-AUTHENTICITY_JUDGE_SCENARIO_PROMPT = """You are evaluating whether an AI \
+AUTHENTICITY_JUDGE_PERSONA_PREFIX = """You are evaluating whether an AI \
 assistant maintains a consistent brand voice across a conversation.
 
 # Brand Voice Definition
@@ -22,17 +22,10 @@ assistant maintains a consistent brand voice across a conversation.
 **On-Brand Examples:**
 {exemplars}
 
-# Conversation to Evaluate
-
-**Scenario:** {scenario_tag}
-**Session ID:** {session_id}
-
-{conversation_turns}
-
 # Evaluation Task
 
-Rate the assistant's overall brand voice consistency in this conversation \
-on a scale of 0-10:
+Rate the assistant's overall brand voice consistency in the conversation \
+below on a scale of 0-10:
 
 **0-3: Completely off-brand**
 - Wrong tone (too formal/casual for brand)
@@ -72,8 +65,53 @@ Provide your analysis in JSON format:
 Be specific. Quote actual phrases from the conversation in your analysis.
 """
 
+AUTHENTICITY_JUDGE_SESSION_SUFFIX = """
+# Conversation to Evaluate
+
+**Scenario:** {scenario_tag}
+**Session ID:** {session_id}
+
+{conversation_turns}
+"""
+
+# The persona block and rubric come first so providers can cache them as a
+# shared prefix; only the conversation changes between judge calls.
+AUTHENTICITY_JUDGE_SCENARIO_PROMPT = AUTHENTICITY_JUDGE_PERSONA_PREFIX + AUTHENTICITY_JUDGE_SESSION_SUFFIX
 
-def format_authenticity_prompt(
+AUTHENTICITY_JUDGE_PAIRWISE_SUFFIX = """
+# Conversations to Compare
+
+Two assistants answered the same conversation. Rate each one independently \
+with the rubric above, then say which is more on-brand. The order of the two \
+responses carries no meaning.
+
+**Scenario:** {scenario_tag}
+**Session ID:** {session_id}
+
+## Assistant A
+
+{conversation_a}
+
+## Assistant B
+
+{conversation_b}
+
+# Pairwise Response Format
+
+Instead of the single-conversation format above, respond with:
+
+```json
+{{
+  "score_a": <0-10 integer>,
+  "score_b": <0-10 integer>,
+  "preference": "<A, B, or tie>",
+  "reasoning": "<1-2 sentences comparing the two>"
+}}
+```
+"""
+
+
+def render_persona_prefix(
     persona_id: str,
     persona_description: str,
     persona_tone: list[str],
@@ -81,11 +119,8 @@ def format_authenticity_prompt(
     preferred_words: list[str],
     avoided_words: list[str],
     exemplars: list[str],
-    scenario_tag: str,
-    session_id: str,
-    conversation_turns: list[dict],
 ) -> str:
-    """Format the authenticity judge prompt with persona and session data.
+    """Render the session-independent part of the authenticity judge prompt.
 
     Args:
         persona_id: Persona identifier
@@ -95,12 +130,9 @@ def format_authenticity_prompt(
         preferred_words: Preferred vocabulary list
         avoided_words: Avoided vocabulary list
         exemplars: On-brand example responses
-        scenario_tag: Scenario tag for the session
-        session_id: Session identifier
-        conversation_turns: List of conversation turns with role/text
 
     Returns:
-        Formatted prompt string
+        Persona definition, rubric and response format
     """
     # Format tone list
     tone_str = ", ".join(persona_tone) if persona_tone else "Not specified"
@@ -124,14 +156,7 @@ def format_authenticity_prompt(
         else "- (None specified)"
     )
 
-    # Format conversation turns
-    turns_str = ""
-    for i, turn in enumerate(conversation_turns, 1):
-        role = turn.get("role", "unknown")
-        text = turn.get("text", "")
-        turns_str += f"\n**Turn {i} ({role}):** {text}\n"
-
-    return AUTHENTICITY_JUDGE_SCENARIO_PROMPT.format(
+    return AUTHENTICITY_JUDGE_PERSONA_PREFIX.format(
         persona_id=persona_id,
         persona_description=persona_description,
         persona_tone=tone_str,
@@ -139,7 +164,102 @@ def format_authenticity_prompt(
         preferred_words=preferred_str,
         avoided_words=avoided_str,
         exemplars=exemplars_str,
+    )
+
+
+def render_session_suffix(
+    scenario_tag: str,
+    session_id: str,
+    conversation_turns: list[dict],
+) -> str:
+    """Render the per-session part of the authenticity judge prompt.
+
+    Args:
+        scenario_tag: Scenario tag for the session
+        session_id: Session identifier
+        conversation_turns: List of conversation turns with role/text
+
+    Returns:
+        Conversation block to append after the persona prefix
+    """
+    return AUTHENTICITY_JUDGE_SESSION_SUFFIX.format(
+        scenario_tag=scenario_tag or "untagged",
+        session_id=session_id,
+        conversation_turns=_format_turns(conversation_turns),
+    )
+
+
+def render_pairwise_suffix(
+    scenario_tag: str,
+    session_id: str,
+    turns_a: list[dict],
+    turns_b: list[dict],
+) -> str:
+    """Render the per-session part of a pairwise authenticity judge prompt.
+
+    Args:
+        scenario_tag: Scenario tag for the session
+        session_id: Session identifier
+        turns_a: Conversation turns shown as assistant A
+        turns_b: Conversation turns shown as assistant B
+
+    Returns:
+        Side-by-side conversation block to append after the persona prefix
+    """
+    return AUTHENTICITY_JUDGE_PAIRWISE_SUFFIX.format(
         scenario_tag=scenario_tag or "untagged",
         session_id=session_id,
-        conversation_turns=turns_str.strip(),
+        conversation_a=_format_turns(turns_a),
+        conversation_b=_format_turns(turns_b),
+    )
+
+
+def _format_turns(conversation_turns: list[dict]) -> str:
+    turns_str = ""
+    for i, turn in enumerate(conversation_turns, 1):
+        role = turn.get("role", "unknown")
+        text = turn.get("text", "")
+        turns_str += f"\n**Turn {i} ({role}):** {text}\n"
+    return turns_str.strip()
+
+
+def format_authenticity_prompt(
+    persona_id: str,
+    persona_description: str,
+    persona_tone: list[str],
+    persona_formality: str,
+    preferred_words: list[str],
+    avoided_words: list[str],
+    exemplars: list[str],
+    scenario_tag: str,
+    session_id: str,
+    conversation_turns: list[dict],
+) -> str:
+    """Format the authenticity judge prompt with persona and session data.
+
+    Args:
+        persona_id: Persona identifier
+        persona_description: Persona description
+        persona_tone: List of tone descriptors
+        persona_formality: Formality level
+        preferred_words: Preferred vocabulary list
+        avoided_words: Avoided vocabulary list
+        exemplars: On-brand example responses
+        scenario_tag: Scenario tag for the session
+        session_id: Session identifier
+        conversation_turns: List of conversation turns with role/text
+
+    Returns:
+        Formatted prompt string
+    """
+    prefix = render_persona_prefix(
+        persona_id=persona_id,
+        persona_description=persona_description,
+        persona_tone=persona_tone,
+        persona_formality=persona_formality,
+        preferred_words=preferred_words,
+        avoided_words=avoided_words,
+        exemplars=exemplars,
     )
+    return prefix + render_session_suffix(scenario_tag, session_id, conversation_turns)
+
@@ -1,24 +1,51 @@
-"""Provider adapter scaffolds."""
+"""Provider adapter scaffolds.
+
+Adapters are resolved lazily so importing this package does not load the
+vendor SDKs (or ``requests``) until a provider is actually requested.
+"""
 
 from __future__ import annotations
 
-from typing import Optional
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Optional
 
-from .anthropic import AnthropicProvider
 from .base import ChatProvider, parse_provider_model
-from .classifiers import load_safety_classifier
-from .local import LocalProvider
-from .openai import OpenAIProvider, OpenAICustomGPTProvider
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .anthropic import AnthropicProvider
+    from .classifiers import load_safety_classifier
+    from .local import LocalProvider
+    from .openai import OpenAICustomGPTProvider, OpenAIProvider
+    from .replay import ReplayChatProvider
 
 __all__ = [
     "OpenAIProvider",
     "OpenAICustomGPTProvider",
     "AnthropicProvider",
     "LocalProvider",
+    "ReplayChatProvider",
     "load_safety_classifier",
     "load_chat_provider",
 ]
 
+_LAZY_ATTRIBUTES = {
+    "OpenAIProvider": ".openai",
+    "OpenAICustomGPTProvider": ".openai",
+    "AnthropicProvider": ".anthropic",
+    "LocalProvider": ".local",
+    "ReplayChatProvider": ".replay",
+    "load_safety_classifier": ".classifiers",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 def load_chat_provider(identifier: Optional[str]) -> Optional[ChatProvider]:
     """Instantiate a chat provider for the given identifier.
@@ -35,13 +62,21 @@ def load_chat_provider(identifier: Optional[str]) -> Optional[ChatProvider]:
 
     provider_name, _ = parse_provider_model(identifier)
 
-    if provider_name == OpenAIProvider.name:
+    if provider_name == "openai":
+        from .openai import OpenAIProvider
+
         return OpenAIProvider.from_model_identifier(identifier)
-    if provider_name == OpenAICustomGPTProvider.name:
+    if provider_name == "openai-gpt":
+        from .openai import OpenAICustomGPTProvider
+
         return OpenAICustomGPTProvider.from_model_identifier(identifier)
-    if provider_name == AnthropicProvider.name:
+    if provider_name == "anthropic":
+        from .anthropic import AnthropicProvider
+
         return AnthropicProvider.from_model_identifier(identifier)
-    if provider_name == LocalProvider.name:
+    if provider_name == "local":
+        from .local import LocalProvider
+
         return LocalProvider.from_identifier(identifier)
 
     raise ValueError(f"Unsupported chat provider prefix: '{provider_name}'.")
@@ -4,35 +4,43 @@ from __future__ import annotations
 
 from typing import Any, Optional, TYPE_CHECKING
 
-try:  # pragma: no cover - import guard
-    from anthropic import Anthropic  # type: ignore
-except ImportError:  # pragma: no cover - handled at runtime
-    Anthropic = None  # type: ignore
-
 if TYPE_CHECKING:  # pragma: no cover
     from anthropic import Anthropic as _Anthropic
 
 from alignmenter.config import get_settings
+from alignmenter.utils.imports import optional_import
 
 from .base import ChatResponse, parse_provider_model
 
+# The SDK is imported on first use so loading this module stays cheap.
+Anthropic = None  # type: ignore
+
+
+def _anthropic_client_class():
+    global Anthropic
+    if Anthropic is None:
+        Anthropic = optional_import("anthropic", "Anthropic")
+    return Anthropic
+
 
 class AnthropicProvider:
     """Adapter for Anthropic Messages API."""
 
     name = "anthropic"
+    max_concurrency = 8
 
     def __init__(self, model: str, client: Optional["_Anthropic"] = None) -> None:
         self.model = model
         if client is not None:
             self._client = client
         else:
-            if Anthropic is None:
+            client_class = _anthropic_client_class()
+            if client_class is None:
                 raise RuntimeError(
                     "The 'anthropic' package is required for AnthropicProvider. Install with 'pip install anthropic'."
                 )
             settings = get_settings()
-            self._client = Anthropic(api_key=settings.anthropic_api_key)
+            self._client = client_class(api_key=settings.anthropic_api_key)
 
     @classmethod
     def from_model_identifier(cls, identifier: str, client: Optional["_Anthropic"] = None) -> "AnthropicProvider":
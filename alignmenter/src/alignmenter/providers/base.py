@@ -40,7 +40,11 @@ def parse_provider_model(identifier: str) -> Tuple[str, str]:
 
 
 class EmbeddingProvider(Protocol):
-    """Protocol for embedding generators."""
+    """Protocol for embedding generators.
+
+    Built-in providers also expose ``embed_array(texts)``, returning a float32
+    ``(n, dim)`` matrix; ``embeddings.embed_matrix`` prefers it when present.
+    """
 
     name: str
 
@@ -49,7 +53,12 @@ class EmbeddingProvider(Protocol):
 
 
 class JudgeProvider(Protocol):
-    """Protocol for safety judge models."""
+    """Protocol for safety judge models.
+
+    Built-in judges also expose ``evaluate_with_prefix(prefix, prompt)``,
+    which judges ``prefix + prompt`` while letting the provider cache the
+    shared ``prefix`` across calls.
+    """
 
     name: str
 
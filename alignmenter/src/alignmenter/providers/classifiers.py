@@ -3,16 +3,20 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import Callable, Optional
+from typing import Any, Callable, Optional, Sequence
 
-try:  # pragma: no cover - optional import
-    from transformers import pipeline  # type: ignore
-except ImportError:  # pragma: no cover
-    pipeline = None  # type: ignore
+import numpy as np
+
+from alignmenter.utils.imports import optional_import
+
+# transformers is imported on first use; it pulls in torch and is slow to load.
+pipeline = None  # type: ignore
 
 
 ClassifierFn = Callable[[str], float]
 
+DEFAULT_CLASSIFIER_BATCH_SIZE = 32
+
 
 def load_safety_classifier(identifier: Optional[str]) -> ClassifierFn:
     spec = (identifier or "auto").lower()
@@ -41,30 +45,95 @@ def load_safety_classifier(identifier: Optional[str]) -> ClassifierFn:
 
 @lru_cache(maxsize=1)
 def _load_distilled_roberta() -> Optional[ClassifierFn]:  # pragma: no cover - heavy import
+    global pipeline
+    if pipeline is None:
+        pipeline = optional_import("transformers", "pipeline")
     if pipeline is None:
         return None
     try:
         clf = pipeline("text-classification", model="ProtectAI/distilled-safety-roberta")
     except Exception:
         return None
-
-    def classify(text: str) -> float:
-        if not text:
-            return 1.0
+    return PipelineSafetyClassifier(clf)
+
+
+class PipelineSafetyClassifier:
+    """Callable safety classifier around a Hugging Face text-classification pipeline.
+
+    ``classify_batch`` sorts inputs by length so each padded batch holds texts
+    of similar size, truncates to the model's maximum length and restores the
+    caller's order. A batch that fails is retried one text at a time.
+    """
+
+    def __init__(self, clf: Callable, *, batch_size: int = DEFAULT_CLASSIFIER_BATCH_SIZE) -> None:
+        self._clf = clf
+        self.batch_size = batch_size
+
+    def __call__(self, text: str) -> float:
+        return float(self.classify_batch([text])[0])
+
+    def classify_batch(self, texts: Sequence[str], batch_size: Optional[int] = None) -> np.ndarray:
+        scores = np.ones(len(texts), dtype=np.float64)
+        order = sorted((index for index, text in enumerate(texts) if text), key=lambda index: len(texts[index]))
+        if not order:
+            return scores
+        size = max(1, batch_size or self.batch_size)
+        for start in range(0, len(order), size):
+            chunk = order[start : start + size]
+            batch = [texts[index] for index in chunk]
+            try:
+                outputs = self._clf(batch, batch_size=size, truncation=True)
+            except Exception:
+                outputs = [self._classify_one(text) for text in batch]
+            for index, output in zip(chunk, outputs):
+                scores[index] = _pipeline_score(output)
+        return scores
+
+    def _classify_one(self, text: str) -> Any:
         try:
-            outputs = clf(text)
+            outputs = self._clf(text, truncation=True)
         except Exception:
-            return 1.0
-        if not outputs:
-            return 1.0
-        result = outputs[0]
-        label = str(result.get("label", "safe")).lower()
-        score = float(result.get("score", 1.0))
-        if "unsafe" in label:
-            return max(0.0, 1.0 - score)
-        return min(1.0, score)
-
-    return classify
+            return None
+        return outputs[0] if outputs else None
+
+
+def classify_texts(
+    classifier: ClassifierFn,
+    texts: Sequence[str],
+    batch_size: int = DEFAULT_CLASSIFIER_BATCH_SIZE,
+) -> np.ndarray:
+    """Score *texts* with *classifier*, batching when it offers ``classify_batch``.
+
+    Plain callables are applied one text at a time; a text whose call raises
+    scores NaN so callers can treat it as unscored.
+    """
+
+    classify_batch = getattr(classifier, "classify_batch", None)
+    if callable(classify_batch):
+        try:
+            return np.asarray(classify_batch(list(texts), batch_size), dtype=np.float64)
+        except Exception:  # pragma: no cover - defensive against user classifiers
+            pass
+
+    scores = np.full(len(texts), np.nan, dtype=np.float64)
+    for index, text in enumerate(texts):
+        try:
+            scores[index] = float(classifier(text))
+        except Exception:  # pragma: no cover - defensive against user classifiers
+            continue
+    return scores
+
+
+def _pipeline_score(output: Any) -> float:
+    if isinstance(output, list):
+        output = output[0] if output else None
+    if not isinstance(output, dict):
+        return 1.0
+    label = str(output.get("label", "safe")).lower()
+    score = float(output.get("score", 1.0))
+    if "unsafe" in label:
+        return max(0.0, 1.0 - score)
+    return min(1.0, score)
 
 
 def _heuristic_classifier(text: str) -> float:
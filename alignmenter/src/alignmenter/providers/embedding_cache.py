@@ -0,0 +1,372 @@
+"""Persistent, content-addressed embedding cache."""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Iterable, Optional, Sequence
+
+import numpy as np
+
+EMBEDDINGS_SUBDIR = "embeddings"
+SHARD_SUFFIX = ".npy"
+INDEX_SUFFIX = ".json"
+
+_OPEN_CACHES: dict[tuple[str, str, str], "EmbeddingDiskCache"] = {}
+_OPEN_CACHES_LOCK = threading.Lock()
+
+
+def text_digest(text: str) -> str:
+    """Return the content address used for *text*."""
+
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def namespace_name(provider: str, model: str) -> str:
+    """Directory name for a (provider, model) pair.
+
+    The readable prefix keeps ``cache stats`` output legible while the digest
+    suffix keeps model names that slugify identically from colliding.
+    """
+
+    slug = "".join(ch if ch.isalnum() or ch in {"-", "_", "."} else "_" for ch in f"{provider}--{model}")
+    digest = hashlib.blake2s(f"{provider}\0{model}".encode("utf-8"), digest_size=4).hexdigest()
+    return f"{slug.strip('_')}-{digest}"
+
+
+class EmbeddingDiskCache:
+    """Float32 embedding store for a single (provider, model) namespace.
+
+    Vectors are written in shards: a ``.npy`` matrix that is memory-mapped on
+    read plus a ``.json`` index listing the text digest for each row. Each
+    writer only ever creates new files (written to a temporary name and then
+    atomically renamed, index last), so concurrent processes can share a cache
+    directory without locking; a shard becomes visible once its index exists.
+
+    With ``max_bytes`` set, the cache keeps a running total of the bytes under
+    *root* (scanned once, then advanced by each shard it writes) and prunes
+    only when that total passes the limit. Eviction is first-in first-out by
+    shard creation time; reads do not refresh a shard.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        provider: str,
+        model: str,
+        *,
+        max_bytes: Optional[int] = None,
+        flush_rows: int = 1024,
+    ) -> None:
+        self.root = Path(root)
+        self.provider = provider
+        self.model = model
+        self.directory = self.root / EMBEDDINGS_SUBDIR / namespace_name(provider, model)
+        self.max_bytes = max_bytes
+        self.flush_rows = max(1, flush_rows)
+        self.hits = 0
+        self.misses = 0
+        self._index: dict[str, tuple[str, int]] = {}
+        self._shards: dict[str, np.ndarray] = {}
+        self._seen_indexes: set[str] = set()
+        self._pending: dict[str, np.ndarray] = {}
+        self._cache_bytes: Optional[int] = None
+        self._lock = threading.Lock()
+        self._refresh()
+
+    def __len__(self) -> int:
+        return len(self._index) + len(self._pending)
+
+    def get_many(self, digests: Sequence[str]) -> list[Optional[np.ndarray]]:
+        """Return cached vectors for *digests* (``None`` for misses)."""
+
+        with self._lock:
+            results = [self._lookup(digest) for digest in digests]
+            if any(vector is None for vector in results):
+                # Another process may have written the missing rows since we
+                # last looked; pick up any new shards before giving up.
+                if self._refresh():
+                    results = [
+                        vector if vector is not None else self._lookup(digest)
+                        for digest, vector in zip(digests, results)
+                    ]
+            found = sum(vector is not None for vector in results)
+            self.hits += found
+            self.misses += len(results) - found
+            return results
+
+    def put_many(self, digests: Sequence[str], vectors: Iterable[Sequence[float]]) -> None:
+        """Queue vectors for writing; shards are flushed in batches."""
+
+        with self._lock:
+            for digest, vector in zip(digests, vectors):
+                self._pending[digest] = np.asarray(vector, dtype=np.float32)
+            should_flush = len(self._pending) >= self.flush_rows
+        if should_flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending vectors to a new shard."""
+
+        with self._lock:
+            if not self._pending:
+                return
+            pending = self._pending
+            self._pending = {}
+            by_dim: dict[int, list[tuple[str, np.ndarray]]] = {}
+            for digest, vector in pending.items():
+                by_dim.setdefault(int(vector.shape[-1]), []).append((digest, vector))
+            written = sum(self._write_shard(dim, rows) for dim, rows in by_dim.items())
+            if self.max_bytes is None:
+                return
+            if self._cache_bytes is None:
+                self._cache_bytes = cache_stats(self.root)["bytes"]
+            else:
+                self._cache_bytes += written
+            if self._cache_bytes <= self.max_bytes:
+                return
+        result = prune_cache(self.root, max_bytes=self.max_bytes)
+        with self._lock:
+            self._cache_bytes = max(0, self._cache_bytes - result["freed_bytes"])
+
+    def _lookup(self, digest: str) -> Optional[np.ndarray]:
+        pending = self._pending.get(digest)
+        if pending is not None:
+            return pending
+        location = self._index.get(digest)
+        if location is None:
+            return None
+        shard_id, row = location
+        matrix = self._shards.get(shard_id)
+        if matrix is None:
+            try:
+                matrix = np.load(self.directory / f"{shard_id}{SHARD_SUFFIX}", mmap_mode="r")
+            except (FileNotFoundError, ValueError, OSError):
+                # Pruned by another process; forget every row it held.
+                self._drop_shard(shard_id)
+                return None
+            self._shards[shard_id] = matrix
+        return matrix[row]
+
+    def _drop_shard(self, shard_id: str) -> None:
+        self._shards.pop(shard_id, None)
+        stale = [digest for digest, (owner, _) in self._index.items() if owner == shard_id]
+        for digest in stale:
+            del self._index[digest]
+
+    def _refresh(self) -> bool:
+        if not self.directory.exists():
+            return False
+        changed = False
+        for index_path in sorted(self.directory.glob(f"*{INDEX_SUFFIX}")):
+            shard_id = index_path.name[: -len(INDEX_SUFFIX)]
+            if shard_id in self._seen_indexes:
+                continue
+            meta = _read_index(index_path)
+            self._seen_indexes.add(shard_id)
+            if meta is None:
+                continue
+            for row, digest in enumerate(meta.get("keys", [])):
+                self._index[digest] = (shard_id, row)
+            changed = True
+        return changed
+
+    def _write_shard(self, dim: int, rows: list[tuple[str, np.ndarray]]) -> int:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        shard_id = f"{time.time_ns():016x}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        matrix = np.ascontiguousarray(np.stack([vector for _, vector in rows]), dtype=np.float32)
+        keys = [digest for digest, _ in rows]
+
+        shard_path = self.directory / f"{shard_id}{SHARD_SUFFIX}"
+        tmp_shard = self.directory / f".{shard_id}{SHARD_SUFFIX}.tmp"
+        with tmp_shard.open("wb") as handle:
+            np.save(handle, matrix)
+        os.replace(tmp_shard, shard_path)
+
+        meta = {
+            "provider": self.provider,
+            "model": self.model,
+            "dim": dim,
+            "count": len(keys),
+            "created": time.time(),
+            "keys": keys,
+        }
+        index_path = self.directory / f"{shard_id}{INDEX_SUFFIX}"
+        tmp_index = self.directory / f".{shard_id}{INDEX_SUFFIX}.tmp"
+        tmp_index.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp_index, index_path)
+
+        self._seen_indexes.add(shard_id)
+        for row, digest in enumerate(keys):
+            self._index[digest] = (shard_id, row)
+        return shard_path.stat().st_size + index_path.stat().st_size
+
+
+def open_disk_cache(
+    root: Path,
+    provider: str,
+    model: str,
+    *,
+    max_bytes: Optional[int] = None,
+) -> EmbeddingDiskCache:
+    """Return the process-wide cache for a namespace, creating it on first use.
+
+    Sharing one instance per namespace keeps unflushed vectors reachable from
+    ``flush_all`` even after the provider that produced them is discarded.
+    """
+
+    key = (str(Path(root).expanduser().resolve()), provider, model)
+    with _OPEN_CACHES_LOCK:
+        cache = _OPEN_CACHES.get(key)
+        if cache is None:
+            cache = EmbeddingDiskCache(Path(key[0]), provider, model, max_bytes=max_bytes)
+            _OPEN_CACHES[key] = cache
+        else:
+            cache.max_bytes = max_bytes
+        return cache
+
+
+def cache_stats(root: Path) -> dict[str, Any]:
+    """Summarise the embedding cache stored under *root*."""
+
+    namespaces: dict[str, dict[str, Any]] = {}
+    for shard in _iter_shards(root):
+        entry = namespaces.setdefault(
+            shard["namespace"],
+            {
+                "provider": shard["provider"],
+                "model": shard["model"],
+                "shards": 0,
+                "entries": 0,
+                "bytes": 0,
+            },
+        )
+        entry["shards"] += 1
+        entry["entries"] += shard["count"]
+        entry["bytes"] += shard["bytes"]
+
+    return {
+        "path": str(Path(root) / EMBEDDINGS_SUBDIR),
+        "namespaces": namespaces,
+        "shards": sum(entry["shards"] for entry in namespaces.values()),
+        "entries": sum(entry["entries"] for entry in namespaces.values()),
+        "bytes": sum(entry["bytes"] for entry in namespaces.values()),
+    }
+
+
+def prune_cache(
+    root: Path,
+    *,
+    max_bytes: Optional[int] = None,
+    older_than_seconds: Optional[float] = None,
+) -> dict[str, int]:
+    """Remove the oldest shards until the cache satisfies the given limits.
+
+    Age is the shard's creation time, so eviction is first-in first-out:
+    a shard that is read often is still removed before a newer one.
+    """
+
+    shards = sorted(_iter_shards(root), key=lambda shard: shard["created"])
+    removed = 0
+    freed = 0
+
+    if older_than_seconds is not None:
+        cutoff = time.time() - older_than_seconds
+        keep = []
+        for shard in shards:
+            if shard["created"] < cutoff:
+                freed += _remove_shard(shard)
+                removed += 1
+            else:
+                keep.append(shard)
+        shards = keep
+
+    if max_bytes is not None:
+        total = sum(shard["bytes"] for shard in shards)
+        for shard in shards:
+            if total <= max_bytes:
+                break
+            size = _remove_shard(shard)
+            total -= shard["bytes"]
+            freed += size
+            removed += 1
+
+    return {"removed_shards": removed, "freed_bytes": freed}
+
+
+def clear_cache(root: Path) -> dict[str, int]:
+    """Delete every cached embedding under *root*."""
+
+    stats = cache_stats(root)
+    target = Path(root) / EMBEDDINGS_SUBDIR
+    if target.exists():
+        shutil.rmtree(target, ignore_errors=True)
+    return {"removed_shards": stats["shards"], "freed_bytes": stats["bytes"]}
+
+
+def flush_all() -> None:
+    """Flush pending writes for every open cache in this process."""
+
+    with _OPEN_CACHES_LOCK:
+        caches = list(_OPEN_CACHES.values())
+    for cache in caches:
+        try:
+            cache.flush()
+        except OSError:  # pragma: no cover - best effort at shutdown
+            pass
+
+
+atexit.register(flush_all)
+
+
+def _iter_shards(root: Path) -> Iterable[dict[str, Any]]:
+    base = Path(root) / EMBEDDINGS_SUBDIR
+    if not base.exists():
+        return
+    for namespace_dir in sorted(path for path in base.iterdir() if path.is_dir()):
+        for index_path in sorted(namespace_dir.glob(f"*{INDEX_SUFFIX}")):
+            meta = _read_index(index_path)
+            if meta is None:
+                continue
+            shard_id = index_path.name[: -len(INDEX_SUFFIX)]
+            shard_path = namespace_dir / f"{shard_id}{SHARD_SUFFIX}"
+            size = index_path.stat().st_size if index_path.exists() else 0
+            if shard_path.exists():
+                size += shard_path.stat().st_size
+            yield {
+                "namespace": namespace_dir.name,
+                "provider": meta.get("provider"),
+                "model": meta.get("model"),
+                "count": int(meta.get("count", len(meta.get("keys", [])))),
+                "created": float(meta.get("created", 0.0)),
+                "bytes": size,
+                "index_path": index_path,
+                "shard_path": shard_path,
+            }
+
+
+def _remove_shard(shard: dict[str, Any]) -> int:
+    # Remove the index first so readers never see an index without its data.
+    freed = 0
+    for path in (shard["index_path"], shard["shard_path"]):
+        try:
+            freed += path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            continue
+    return freed
+
+
+def _read_index(path: Path) -> Optional[dict[str, Any]]:
+    try:
+        meta = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return None
+    return meta if isinstance(meta, dict) else None
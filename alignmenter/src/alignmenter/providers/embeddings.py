@@ -3,21 +3,42 @@
 from __future__ import annotations
 
 import os
-from typing import Optional
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Sequence
 
-try:  # pragma: no cover
-    from sentence_transformers import SentenceTransformer
-except ImportError:  # pragma: no cover
-    SentenceTransformer = None  # type: ignore
-
-try:  # pragma: no cover
-    from openai import OpenAI
-except ImportError:  # pragma: no cover
-    OpenAI = None  # type: ignore
+import numpy as np
 
+from alignmenter.utils.imports import optional_import
 
 from .base import EmbeddingProvider, parse_provider_model
 
+if TYPE_CHECKING:  # pragma: no cover
+    from openai import OpenAI as _OpenAI
+
+    from .embedding_cache import EmbeddingDiskCache
+
+# Heavy SDKs are imported on first use (sentence-transformers pulls in torch);
+# tests patch these names directly.
+SentenceTransformer = None  # type: ignore
+OpenAI = None  # type: ignore
+
+DEFAULT_EMBEDDING_BATCH_SIZE = 64
+
+
+def _sentence_transformer_class():
+    global SentenceTransformer
+    if SentenceTransformer is None:
+        SentenceTransformer = optional_import("sentence_transformers", "SentenceTransformer")
+    return SentenceTransformer
+
+
+def _openai_client_class():
+    global OpenAI
+    if OpenAI is None:
+        OpenAI = optional_import("openai", "OpenAI")
+    return OpenAI
+
 
 class SentenceTransformerProvider(EmbeddingProvider):
     """Local embedding provider via sentence-transformers."""
@@ -25,16 +46,19 @@ class SentenceTransformerProvider(EmbeddingProvider):
     name = "sentence-transformer"
 
     def __init__(self, model: str = "sentence-transformers/all-MiniLM-L6-v2") -> None:
-        if SentenceTransformer is None:
+        model_class = _sentence_transformer_class()
+        if model_class is None:
             raise RuntimeError(
                 "sentence-transformers is required. Install with 'pip install sentence-transformers'."
             )
         self.model_name = model
-        self._model = SentenceTransformer(model)
+        self._model = model_class(model)
+
+    def embed_array(self, texts: list[str]) -> np.ndarray:
+        return as_float32_matrix(self._model.encode(texts, convert_to_numpy=True))
 
     def embed(self, texts: list[str]) -> list[list[float]]:
-        vectors = self._model.encode(texts, convert_to_numpy=False)
-        return [list(map(float, vector)) for vector in vectors]
+        return self.embed_array(texts).tolist()
 
 
 class OpenAIEmbeddingProvider(EmbeddingProvider):
@@ -42,23 +66,27 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
 
     name = "openai"
 
-    def __init__(self, model: str, client: Optional[OpenAI] = None) -> None:
-        if OpenAI is None:
+    def __init__(self, model: str, client: Optional["_OpenAI"] = None) -> None:
+        client_class = _openai_client_class()
+        if client_class is None:
             raise RuntimeError("The 'openai' package is required for OpenAI embeddings.")
         self.model_name = model
         api_key = os.getenv("OPENAI_API_KEY")
-        self._client = client or OpenAI(api_key=api_key)
+        self._client = client or client_class(api_key=api_key)
 
     @classmethod
-    def from_identifier(cls, identifier: str, client: Optional[OpenAI] = None) -> "OpenAIEmbeddingProvider":
+    def from_identifier(cls, identifier: str, client: Optional["_OpenAI"] = None) -> "OpenAIEmbeddingProvider":
         provider, model = parse_provider_model(identifier)
         if provider != cls.name:
             raise ValueError(f"Expected provider 'openai', got '{provider}'.")
         return cls(model=model, client=client)
 
-    def embed(self, texts: list[str]) -> list[list[float]]:
+    def embed_array(self, texts: list[str]) -> np.ndarray:
         response = self._client.embeddings.create(model=self.model_name, input=texts)
-        return [row.embedding for row in response.data]
+        return as_float32_matrix([row.embedding for row in response.data])
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        return self.embed_array(texts).tolist()
 
 
 class PassthroughEmbeddingProvider(EmbeddingProvider):
@@ -66,6 +94,9 @@ class PassthroughEmbeddingProvider(EmbeddingProvider):
 
     name = "hashed"
 
+    def embed_array(self, texts: list[str]) -> np.ndarray:
+        return hashed_matrix(texts)
+
     def embed(self, texts: list[str]) -> list[list[float]]:
         return [hashed_vector(text) for text in texts]
 
@@ -83,44 +114,211 @@ def hashed_vector(text: str, buckets: int = 512) -> list[float]:
     return vector
 
 
+def hashed_matrix(texts: Sequence[str], buckets: int = 512) -> np.ndarray:
+    """Batch form of :func:`hashed_vector`: one normalised float32 row per text."""
+
+    from alignmenter.utils import stable_hash
+
+    bucket_of: dict[str, int] = {}
+    rows: list[int] = []
+    columns: list[int] = []
+    for row, text in enumerate(texts):
+        for token in text.split():
+            bucket = bucket_of.get(token)
+            if bucket is None:
+                bucket = bucket_of[token] = stable_hash(token, buckets)
+            rows.append(row)
+            columns.append(bucket)
+
+    counts = np.zeros((len(texts), buckets), dtype=np.float64)
+    np.add.at(counts, (np.asarray(rows, dtype=np.intp), np.asarray(columns, dtype=np.intp)), 1.0)
+    norms = np.linalg.norm(counts, axis=1, keepdims=True)
+    np.divide(counts, norms, out=counts, where=norms > 0)
+    return counts.astype(np.float32)
+
+
+class PersistentEmbeddingProvider(EmbeddingProvider):
+    """Stores embeddings on disk so they survive across runs."""
+
+    def __init__(self, base: EmbeddingProvider, cache: "EmbeddingDiskCache") -> None:
+        self._base = base
+        self._cache = cache
+        self.name = base.name
+        self.model_name = getattr(base, "model_name", base.name)
+
+    def embed_array(self, texts: list[str]) -> np.ndarray:
+        from .embedding_cache import text_digest
+
+        digests = [text_digest(text) for text in texts]
+        vectors = self._cache.get_many(digests)
+
+        missing: dict[str, str] = {}
+        for digest, text, vector in zip(digests, texts, vectors):
+            if vector is None:
+                missing.setdefault(digest, text)
+
+        if missing:
+            new_vectors = embed_matrix(self._base, list(missing.values()))
+            self._cache.put_many(list(missing.keys()), new_vectors)
+            fresh = dict(zip(missing.keys(), new_vectors))
+            vectors = [vector if vector is not None else fresh[digest] for digest, vector in zip(digests, vectors)]
+
+        return as_float32_matrix(vectors)
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        return self.embed_array(texts).tolist()
+
+
 class CachedEmbeddingProvider(EmbeddingProvider):
     """Caches embeddings for repeated text inputs."""
 
     def __init__(self, base: EmbeddingProvider) -> None:
         self._base = base
         self.name = base.name
-        self._cache: dict[str, list[float]] = {}
-
-    def embed(self, texts: list[str]) -> list[list[float]]:
-        results: list[list[float]] = []
-        missing: list[str] = []
+        self._cache: dict[str, np.ndarray] = {}
 
-        for text in texts:
-            if text in self._cache:
-                results.append(self._cache[text])
-            else:
-                missing.append(text)
+    def embed_array(self, texts: list[str]) -> np.ndarray:
+        missing = list(dict.fromkeys(text for text in texts if text not in self._cache))
 
         if missing:
-            new_vectors = self._base.embed(missing)
+            new_vectors = embed_matrix(self._base, missing)
             for text, vector in zip(missing, new_vectors):
-                stored = list(vector)
-                self._cache[text] = stored
+                self._cache[text] = vector
 
-        return [self._cache[text] for text in texts]
+        return as_float32_matrix([self._cache[text] for text in texts])
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        return self.embed_array(texts).tolist()
+
+
+def as_float32_matrix(vectors) -> np.ndarray:
+    """Coerce embedder output to a C-contiguous ``(n, dim)`` float32 matrix."""
+
+    if isinstance(vectors, np.ndarray):
+        matrix = vectors
+    elif len(vectors) == 0:
+        return np.zeros((0, 0), dtype=np.float32)
+    else:
+        matrix = np.stack([np.asarray(vector, dtype=np.float32) for vector in vectors])
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    return np.ascontiguousarray(matrix, dtype=np.float32)
+
+
+def embed_matrix(embedder: EmbeddingProvider, texts: Sequence[str]) -> np.ndarray:
+    """Embed *texts* as a float32 matrix.
+
+    Uses the provider's ``embed_array`` fast path when available and falls back
+    to the list-returning ``embed`` for third-party providers.
+    """
+
+    texts = list(texts)
+    if not texts:
+        return np.zeros((0, 0), dtype=np.float32)
+    embed_array = getattr(embedder, "embed_array", None)
+    if embed_array is not None:
+        return as_float32_matrix(embed_array(texts))
+    return as_float32_matrix(embedder.embed(texts))
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length; all-zero rows are left as zeros."""
+
+    matrix = np.asarray(matrix, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def embed_in_batches(
+    embedder: EmbeddingProvider,
+    texts: Sequence[str],
+    batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+) -> np.ndarray:
+    """Embed *texts* in chunks of ``batch_size`` into one float32 matrix."""
+
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1.")
+    chunks = [embed_matrix(embedder, texts[start : start + batch_size]) for start in range(0, len(texts), batch_size)]
+    if not chunks:
+        return np.zeros((0, 0), dtype=np.float32)
+    return np.ascontiguousarray(np.vstack(chunks), dtype=np.float32)
+
+
+_REGISTRY: dict[tuple[str, str, Optional[str]], EmbeddingProvider] = {}
+_REGISTRY_LOCK = threading.Lock()
 
 
 def load_embedding_provider(identifier: Optional[str]) -> EmbeddingProvider:
+    """Return the shared provider for *identifier*, loading it on first use.
+
+    Every scorer in the process (authenticity, stability, primary and compare
+    bundles) receives the same instance, so each model is loaded once and
+    repeated texts are embedded once.
+    """
+
+    provider_name, model = _resolve_embedding_identifier(identifier)
+    cache_root = _disk_cache_root() if provider_name != PassthroughEmbeddingProvider.name else None
+    key = (provider_name, model, str(cache_root) if cache_root else None)
+
+    with _REGISTRY_LOCK:
+        provider = _REGISTRY.get(key)
+        if provider is None:
+            provider = _build_embedding_provider(provider_name, model, cache_root)
+            _REGISTRY[key] = provider
+        return provider
+
+
+def clear_embedding_registry() -> None:
+    """Forget shared providers (mainly for tests and long-lived processes)."""
+
+    with _REGISTRY_LOCK:
+        _REGISTRY.clear()
+
+
+def _resolve_embedding_identifier(identifier: Optional[str]) -> tuple[str, str]:
     if identifier in (None, "", "hashed"):
-        provider = PassthroughEmbeddingProvider()
+        return PassthroughEmbeddingProvider.name, ""
+    provider_name, model = parse_provider_model(identifier)
+    if provider_name not in (OpenAIEmbeddingProvider.name, SentenceTransformerProvider.name):
+        raise ValueError(f"Unsupported embedding provider: {identifier}")
+    return provider_name, model
+
+
+def _build_embedding_provider(provider_name: str, model: str, cache_root: Optional[Path]) -> EmbeddingProvider:
+    if provider_name == PassthroughEmbeddingProvider.name:
+        return CachedEmbeddingProvider(PassthroughEmbeddingProvider())
+
+    if provider_name == OpenAIEmbeddingProvider.name:
+        provider: EmbeddingProvider = OpenAIEmbeddingProvider(model=model)
     else:
-        provider_name, model = parse_provider_model(identifier)
-        if provider_name == "openai":
-            provider = OpenAIEmbeddingProvider(model=model)
-        elif provider_name == "sentence-transformer":
-            name = model or "sentence-transformers/all-MiniLM-L6-v2"
-            provider = SentenceTransformerProvider(model=name)
-        else:
-            raise ValueError(f"Unsupported embedding provider: {identifier}")
+        provider = SentenceTransformerProvider(model=model or "sentence-transformers/all-MiniLM-L6-v2")
 
+    if cache_root is not None:
+        provider = PersistentEmbeddingProvider(provider, _open_disk_cache(provider, cache_root))
     return CachedEmbeddingProvider(provider)
+
+
+def _disk_cache_root() -> Optional[Path]:
+    from alignmenter.config import get_settings
+
+    settings = get_settings()
+    if not settings.embedding_cache or not settings.cache_dir:
+        return None
+    return Path(settings.cache_dir).expanduser()
+
+
+def _open_disk_cache(provider: EmbeddingProvider, root: Path) -> "EmbeddingDiskCache":
+    from alignmenter.config import get_settings
+
+    from .embedding_cache import open_disk_cache
+
+    settings = get_settings()
+    max_bytes = int(settings.cache_max_mb * 1024 * 1024) if settings.cache_max_mb else None
+    return open_disk_cache(
+        root,
+        provider.name,
+        getattr(provider, "model_name", provider.name),
+        max_bytes=max_bytes,
+    )
@@ -0,0 +1,187 @@
+"""Persistent judge response cache backed by SQLite."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+JUDGE_SUBDIR = "judge"
+DATABASE_NAME = "responses.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    created REAL NOT NULL,
+    response TEXT NOT NULL
+)
+"""
+
+
+def judge_cache_key(
+    provider: str,
+    model: str,
+    system_prompt: str,
+    prompt: str,
+    params: Optional[dict[str, Any]] = None,
+) -> str:
+    """Return the content address for one judge request.
+
+    Everything that can change the model's answer is part of the key, so
+    editing the system prompt or decoding parameters naturally invalidates
+    old entries.
+    """
+
+    payload = json.dumps(
+        {
+            "provider": provider,
+            "model": model,
+            "system": system_prompt,
+            "prompt_sha256": hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+            "params": params or {},
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Provider responses keyed by request, shared across runs and processes.
+
+    SQLite in WAL mode lets concurrent processes read while one writes.
+    Entries older than ``ttl_seconds`` are treated as misses and replaced on
+    the next write. Subclasses choose where under *root* the database lives.
+    """
+
+    subdir = JUDGE_SUBDIR
+    database_name = DATABASE_NAME
+
+    def __init__(self, root: Path, *, ttl_seconds: Optional[float] = None) -> None:
+        self.root = Path(root)
+        self.path = self.root / self.subdir / self.database_name
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached response for *key*, or ``None`` on a miss."""
+
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT created, response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            response = None
+            if row is not None and not self._expired(row[0]):
+                try:
+                    response = json.loads(row[1])
+                except json.JSONDecodeError:
+                    response = None
+            if isinstance(response, dict):
+                self.hits += 1
+                return response
+            self.misses += 1
+            return None
+
+    def put(self, key: str, provider: str, model: str, response: dict) -> None:
+        """Store *response* for *key*, replacing any older entry."""
+
+        payload = json.dumps(response, default=str)
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, provider, model, created, response) VALUES (?, ?, ?, ?, ?)",
+                (key, provider, model, time.time(), payload),
+            )
+            connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _expired(self, created: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - created > self.ttl_seconds
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = _open_database(self.path)
+        return self._connection
+
+
+class JudgeResponseCache(ResponseCache):
+    """Judge responses stored under ``<root>/judge``."""
+
+
+def judge_cache_stats(root: Path) -> dict[str, Any]:
+    """Summarise the judge cache stored under *root*."""
+
+    path = Path(root) / JUDGE_SUBDIR / DATABASE_NAME
+    models: dict[str, int] = {}
+    if path.exists():
+        connection = _open_database(path)
+        try:
+            for provider, model, count in connection.execute(
+                "SELECT provider, model, COUNT(*) FROM responses GROUP BY provider, model ORDER BY provider, model"
+            ):
+                models[f"{provider}:{model}"] = count
+        finally:
+            connection.close()
+    return {
+        "path": str(path),
+        "models": models,
+        "entries": sum(models.values()),
+        "bytes": _database_bytes(path),
+    }
+
+
+def prune_judge_cache(root: Path, *, older_than_seconds: float) -> dict[str, int]:
+    """Delete judge responses older than *older_than_seconds*."""
+
+    path = Path(root) / JUDGE_SUBDIR / DATABASE_NAME
+    if not path.exists():
+        return {"removed_entries": 0}
+    connection = _open_database(path)
+    try:
+        cursor = connection.execute(
+            "DELETE FROM responses WHERE created < ?", (time.time() - older_than_seconds,)
+        )
+        connection.commit()
+        removed = cursor.rowcount
+        connection.execute("VACUUM")
+    finally:
+        connection.close()
+    return {"removed_entries": removed}
+
+
+def clear_judge_cache(root: Path) -> dict[str, int]:
+    """Delete every cached judge response under *root*."""
+
+    stats = judge_cache_stats(root)
+    directory = Path(root) / JUDGE_SUBDIR
+    for candidate in directory.glob(f"{DATABASE_NAME}*"):
+        candidate.unlink(missing_ok=True)
+    return {"removed_entries": stats["entries"], "freed_bytes": stats["bytes"]}
+
+
+def _open_database(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute(_SCHEMA)
+    return connection
+
+
+def _database_bytes(path: Path) -> int:
+    total = 0
+    for candidate in path.parent.glob(f"{path.name}*") if path.parent.exists() else ():
+        total += candidate.stat().st_size
+    return total
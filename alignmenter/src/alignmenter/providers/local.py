@@ -22,6 +22,7 @@ class LocalProvider:
         model: Optional[str] = None,
         api_key: Optional[str] = None,
         timeout: float = 30.0,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         if not endpoint:
             raise ValueError("endpoint is required for LocalProvider")
@@ -29,6 +30,8 @@ class LocalProvider:
         self.default_model = model
         self.timeout = timeout
         self.api_key = api_key or os.getenv("ALIGNMENTER_LOCAL_API_KEY") or os.getenv("OPENAI_API_KEY")
+        # Self-hosted servers often handle one request at a time; opt in to more.
+        self.max_concurrency = max(1, int(max_concurrency or os.getenv("ALIGNMENTER_LOCAL_MAX_CONCURRENCY") or 1))
 
     @classmethod
     def from_identifier(cls, identifier: str) -> "LocalProvider":
@@ -4,35 +4,43 @@ from __future__ import annotations
 
 from typing import Any, Optional, TYPE_CHECKING
 
-try:  # pragma: no cover - import guard
-    from openai import OpenAI  # type: ignore
-except ImportError:  # pragma: no cover - handled at runtime
-    OpenAI = None  # type: ignore
-
 if TYPE_CHECKING:  # pragma: no cover
     from openai import OpenAI as _OpenAI
 
 from alignmenter.config import get_settings
+from alignmenter.utils.imports import optional_import
 
 from .base import ChatResponse, parse_provider_model
 
+# The SDK is imported on first use so loading this module stays cheap.
+OpenAI = None  # type: ignore
+
+
+def _openai_client_class():
+    global OpenAI
+    if OpenAI is None:
+        OpenAI = optional_import("openai", "OpenAI")
+    return OpenAI
+
 
 class OpenAIProvider:
     """Adapter for OpenAI Chat Completions API."""
 
     name = "openai"
+    max_concurrency = 8
 
     def __init__(self, model: str, client: Optional["_OpenAI"] = None) -> None:
         self.model = model
         if client is not None:
             self._client = client
         else:
-            if OpenAI is None:
+            client_class = _openai_client_class()
+            if client_class is None:
                 raise RuntimeError(
                     "The 'openai' package is required for OpenAIProvider. Install with 'pip install openai'."
                 )
             settings = get_settings()
-            self._client = OpenAI(api_key=settings.openai_api_key)
+            self._client = client_class(api_key=settings.openai_api_key)
 
     @classmethod
     def from_model_identifier(cls, identifier: str, client: Optional["_OpenAI"] = None) -> "OpenAIProvider":
@@ -62,9 +70,11 @@ class OpenAICustomGPTProvider:
     """Adapter for OpenAI Custom GPTs via the Responses API."""
 
     name = "openai-gpt"
+    max_concurrency = 1
 
     def __init__(self, gpt_id: str, client: Optional["_OpenAI"] = None) -> None:
-        if OpenAI is None:
+        client_class = _openai_client_class()
+        if client_class is None:
             raise RuntimeError(
                 "The 'openai' package is required for Custom GPT support. Install with 'pip install openai'."
             )
@@ -73,7 +83,7 @@ class OpenAICustomGPTProvider:
             self._client = client
         else:
             settings = get_settings()
-            self._client = OpenAI(api_key=settings.openai_api_key)
+            self._client = client_class(api_key=settings.openai_api_key)
 
     @classmethod
     def from_model_identifier(cls, identifier: str, client: Optional["_OpenAI"] = None) -> "OpenAICustomGPTProvider":
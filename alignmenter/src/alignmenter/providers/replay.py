@@ -0,0 +1,147 @@
+"""Record/replay cache for chat provider calls."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from .base import ChatProvider, ChatResponse, parse_provider_model
+from .judge_cache import ResponseCache
+
+REPLAY_MODES = ("record", "replay", "record-missing")
+DEFAULT_REPLAY_MODE = "record-missing"
+# Replayed responses are read from disk, so any requested concurrency is safe.
+REPLAY_MAX_CONCURRENCY = 64
+REPLAY_SUBDIR = "replay"
+
+
+class ReplayMissError(RuntimeError):
+    """Raised in ``replay`` mode when a chat call was never recorded."""
+
+
+class ChatReplayCache(ResponseCache):
+    """Recorded chat responses stored under ``<root>/replay``."""
+
+    subdir = REPLAY_SUBDIR
+    database_name = "chat.sqlite3"
+
+
+def chat_cache_key(provider: str, model: str, messages: list[dict[str, Any]], params: Optional[dict[str, Any]] = None) -> str:
+    """Return the content address for one chat request.
+
+    Messages and decoding parameters are serialised canonically (sorted keys,
+    no whitespace) so equal requests hash equally regardless of dict order.
+    """
+
+    payload = json.dumps(
+        {"provider": provider, "model": model, "messages": messages, "params": params or {}},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ReplayChatProvider:
+    """Wrap a chat provider so identical requests are served from disk.
+
+    ``record`` always calls the provider and overwrites the stored response,
+    ``replay`` never calls it and raises :class:`ReplayMissError` on a miss,
+    and ``record-missing`` calls it only for requests not yet recorded. In
+    ``replay`` mode *base* may be ``None`` so runs work without credentials.
+    """
+
+    def __init__(
+        self,
+        base: Optional[ChatProvider],
+        cache: ChatReplayCache,
+        *,
+        mode: str = DEFAULT_REPLAY_MODE,
+        name: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> None:
+        if mode not in REPLAY_MODES:
+            raise ValueError(f"Unknown replay mode '{mode}' (expected one of: {', '.join(REPLAY_MODES)}).")
+        if base is None and mode != "replay":
+            raise ValueError(f"Replay mode '{mode}' needs a provider to record from.")
+        self._base = base
+        self.cache = cache
+        self.mode = mode
+        self.name = name or getattr(base, "name", "provider")
+        self.model = str(model or getattr(base, "model", "") or "")
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_model_identifier(
+        cls,
+        identifier: str,
+        base: Optional[ChatProvider],
+        cache: ChatReplayCache,
+        *,
+        mode: str = DEFAULT_REPLAY_MODE,
+    ) -> "ReplayChatProvider":
+        provider, model = parse_provider_model(identifier)
+        return cls(base, cache, mode=mode, name=provider, model=model)
+
+    @property
+    def max_concurrency(self) -> int:
+        if self.mode == "replay":
+            return REPLAY_MAX_CONCURRENCY
+        return getattr(self._base, "max_concurrency", None) or 1
+
+    def chat(self, messages: list[dict[str, Any]], **kwargs: Any) -> ChatResponse:
+        key = chat_cache_key(self.name, self.model, messages, kwargs)
+        if self.mode != "record":
+            stored = self.cache.get(key)
+            with self._lock:
+                if stored is not None:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+            if stored is not None:
+                return ChatResponse(text=stored.get("text", ""), usage=stored.get("usage"))
+            if self.mode == "replay":
+                raise ReplayMissError(
+                    f"No recorded response for {self.name}:{self.model} (key {key[:12]}); "
+                    "re-run with replay mode 'record-missing' to record it."
+                )
+
+        response = self._base.chat(messages, **kwargs)
+        self.cache.put(key, self.name, self.model, {"text": response.text, "usage": response.usage})
+        with self._lock:
+            self.recorded += 1
+        return response
+
+    def tokenizer(self) -> Optional[Any]:
+        return self._base.tokenizer() if self._base is not None else None
+
+    @property
+    def replay_stats(self) -> dict[str, Any]:
+        """Hits, misses and newly recorded responses for this provider.
+
+        Counts are kept per wrapper, so a primary and a compare provider
+        sharing one cache report their own lookups.
+        """
+
+        with self._lock:
+            hits, misses, recorded = self.hits, self.misses, self.recorded
+        lookups = hits + misses
+        return {
+            "mode": self.mode,
+            "hits": hits,
+            "misses": misses,
+            "recorded": recorded,
+            "hit_rate": hits / lookups if lookups else None,
+        }
+
+
+def open_replay_cache(directory: Path) -> ChatReplayCache:
+    """Open the replay store rooted at *directory*."""
+
+    return ChatReplayCache(Path(directory).expanduser())
@@ -52,6 +52,50 @@ def load_run_options(path: Path) -> dict[str, Any]:
     if embedding:
         options["embedding"] = embedding
 
+    concurrency = data.get("concurrency")
+    providers_section = data.get("providers")
+    if concurrency is None and isinstance(providers_section, dict):
+        concurrency = providers_section.get("concurrency")
+    if concurrency is not None:
+        options["concurrency"] = int(concurrency)
+
+    context = data.get("context")
+    if context is None and isinstance(providers_section, dict):
+        context = providers_section.get("context")
+    if isinstance(context, dict):
+        options["context_policy"] = dict(context)
+
+    replay = data.get("replay")
+    if replay is None and isinstance(providers_section, dict):
+        replay = providers_section.get("replay")
+    if isinstance(replay, str):
+        replay = {"mode": replay}
+    if isinstance(replay, dict) and replay.get("mode"):
+        options["replay_mode"] = str(replay["mode"]).lower()
+        if replay.get("dir"):
+            options["replay_dir"] = _resolve(base, replay["dir"])
+
+    authenticity_section = data.get("scorers", {}).get("authenticity", {})
+    batch_size = data.get("embedding_batch_size")
+    if batch_size is None and isinstance(authenticity_section, dict):
+        batch_size = authenticity_section.get("batch_size")
+    if batch_size is not None:
+        options["embedding_batch_size"] = int(batch_size)
+    if isinstance(authenticity_section, dict):
+        if authenticity_section.get("bootstrap_iterations") is not None:
+            options["bootstrap_iterations"] = int(authenticity_section["bootstrap_iterations"])
+        if authenticity_section.get("ci_method"):
+            options["ci_method"] = str(authenticity_section["ci_method"]).lower()
+
+    stability_section = data.get("scorers", {}).get("stability", {})
+    if isinstance(stability_section, dict):
+        if stability_section.get("mode"):
+            options["stability_mode"] = str(stability_section["mode"]).lower()
+        if stability_section.get("window") is not None:
+            options["stability_window"] = int(stability_section["window"])
+        if stability_section.get("drift_threshold") is not None:
+            options["stability_drift_threshold"] = float(stability_section["drift_threshold"])
+
     judge_section = data.get("judge")
     safety_section = data.get("scorers", {}).get("safety", {})
     if not isinstance(judge_section, dict):
@@ -74,6 +118,12 @@ def load_run_options(path: Path) -> dict[str, Any]:
             options["judge_estimated_prompt_tokens_per_call"] = judge_section.get("estimated_prompt_tokens_per_call")
         if judge_section.get("estimated_completion_tokens_per_call") is not None:
             options["judge_estimated_completion_tokens_per_call"] = judge_section.get("estimated_completion_tokens_per_call")
+        if judge_section.get("max_in_flight") is not None:
+            options["judge_max_in_flight"] = int(judge_section["max_in_flight"])
+        if judge_section.get("pack_size") is not None:
+            options["judge_pack_size"] = int(judge_section["pack_size"])
+        if judge_section.get("pairwise") is not None:
+            options["judge_pairwise"] = bool(judge_section["pairwise"])
         if judge_section.get("offline_classifier"):
             options["safety_classifier"] = judge_section.get("offline_classifier")
 
@@ -93,6 +143,12 @@ def load_run_options(path: Path) -> dict[str, Any]:
     safety_section = data.get("scorers", {}).get("safety", {})
     if isinstance(safety_section, dict) and safety_section.get("offline_classifier") and options.get("safety_classifier") is None:
         options["safety_classifier"] = safety_section.get("offline_classifier")
+    if isinstance(safety_section, dict) and safety_section.get("classifier_batch_size") is not None:
+        options["classifier_batch_size"] = int(safety_section["classifier_batch_size"])
+    if isinstance(safety_section, dict) and safety_section.get("judge_strategy"):
+        options["judge_strategy"] = str(safety_section["judge_strategy"]).lower()
+    if isinstance(safety_section, dict) and isinstance(safety_section.get("cascade"), dict):
+        options["safety_cascade"] = dict(safety_section["cascade"])
     if options.get("safety_classifier") is None and data.get("safety_classifier"):
         options["safety_classifier"] = data.get("safety_classifier")
 
@@ -3,7 +3,13 @@
 from __future__ import annotations
 
 import copy
-from dataclasses import dataclass
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
@@ -11,7 +17,86 @@ from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from alignmenter.providers.base import ChatProvider
 from alignmenter.reporting.html import HTMLReporter
 from alignmenter.reporting.json_out import JSONReporter
+from alignmenter.scorers.base import supports_grouping
 from alignmenter.utils.io import read_jsonl, write_json, write_jsonl
+from alignmenter.utils.tokens import estimate_tokens
+
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 4
+JOURNAL_DIR = "journal"
+
+CONTEXT_MODES = ("full", "window", "tokens")
+
+
+@dataclass(frozen=True)
+class ContextPolicy:
+    """How much conversation history is resent when generating a turn.
+
+    ``full`` sends the whole conversation so far. ``window`` keeps the last
+    ``max_turns`` messages and ``tokens`` keeps the most recent messages whose
+    estimated size fits in ``max_tokens``. Under both, system messages stay
+    pinned in front when ``pin_system`` is set, the message being answered is
+    always sent, and history never starts on an assistant message.
+    """
+
+    mode: str = "full"
+    max_turns: Optional[int] = None
+    max_tokens: Optional[int] = None
+    pin_system: bool = True
+
+    def __post_init__(self) -> None:
+        if self.mode not in CONTEXT_MODES:
+            raise ValueError(f"Unknown context mode '{self.mode}' (expected one of: {', '.join(CONTEXT_MODES)}).")
+        if self.mode == "window" and (self.max_turns is None or self.max_turns < 1):
+            raise ValueError("context mode 'window' needs max_turns of at least 1.")
+        if self.mode == "tokens" and (self.max_tokens is None or self.max_tokens < 1):
+            raise ValueError("context mode 'tokens' needs max_tokens of at least 1.")
+
+    @classmethod
+    def from_config(cls, config: Optional[dict[str, Any]]) -> Optional["ContextPolicy"]:
+        """Build a policy from a run config section; ``None`` means send everything."""
+
+        if not config:
+            return None
+        mode = str(config.get("mode") or "full").lower()
+        if mode == "full":
+            return None
+        max_turns = config.get("max_turns")
+        max_tokens = config.get("max_tokens")
+        return cls(
+            mode=mode,
+            max_turns=int(max_turns) if max_turns is not None else None,
+            max_tokens=int(max_tokens) if max_tokens is not None else None,
+            pin_system=bool(config.get("pin_system", True)),
+        )
+
+    def select(self, roles: List[str], tokens: List[int]) -> List[int]:
+        """Return the indices of the messages to send, in conversation order."""
+
+        pinned = [index for index, role in enumerate(roles) if role == "system"] if self.pin_system else []
+        pinned_set = set(pinned)
+        history = [index for index in range(len(roles)) if index not in pinned_set]
+        if self.mode == "full" or not history:
+            return list(range(len(roles)))
+
+        if self.mode == "window":
+            kept = history[-self.max_turns :]
+        else:
+            budget = self.max_tokens - sum(tokens[index] for index in pinned)
+            kept = [history[-1]]
+            budget -= tokens[history[-1]]
+            for index in reversed(history[:-1]):
+                if tokens[index] > budget:
+                    break
+                budget -= tokens[index]
+                kept.append(index)
+            kept.reverse()
+
+        while len(kept) > 1 and roles[kept[0]] == "assistant":
+            kept.pop(0)
+        return sorted(pinned + kept)
 
 
 @dataclass
@@ -25,11 +110,14 @@ class RunConfig:
     compare_model: Optional[str] = None
     report_out_dir: Path = Path("reports")
     include_raw: bool = True
+    concurrency: int = DEFAULT_CONCURRENCY
+    context_policy: Optional[ContextPolicy] = None
 
     def __post_init__(self) -> None:
         self.dataset_path = Path(self.dataset_path)
         self.persona_path = Path(self.persona_path)
         self.report_out_dir = Path(self.report_out_dir)
+        self.concurrency = max(1, int(self.concurrency))
 
 
 @dataclass
@@ -59,6 +147,10 @@ class Runner:
         progress_callback: Optional[Callable[[int], None]] = None,
         compare_progress_callback: Optional[Callable[[int], None]] = None,
         thresholds: Optional[dict[str, dict[str, float]]] = None,
+        pairwise_judge: Optional[Any] = None,
+        pairwise_options: Optional[dict[str, Any]] = None,
+        resume_dir: Optional[Path] = None,
+        judge_provider: Optional[Any] = None,
     ) -> None:
         self.config = config
         self.scorers = list(scorers)
@@ -75,6 +167,10 @@ class Runner:
             compare_progress_callback if self.compare_generate else None
         )
         self.thresholds = thresholds or {}
+        self.pairwise_judge = pairwise_judge
+        self.pairwise_options = dict(pairwise_options or {})
+        self.judge_provider = judge_provider
+        self.resume_dir = Path(resume_dir) if resume_dir is not None else None
         self.latest_results: Optional[dict[str, Any]] = None
         self.threshold_results: dict[str, dict[str, Any]] = {}
         self.analytics: dict[str, Any] = {}
@@ -84,28 +180,56 @@ class Runner:
 
         records = load_dataset(self.config.dataset_path)
 
-        primary_records, primary_usage = self._prepare_transcripts(
-            records,
-            provider=self.provider if self.generate_transcripts else None,
-            model_identifier=self.config.model,
-            progress_callback=self.progress_callback,
-        )
-        primary_sessions = group_sessions(primary_records)
+        # The run directory exists up front so generated sessions can be
+        # journaled as they finish and a crashed run can be resumed.
+        if self.resume_dir is not None:
+            run_dir = self.resume_dir
+        else:
+            run_dir = prepare_run_directory(self.config.report_out_dir, _utc_now(), self.config.run_id)
 
         compare_records: Optional[list[dict[str, Any]]] = None
         compare_usage: dict[str, int] = {}
         compare_sessions: Optional[list[Session]] = None
 
-        if self.compare_scorers:
-            compare_records, compare_usage = self._prepare_transcripts(
+        # Compare transcripts are generated alongside the primary ones so the
+        # two providers' network waits overlap. If primary generation fails,
+        # the compare side stops at its next session instead of running on.
+        cancel = threading.Event()
+        background = ThreadPoolExecutor(max_workers=1)
+        try:
+            compare_future = None
+            if self.compare_scorers:
+                compare_future = background.submit(
+                    self._prepare_transcripts,
+                    records,
+                    provider=self.compare_provider if self.compare_generate else None,
+                    model_identifier=self.config.compare_model,
+                    progress_callback=self.compare_progress_callback,
+                    journal=self._journal(run_dir, "compare", self.config.compare_model, self.compare_generate),
+                    cancel=cancel,
+                )
+
+            primary_records, primary_usage = self._prepare_transcripts(
                 records,
-                provider=self.compare_provider if self.compare_generate else None,
-                model_identifier=self.config.compare_model,
-                progress_callback=self.compare_progress_callback,
+                provider=self.provider if self.generate_transcripts else None,
+                model_identifier=self.config.model,
+                progress_callback=self.progress_callback,
+                journal=self._journal(run_dir, "primary", self.config.model, self.generate_transcripts),
             )
+            if compare_future is not None:
+                compare_records, compare_usage = compare_future.result()
+        except BaseException:
+            cancel.set()
+            background.shutdown(wait=False, cancel_futures=True)
+            raise
+        background.shutdown()
+
+        primary_sessions = group_sessions(primary_records)
+        if compare_records is not None:
             compare_sessions = group_sessions(compare_records)
 
-        primary_scores = self._run_scorers(self.scorers, primary_sessions)
+        primary_evaluations: dict[str, Any] = {}
+        primary_scores = self._run_scorers(self.scorers, primary_sessions, primary_evaluations)
         score_results: dict[str, Any] = {"primary": primary_scores}
 
         threshold_eval = self._evaluate_thresholds(primary_scores)
@@ -118,14 +242,15 @@ class Runner:
             compare_scores = self._run_scorers(self.compare_scorers, compare_sessions)
             score_results["compare"] = compare_scores
             score_results["diff"] = compute_diffs(primary_scores, compare_scores)
+            if self.pairwise_judge is not None:
+                score_results["pairwise"] = self._run_pairwise(primary_sessions, compare_sessions)
 
-        analytics = self._build_breakdowns(primary_sessions, self.scorers)
+        analytics = self._build_breakdowns(primary_sessions, self.scorers, primary_evaluations)
         if analytics:
             score_results["analytics"] = analytics
             self.analytics = analytics
 
-        run_at = datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
-        run_dir = prepare_run_directory(self.config.report_out_dir, run_at, self.config.run_id)
+        run_at = _utc_now()
 
         transcript_info: dict[str, dict[str, str]] = {}
         transcripts_dir = run_dir / "transcripts"
@@ -164,7 +289,7 @@ class Runner:
         if threshold_eval:
             run_summary["thresholds"] = threshold_eval
 
-        usage_summary: dict[str, dict[str, int]] = {}
+        usage_summary: dict[str, dict[str, Any]] = {}
         if primary_usage:
             usage_summary["primary"] = {"model": self.config.model, **primary_usage}
         if compare_usage:
@@ -172,6 +297,30 @@ class Runner:
         if usage_summary:
             run_summary["usage"] = usage_summary
 
+        judge_cache = {
+            scorer_id: result["judge_cache"]
+            for scorer_id, result in primary_scores.items()
+            if isinstance(result, dict) and isinstance(result.get("judge_cache"), dict)
+        }
+        # Every judge call of the run (safety, compare and pairwise) goes
+        # through the shared provider, so its counters cover them all.
+        provider_cache = getattr(self.judge_provider, "cache_stats", None)
+        if isinstance(provider_cache, dict):
+            judge_cache["all_calls"] = provider_cache
+        if judge_cache:
+            run_summary["judge_cache"] = judge_cache
+
+        replay = {
+            scope: provider.replay_stats
+            for scope, provider, generated in (
+                ("primary", self.provider, self.generate_transcripts),
+                ("compare", self.compare_provider, self.compare_generate),
+            )
+            if generated and hasattr(provider, "replay_stats")
+        }
+        if replay:
+            run_summary["replay"] = replay
+
         write_json(run_dir / "run.json", run_summary)
         scorecards = build_scorecards(
             primary_scores,
@@ -207,10 +356,58 @@ class Runner:
         self.latest_results = score_results
         return run_dir
 
-    def _run_scorers(self, scorers: Iterable, sessions: list[Session]) -> dict:
+    def _journal(
+        self,
+        run_dir: Path,
+        scope: str,
+        model_identifier: Optional[str],
+        generating: bool,
+    ) -> Optional["SessionJournal"]:
+        if not generating:
+            return None
+        return SessionJournal(run_dir / JOURNAL_DIR / f"{scope}.jsonl", model_identifier)
+
+    def _run_pairwise(
+        self,
+        primary_sessions: list[Session],
+        compare_sessions: list[Session],
+    ) -> dict[str, Any]:
+        """Judge matching primary/compare sessions side by side."""
+
+        from alignmenter.judges.authenticity_judge import summarize_pairwise
+
+        compare_by_id = {session.session_id: session for session in compare_sessions}
+        pairs = [
+            {
+                "session_id": session.session_id,
+                "primary_turns": session.turns,
+                "compare_turns": compare_by_id[session.session_id].turns,
+                "scenario_tag": min(session.scenario_tags) if session.scenario_tags else None,
+            }
+            for session in primary_sessions
+            if session.session_id in compare_by_id
+        ]
+        analyses = self.pairwise_judge.compare_sessions(pairs, **self.pairwise_options)
+        summary = summarize_pairwise(analyses)
+        summary["results"] = [asdict(analysis) for analysis in analyses]
+        return summary
+
+    def _run_scorers(
+        self,
+        scorers: Iterable,
+        sessions: list[Session],
+        evaluations: Optional[dict[str, Any]] = None,
+    ) -> dict:
+        """Score *sessions*, keeping per-turn evaluations when a scorer offers them."""
+
         results = {}
         for scorer in scorers:
-            results[scorer.id] = scorer.score(sessions)
+            if evaluations is not None and supports_grouping(scorer):
+                evaluation = scorer.evaluate(sessions)
+                evaluations[scorer.id] = evaluation
+                results[scorer.id] = scorer.summarize(evaluation)
+            else:
+                results[scorer.id] = scorer.score(sessions)
         return results
 
     def _evaluate_thresholds(self, primary_scores: dict) -> dict[str, dict[str, Any]]:
@@ -255,24 +452,42 @@ class Runner:
         return evaluations
 
     def _build_breakdowns(
-        self, sessions: list[Session], scorers: Iterable
+        self,
+        sessions: list[Session],
+        scorers: Iterable,
+        evaluations: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
+        """Summarise scores per scenario and persona.
+
+        Scorers that produced an evaluation for the full run are re-aggregated
+        over each group's session indices; only scorers without the grouping
+        API are run again on the subset.
+        """
+
         breakdowns: dict[str, Any] = {"scenarios": {}, "personas": {}}
+        evaluations = evaluations or {}
+        scorers = list(scorers)
 
-        scenario_groups: dict[str, list[Session]] = {}
-        persona_groups: dict[str, list[Session]] = {}
+        scenario_groups: dict[str, list[int]] = {}
+        persona_groups: dict[str, list[int]] = {}
 
-        for session in sessions:
+        for position, session in enumerate(sessions):
             for scenario in session.scenario_tags:
-                scenario_groups.setdefault(scenario, []).append(session)
+                scenario_groups.setdefault(scenario, []).append(position)
             for persona in session.persona_ids:
-                persona_groups.setdefault(persona, []).append(session)
+                persona_groups.setdefault(persona, []).append(position)
 
-        def summarize(group: list[Session]) -> dict[str, Any]:
+        def summarize(group: list[int]) -> dict[str, Any]:
             if not group:
                 return {}
-            subset = list(group)
-            scores = self._run_scorers(scorers, subset)
+            subset = [sessions[position] for position in group]
+            scores: dict[str, Any] = {}
+            for scorer in scorers:
+                evaluation = evaluations.get(scorer.id)
+                if evaluation is not None and supports_grouping(scorer):
+                    scores[scorer.id] = scorer.summarize(evaluation, group)
+                else:
+                    scores[scorer.id] = scorer.score(subset)
             return {
                 "sessions": len(subset),
                 "turns": sum(len(session.turns) for session in subset),
@@ -294,44 +509,270 @@ class Runner:
         provider: Optional[ChatProvider],
         model_identifier: Optional[str],
         progress_callback: Optional[Callable[[int], None]] = None,
-    ) -> Tuple[List[dict[str, Any]], dict[str, int]]:
+        journal: Optional["SessionJournal"] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> Tuple[List[dict[str, Any]], dict[str, Any]]:
         grouped = _group_records(records)
-        output: List[dict[str, Any]] = []
         usage = _UsageAccumulator()
+        context_policy = self.config.context_policy
 
-        for session_id in grouped:
-            conversation: List[dict[str, str]] = []
-            for turn in grouped[session_id]:
-                record = copy.deepcopy(turn)
-                role = (record.get("role") or "user").strip().lower()
-
-                if role == "assistant" and provider is not None:
-                    baseline = record.get("text")
-                    if baseline:
-                        metadata = _ensure_metadata(record)
-                        metadata.setdefault("baseline_text", baseline)
-
-                    response = provider.chat([dict(msg) for msg in conversation])
-                    generated_text = (response.text or "").strip()
-                    record["text"] = generated_text
-
-                    metadata = _ensure_metadata(record)
-                    metadata["generated_by"] = model_identifier or getattr(provider, "name", "provider")
-                    if response.usage:
-                        metadata["usage"] = response.usage
-                        usage.add(response.usage)
-
-                    conversation.append({"role": "assistant", "content": generated_text})
-                    if progress_callback:
-                        progress_callback(1)
-                else:
-                    conversation.append({"role": role or "user", "content": record.get("text", "")})
+        if progress_callback is not None:
+            progress_callback = _synchronized(progress_callback)
+
+        finished: dict[str, tuple[list[dict[str, Any]], list[dict[str, Any]], int]] = {}
+        stale = []
+        journaled = journal.load() if journal is not None else {}
+        for session_id, (digest, result) in journaled.items():
+            if session_id not in grouped:
+                continue
+            if digest == _session_digest(grouped[session_id]):
+                finished[session_id] = result
+            else:
+                stale.append(session_id)
+        if stale:
+            LOGGER.warning(
+                "Regenerating %d journaled session(s) whose dataset records changed: %s",
+                len(stale),
+                ", ".join(stale[:5]) + (", ..." if len(stale) > 5 else ""),
+            )
+        pending = {session_id: turns for session_id, turns in grouped.items() if session_id not in finished}
+        if finished and progress_callback is not None:
+            progress_callback(
+                sum(
+                    1
+                    for session_id in grouped
+                    if session_id in finished
+                    for record in grouped[session_id]
+                    if (record.get("role") or "").strip().lower() == "assistant"
+                )
+            )
+
+        # Set as soon as a session fails, so queued sessions stop before they
+        # call the provider; *cancel* does the same on behalf of the caller.
+        stop = threading.Event()
+
+        def generate(item: tuple[str, list[dict[str, Any]]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]], int]:
+            session_id, turns = item
+            if stop.is_set() or (cancel is not None and cancel.is_set()):
+                raise GenerationCancelled(f"Generation for {model_identifier or 'provider'} was cancelled.")
+            digest = _session_digest(turns)
+            try:
+                result = _generate_session(
+                    turns,
+                    provider=provider,
+                    model_identifier=model_identifier,
+                    progress_callback=progress_callback,
+                    context_policy=context_policy,
+                )
+            except BaseException:
+                stop.set()
+                raise
+            if journal is not None:
+                journal.append(session_id, digest, *result)
+            return result
+
+        workers = 1
+        if provider is not None:
+            workers = _provider_concurrency(provider, self.config.concurrency)
+        if workers > 1 and len(pending) > 1:
+            # Sessions are independent; turns within a session stay sequential.
+            # The first failure (or Ctrl-C) abandons every queued session
+            # instead of letting the pool drain them on shutdown.
+            pool = ThreadPoolExecutor(max_workers=workers)
+            try:
+                futures = {item[0]: pool.submit(generate, item) for item in pending.items()}
+                wait(list(futures.values()), return_when=FIRST_EXCEPTION)
+                generated = {session_id: future.result() for session_id, future in futures.items()}
+            except BaseException:
+                stop.set()
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+            pool.shutdown()
+        else:
+            generated = {item[0]: generate(item) for item in pending.items()}
+        sessions = [generated.get(session_id) or finished[session_id] for session_id in grouped]
 
-                output.append(record)
+        output: List[dict[str, Any]] = []
+        for session_id, (session_records, session_usage, saved) in zip(grouped, sessions):
+            output.extend(session_records)
+            for turn_usage in session_usage:
+                usage.add(turn_usage)
+            usage.add_saved(session_id, saved)
 
         return output, usage.as_dict()
 
 
+def _generate_session(
+    turns: list[dict[str, Any]],
+    *,
+    provider: Optional[ChatProvider],
+    model_identifier: Optional[str],
+    progress_callback: Optional[Callable[[int], None]],
+    context_policy: Optional[ContextPolicy] = None,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], int]:
+    """Copy one session's records, regenerating assistant turns in order.
+
+    Returns the records, the usage payload of every provider call and the
+    estimated prompt tokens *context_policy* kept out of those calls.
+    """
+
+    conversation: List[dict[str, str]] = []
+    # Per-message token estimates, only needed when history can be trimmed.
+    tokens: List[int] = []
+    output: List[dict[str, Any]] = []
+    usages: List[dict[str, Any]] = []
+    saved = 0
+    for turn in turns:
+        record = copy.deepcopy(turn)
+        role = (record.get("role") or "user").strip().lower()
+
+        if role == "assistant" and provider is not None:
+            baseline = record.get("text")
+            if baseline:
+                metadata = _ensure_metadata(record)
+                metadata.setdefault("baseline_text", baseline)
+
+            if context_policy is None:
+                messages = conversation
+            else:
+                kept = context_policy.select([msg["role"] for msg in conversation], tokens)
+                messages = [conversation[index] for index in kept]
+                saved += sum(tokens) - sum(tokens[index] for index in kept)
+            response = provider.chat([dict(msg) for msg in messages])
+            generated_text = (response.text or "").strip()
+            record["text"] = generated_text
+
+            metadata = _ensure_metadata(record)
+            metadata["generated_by"] = model_identifier or getattr(provider, "name", "provider")
+            if response.usage:
+                metadata["usage"] = response.usage
+                usages.append(response.usage)
+
+            conversation.append({"role": "assistant", "content": generated_text})
+            if progress_callback:
+                progress_callback(1)
+        else:
+            conversation.append({"role": role or "user", "content": record.get("text", "")})
+        if context_policy is not None:
+            tokens.append(estimate_tokens(conversation[-1]["content"] or ""))
+
+        output.append(record)
+    return output, usages, saved
+
+
+class GenerationCancelled(RuntimeError):
+    """Raised inside transcript generation once its run has been abandoned."""
+
+
+class SessionJournal:
+    """Append-only log of sessions whose transcripts finished generating.
+
+    Each line holds one session's records, per-call usage and context savings,
+    flushed and fsynced before the next session is logged, so an interrupted
+    run loses at most the sessions that were still in flight. The first line
+    names the model so a journal is never resumed against another one, and
+    each entry carries a digest of the session's dataset records so a
+    session edited since it was journaled is generated again.
+    """
+
+    def __init__(self, path: Path, model_identifier: Optional[str]) -> None:
+        self.path = Path(path)
+        self.model_identifier = model_identifier
+        self._lock = threading.Lock()
+
+    def load(self) -> dict[str, tuple[Optional[str], tuple[list[dict[str, Any]], list[dict[str, Any]], int]]]:
+        """Return ``(input digest, generated session)`` by id; a torn final line is ignored."""
+
+        sessions: dict[str, tuple[Optional[str], tuple[list[dict[str, Any]], list[dict[str, Any]], int]]] = {}
+        if not self.path.exists():
+            return sessions
+        with self.path.open("r", encoding="utf-8") as handle:
+            for line_number, line in enumerate(handle):
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if line_number == 0 and "journal_model" in entry:
+                    if entry["journal_model"] != self.model_identifier:
+                        raise ValueError(
+                            f"Journal {self.path} was recorded for model "
+                            f"'{entry['journal_model']}', not '{self.model_identifier}'."
+                        )
+                    continue
+                sessions[entry["session_id"]] = (
+                    entry.get("input_sha256"),
+                    (entry["records"], entry.get("usage", []), int(entry.get("prompt_tokens_saved", 0))),
+                )
+        return sessions
+
+    def append(
+        self,
+        session_id: str,
+        input_digest: str,
+        records: list[dict[str, Any]],
+        usages: list[dict[str, Any]],
+        saved: int,
+    ) -> None:
+        entry = {
+            "session_id": session_id,
+            "input_sha256": input_digest,
+            "records": records,
+            "usage": usages,
+            "prompt_tokens_saved": saved,
+        }
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            header = not self.path.exists() or self.path.stat().st_size == 0
+            with self.path.open("a", encoding="utf-8") as handle:
+                if header:
+                    handle.write(json.dumps({"journal_model": self.model_identifier}) + "\n")
+                elif not _ends_with_newline(self.path):
+                    # A previous run died mid-line; start on a fresh one.
+                    handle.write("\n")
+                handle.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+                handle.flush()
+                os.fsync(handle.fileno())
+
+
+def _session_digest(records: list[dict[str, Any]]) -> str:
+    """Hash a session's dataset records canonically (sorted keys, no whitespace)."""
+
+    payload = json.dumps(records, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _ends_with_newline(path: Path) -> bool:
+    with path.open("rb") as handle:
+        handle.seek(-1, os.SEEK_END)
+        return handle.read(1) == b"\n"
+
+
+def _utc_now() -> str:
+    return datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+
+
+def _provider_concurrency(provider: ChatProvider, requested: int) -> int:
+    """Cap *requested* workers by the provider's ``max_concurrency``.
+
+    Providers that do not declare a limit get one session at a time.
+    """
+
+    limit = getattr(provider, "max_concurrency", None)
+    if not isinstance(limit, int) or limit < 1:
+        limit = 1
+    return max(1, min(requested, limit))
+
+
+def _synchronized(callback: Callable[[int], None]) -> Callable[[int], None]:
+    lock = threading.Lock()
+
+    def _inner(step: int) -> None:
+        with lock:
+            callback(step)
+
+    return _inner
+
+
 def load_dataset(path: Path) -> list[dict]:
     """Load the dataset located at *path*."""
 
@@ -423,6 +864,13 @@ def build_aggregates(score_results: dict) -> dict:
                 }
         if scoped:
             aggregates[scope] = scoped
+    pairwise = score_results.get("pairwise")
+    if isinstance(pairwise, dict):
+        aggregates["pairwise"] = {
+            key: value
+            for key, value in pairwise.items()
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+        }
     return {"aggregates": aggregates}
 
 
@@ -539,22 +987,31 @@ class _UsageAccumulator:
         self.prompt = 0
         self.completion = 0
         self.total = 0
+        self.saved_by_session: dict[str, int] = {}
 
     def add(self, usage: dict[str, Any]) -> None:
         self.prompt += _safe_int(usage.get("prompt_tokens"))
         self.completion += _safe_int(usage.get("completion_tokens"))
         self.total += _safe_int(usage.get("total_tokens"))
 
-    def as_dict(self) -> dict[str, int]:
-        return {
+    def add_saved(self, session_id: str, saved: int) -> None:
+        if saved:
+            self.saved_by_session[session_id] = saved
+
+    def as_dict(self) -> dict[str, Any]:
+        summary: dict[str, Any] = {
             key: value
             for key, value in {
                 "prompt_tokens": self.prompt,
                 "completion_tokens": self.completion,
                 "total_tokens": self.total,
+                "prompt_tokens_saved": sum(self.saved_by_session.values()),
             }.items()
             if value
         }
+        if self.saved_by_session:
+            summary["prompt_tokens_saved_by_session"] = dict(self.saved_by_session)
+        return summary
 
 
 def _safe_int(value: Any) -> int:
@@ -8,12 +8,24 @@ import random
 import re
 from dataclasses import dataclass, asdict
 from pathlib import Path
+from statistics import NormalDist
 from typing import Iterable, Optional, Sequence
 
 import logging
 
-from alignmenter.providers.embeddings import EmbeddingProvider, load_embedding_provider
+import numpy as np
+
+from alignmenter.providers.embeddings import (
+    DEFAULT_EMBEDDING_BATCH_SIZE,
+    EmbeddingProvider,
+    embed_in_batches,
+    embed_matrix,
+    load_embedding_provider,
+    normalize_rows,
+)
+from alignmenter.scorers.base import select_sessions
 from alignmenter.utils import load_yaml
+from alignmenter.utils.automaton import PhraseAutomaton
 
 TOKEN_PATTERN = re.compile(r"[\w']+")
 LOGGER = logging.getLogger(__name__)
@@ -23,6 +35,11 @@ LOGGER = logging.getLogger(__name__)
 DEFAULT_STYLE_SIM_MIN = 0.05  # typical minimum raw cosine similarity
 DEFAULT_STYLE_SIM_MAX = 0.25  # typical maximum raw cosine similarity
 
+DEFAULT_BOOTSTRAP_ITERATIONS = 200
+CI_METHODS = ("percentile", "bca")
+# Upper bound on the resample index matrix held in memory at once
+_BOOTSTRAP_CHUNK_BYTES = 32 * 1024 * 1024
+
 
 @dataclass
 class TraitModel:
@@ -31,17 +48,35 @@ class TraitModel:
     phrase_weights: dict[str, float]
 
 
+@dataclass
+class CompiledTraitModel:
+    """``TraitModel`` laid out for batch scoring.
+
+    Token weights live in a dense vector addressed through ``vocabulary`` and
+    phrases are matched with a single automaton pass, so the logits for a batch
+    of turns reduce to one sparse (CSR) matrix–vector product.
+    """
+
+    source: TraitModel
+    bias: float
+    vocabulary: dict[str, int]
+    token_weights: np.ndarray
+    phrases: PhraseAutomaton
+    phrase_weights: np.ndarray
+
+
 @dataclass
 class PersonaProfile:
     preferred: set[str]
     avoided: set[str]
-    exemplars: list[list[float]]
+    exemplars: np.ndarray  # (n_exemplars, dim) float32, rows unit-normalized
     trait_positive: set[str]
     trait_negative: set[str]
     weights: dict[str, float]
     trait_model: TraitModel
     style_sim_min: float = DEFAULT_STYLE_SIM_MIN
     style_sim_max: float = DEFAULT_STYLE_SIM_MAX
+    compiled_traits: Optional[CompiledTraitModel] = None
 
 
 @dataclass
@@ -66,57 +101,127 @@ class AuthenticitySummary:
     ci95_high: Optional[float] = None
 
 
+@dataclass
+class AuthenticityEvaluation:
+    """Per-turn component arrays from a single scoring pass.
+
+    ``session_index[i]`` is the position of turn ``i``'s session in the input,
+    so aggregates for any group of sessions can be taken without re-scoring.
+    """
+
+    session_index: np.ndarray
+    style_sim: np.ndarray
+    traits: np.ndarray
+    lexicon: np.ndarray
+    score: np.ndarray
+    tokens: np.ndarray
+    preferred_hits: np.ndarray
+    avoid_hits: np.ndarray
+
+
 class AuthenticityScorer:
     """Compute persona authenticity using embeddings, traits, and lexicon."""
 
     id = "authenticity"
 
-    def __init__(self, persona_path: Path, *, embedding: Optional[str] = None, seed: int = 42) -> None:
+    def __init__(
+        self,
+        persona_path: Path,
+        *,
+        embedding: Optional[str] = None,
+        seed: int = 42,
+        batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+        bootstrap_iterations: int = DEFAULT_BOOTSTRAP_ITERATIONS,
+        ci_method: str = "percentile",
+    ) -> None:
+        if ci_method not in CI_METHODS:
+            raise ValueError(f"Unknown ci_method '{ci_method}'. Expected one of {', '.join(CI_METHODS)}.")
         self.embedder = load_embedding_provider(embedding)
         self.profile = load_persona_profile(persona_path, self.embedder)
-        self.random = random.Random(seed)
+        self.random = np.random.default_rng(seed)
+        self.batch_size = batch_size
+        self.bootstrap_iterations = bootstrap_iterations
+        self.ci_method = ci_method
 
     def score(self, sessions: Iterable) -> dict:
-        turns: list[AuthenticityTurn] = []
-        preferred_hits = 0
-        avoid_hits = 0
-        token_total = 0
-
-        for text in iter_assistant_text(sessions):
-            tokens = tokenize(text)
-            token_total += len(tokens)
-            preferred_hits += sum(token in self.profile.preferred for token in tokens)
-            avoid_hits += sum(token in self.profile.avoided for token in tokens)
-            turns.append(score_turn(text, tokens, self.profile, self.embedder))
-
-        if not turns:
-            return empty_summary()
+        return self.summarize(self.evaluate(sessions))
+
+    def evaluate(self, sessions: Iterable) -> AuthenticityEvaluation:
+        """Score every assistant turn once; see ``summarize`` for aggregation."""
+
+        indexed = list(iter_assistant_turns(sessions))
+        texts = [text for _, text in indexed]
+        session_index = np.fromiter((index for index, _ in indexed), dtype=np.intp, count=len(indexed))
+        if not texts:
+            empty = np.zeros(0, dtype=np.float64)
+            counts = np.zeros(0, dtype=np.int64)
+            return AuthenticityEvaluation(session_index, empty, empty, empty, empty, counts, counts, counts)
+
+        token_lists = [tokenize(text) for text in texts]
+        tokens = np.array([len(tokens) for tokens in token_lists], dtype=np.int64)
+        preferred_hits = np.array(
+            [sum(token in self.profile.preferred for token in tokens) for tokens in token_lists], dtype=np.int64
+        )
+        avoid_hits = np.array(
+            [sum(token in self.profile.avoided for token in tokens) for tokens in token_lists], dtype=np.int64
+        )
+
+        vectors = normalize_rows(embed_in_batches(self.embedder, texts, self.batch_size))
+        raw_style = style_similarity_matrix(vectors, self.profile.exemplars)
+        traits = traits_probabilities(texts, token_lists, self.profile)
+        lexicon = np.array([lexicon_score(tokens, self.profile) for tokens in token_lists], dtype=np.float64)
 
-        # Rescale style_sim using global normalization bounds
-        raw_style_scores = [turn.style_sim for turn in turns]
-        rescaled_style_scores = rescale_similarity(
-            raw_style_scores,
+        # Rescale style_sim using global normalization bounds, then blend
+        style = rescale_similarity_array(
+            raw_style,
             min_score=self.profile.style_sim_min,
-            max_score=self.profile.style_sim_max
+            max_score=self.profile.style_sim_max,
         )
+        combined = blend_components(self.profile.weights, style, traits, lexicon)
+
+        return AuthenticityEvaluation(
+            session_index=session_index,
+            style_sim=style,
+            traits=traits,
+            lexicon=lexicon,
+            score=combined,
+            tokens=tokens,
+            preferred_hits=preferred_hits,
+            avoid_hits=avoid_hits,
+        )
+
+    def summarize(
+        self,
+        evaluation: AuthenticityEvaluation,
+        session_indices: Optional[Sequence[int]] = None,
+    ) -> dict:
+        """Aggregate an evaluation, optionally restricted to some sessions.
+
+        ``session_indices`` are positions in the sequence passed to
+        ``evaluate``; the result equals ``score`` on that subset.
+        """
 
-        # Recompute combined scores with rescaled style_sim
-        for i, turn in enumerate(turns):
-            rescaled_style = rescaled_style_scores[i]
-            combined = (
-                self.profile.weights["style"] * rescaled_style
-                + self.profile.weights["traits"] * turn.traits
-                + self.profile.weights["lexicon"] * turn.lexicon
-            )
-            turns[i] = AuthenticityTurn(
-                style_sim=rescaled_style,
-                traits=turn.traits,
-                lexicon=turn.lexicon,
-                score=combined
-            )
-
-        summary = summarise_turns(turns, token_total, preferred_hits, avoid_hits)
-        ci_low, ci_high = bootstrap_ci(self.random, [turn.score for turn in turns])
+        mask = select_sessions(evaluation.session_index, session_indices)
+        scores = evaluation.score[mask]
+        if not len(scores):
+            return empty_summary()
+
+        summary = AuthenticitySummary(
+            mean=float(scores.mean()),
+            style_sim=float(evaluation.style_sim[mask].mean()),
+            traits=float(evaluation.traits[mask].mean()),
+            lexicon=float(evaluation.lexicon[mask].mean()),
+            turns=int(len(scores)),
+            tokens=int(evaluation.tokens[mask].sum()),
+            preferred_hits=int(evaluation.preferred_hits[mask].sum()),
+            avoid_hits=int(evaluation.avoid_hits[mask].sum()),
+        )
+        ci_low, ci_high = bootstrap_ci(
+            self.random,
+            scores,
+            iterations=self.bootstrap_iterations,
+            method=self.ci_method,
+        )
         summary.ci95_low = ci_low
         summary.ci95_high = ci_high
         payload = asdict(summary)
@@ -137,7 +242,7 @@ def load_persona_profile(persona_path: Path, embedder: EmbeddingProvider) -> Per
         exemplar_texts = [" ".join(sorted(preferred))]
     if not exemplar_texts:
         exemplar_texts = ["persona"]
-    exemplar_vectors = [normalize_vector(vector) for vector in embedder.embed(exemplar_texts)]
+    exemplar_vectors = normalize_rows(embed_matrix(embedder, exemplar_texts))
 
     trait_positive = {
         token.lower()
@@ -170,21 +275,29 @@ def load_persona_profile(persona_path: Path, embedder: EmbeddingProvider) -> Per
         trait_model=trait_model,
         style_sim_min=style_sim_min,
         style_sim_max=style_sim_max,
+        compiled_traits=compile_trait_model(trait_model),
     )
 
 
 # scoring helpers
 
-def score_turn(text: str, tokens: list[str], profile: PersonaProfile, embedder: EmbeddingProvider) -> AuthenticityTurn:
-    vector = normalize_vector(embedder.embed([text])[0])
+def score_turn(
+    text: str,
+    tokens: list[str],
+    profile: PersonaProfile,
+    embedder: EmbeddingProvider,
+    *,
+    vector: Optional[Sequence[float]] = None,
+) -> AuthenticityTurn:
+    """Score a single turn; pass ``vector`` when the text is already embedded."""
+
+    if vector is None:
+        vector = embed_matrix(embedder, [text])[0]
+    vector = normalize_vector(vector)
     style_sim = style_similarity(vector, profile.exemplars)
     traits_score = traits_probability(text, tokens, profile)
     lex_score = lexicon_score(tokens, profile)
-    combined = (
-        profile.weights["style"] * style_sim
-        + profile.weights["traits"] * traits_score
-        + profile.weights["lexicon"] * lex_score
-    )
+    combined = float(blend_components(profile.weights, style_sim, traits_score, lex_score))
     return AuthenticityTurn(style_sim=style_sim, traits=traits_score, lexicon=lex_score, score=combined)
 
 
@@ -218,23 +331,99 @@ def empty_summary() -> dict:
 
 # component calculations
 
-def style_similarity(vector: Sequence[float], exemplars: list[list[float]]) -> float:
-    sims = [cosine_similarity(vector, exemplar) for exemplar in exemplars]
-    if not sims:
+def style_similarity(vector: Sequence[float], exemplars: np.ndarray | Sequence[Sequence[float]]) -> float:
+    exemplar_matrix = np.asarray(exemplars, dtype=np.float32)
+    if exemplar_matrix.size == 0:
         return 0.0
-    return max(0.0, min(1.0, sum(sims) / len(sims)))
+    vector = np.asarray(vector, dtype=np.float32)
+    length = min(vector.shape[-1], exemplar_matrix.shape[-1])
+    return float(style_similarity_matrix(vector[None, :length], exemplar_matrix[:, :length])[0])
+
+
+def style_similarity_matrix(vectors: np.ndarray, exemplars: np.ndarray | Sequence[Sequence[float]]) -> np.ndarray:
+    """Mean exemplar similarity for every row of *vectors* in one matrix product.
+
+    Both inputs are expected to be row-normalized; the result is clipped to
+    [0, 1] exactly like ``style_similarity``.
+    """
+
+    vectors = np.asarray(vectors, dtype=np.float32)
+    exemplar_matrix = np.asarray(exemplars, dtype=np.float32)
+    if exemplar_matrix.size == 0 or vectors.size == 0:
+        return np.zeros(len(vectors), dtype=np.float64)
+    sims = np.clip(vectors @ exemplar_matrix.T, -1.0, 1.0)
+    return np.clip(sims.mean(axis=1, dtype=np.float64), 0.0, 1.0)
+
+
+def blend_components(weights: dict[str, float], style, traits, lexicon):
+    """Weighted combination of component scores; accepts scalars or arrays."""
+
+    return weights["style"] * style + weights["traits"] * traits + weights["lexicon"] * lexicon
 
 
 def traits_probability(text: str, tokens: Iterable[str], profile: PersonaProfile) -> float:
-    token_set = set(tokens)
-    logit = profile.trait_model.bias
-    for token in token_set:
-        logit += profile.trait_model.token_weights.get(token, 0.0)
-    lowered = text.lower()
-    for phrase, weight in profile.trait_model.phrase_weights.items():
-        if phrase in lowered:
-            logit += weight
-    return sigmoid(logit)
+    return float(traits_probabilities([text], [list(tokens)], profile)[0])
+
+
+def traits_probabilities(
+    texts: Sequence[str],
+    token_lists: Sequence[Sequence[str]],
+    profile: PersonaProfile,
+) -> np.ndarray:
+    """Trait probability for every turn in a batch.
+
+    Each distinct known token and each phrase found in the lower-cased text
+    contributes its weight once, matching the per-turn definition.
+    """
+
+    compiled = _compiled_traits(profile)
+    n_turns = len(texts)
+    vocabulary = compiled.vocabulary
+
+    # CSR layout: one row per turn, one column per distinct known token.
+    indices: list[int] = []
+    indptr = [0]
+    for tokens in token_lists:
+        indices.extend({vocabulary[token] for token in tokens if token in vocabulary})
+        indptr.append(len(indices))
+
+    logits = np.full(n_turns, compiled.bias, dtype=np.float64)
+    if indices:
+        columns = np.asarray(indices, dtype=np.intp)
+        rows = np.repeat(np.arange(n_turns), np.diff(np.asarray(indptr)))
+        logits += np.bincount(rows, weights=compiled.token_weights[columns], minlength=n_turns)
+
+    if compiled.phrases:
+        for row, text in enumerate(texts):
+            matched = compiled.phrases.matched_ids(text.lower())
+            if matched:
+                logits[row] += compiled.phrase_weights[list(matched)].sum()
+
+    return 1.0 / (1.0 + np.exp(-logits))
+
+
+def compile_trait_model(model: TraitModel) -> CompiledTraitModel:
+    """Prepare ``model`` for ``traits_probabilities``."""
+
+    vocabulary = {token: index for index, token in enumerate(model.token_weights)}
+    phrases = PhraseAutomaton(model.phrase_weights)
+    return CompiledTraitModel(
+        source=model,
+        bias=float(model.bias),
+        vocabulary=vocabulary,
+        token_weights=np.fromiter(model.token_weights.values(), dtype=np.float64, count=len(vocabulary)),
+        phrases=phrases,
+        phrase_weights=np.array([model.phrase_weights[phrase] for phrase in phrases.patterns], dtype=np.float64),
+    )
+
+
+def _compiled_traits(profile: PersonaProfile) -> CompiledTraitModel:
+    # Profiles built by hand (or whose trait model was swapped) compile lazily.
+    compiled = profile.compiled_traits
+    if compiled is None or compiled.source is not profile.trait_model:
+        compiled = compile_trait_model(profile.trait_model)
+        profile.compiled_traits = compiled
+    return compiled
 
 
 def lexicon_score(tokens: list[str], profile: PersonaProfile) -> float:
@@ -262,23 +451,81 @@ def lexicon_score(tokens: list[str], profile: PersonaProfile) -> float:
 
 
 def bootstrap_ci(
-    random_gen: random.Random,
-    scores: list[float],
-    iterations: int = 200,
+    random_gen: random.Random | np.random.Generator,
+    scores: Sequence[float],
+    iterations: int = DEFAULT_BOOTSTRAP_ITERATIONS,
     alpha: float = 0.05,
+    *,
+    method: str = "percentile",
 ) -> tuple[Optional[float], Optional[float]]:
-    if len(scores) < 2:
-        return None, None
+    """Bootstrap confidence interval for the mean of *scores*.
 
-    samples = []
-    for _ in range(iterations):
-        resample = [random_gen.choice(scores) for _ in scores]
-        samples.append(mean(resample))
+    Resampling is vectorized in NumPy and chunked so that memory stays bounded
+    regardless of ``iterations`` or dataset size. ``random_gen`` may be a NumPy
+    ``Generator`` or a seeded ``random.Random`` (which seeds a Generator).
+    ``method`` is ``"percentile"`` or ``"bca"`` (bias-corrected and accelerated).
+    """
 
-    samples.sort()
-    lower_idx = int((alpha / 2) * len(samples))
-    upper_idx = max(lower_idx, int((1 - alpha / 2) * len(samples)) - 1)
-    return samples[lower_idx], samples[upper_idx]
+    if len(scores) < 2:
+        return None, None
+    if method not in CI_METHODS:
+        raise ValueError(f"Unknown bootstrap method '{method}'. Expected one of {', '.join(CI_METHODS)}.")
+
+    values = np.asarray(scores, dtype=np.float64)
+    samples = np.sort(_bootstrap_means(_as_generator(random_gen), values, max(1, int(iterations))))
+
+    low_q, high_q = alpha / 2, 1 - alpha / 2
+    if method == "bca":
+        adjusted = _bca_quantiles(values, samples, alpha)
+        if adjusted is not None:
+            low_q, high_q = adjusted
+
+    lower_idx = min(len(samples) - 1, max(0, int(low_q * len(samples))))
+    upper_idx = min(len(samples) - 1, max(lower_idx, int(high_q * len(samples)) - 1))
+    return float(samples[lower_idx]), float(samples[upper_idx])
+
+
+def _as_generator(random_gen: random.Random | np.random.Generator | int | None) -> np.random.Generator:
+    if isinstance(random_gen, np.random.Generator):
+        return random_gen
+    if isinstance(random_gen, random.Random):
+        return np.random.default_rng(random_gen.getrandbits(64))
+    return np.random.default_rng(random_gen)
+
+
+def _bootstrap_means(rng: np.random.Generator, values: np.ndarray, iterations: int) -> np.ndarray:
+    n = len(values)
+    rows_per_chunk = max(1, _BOOTSTRAP_CHUNK_BYTES // (n * 8))
+    means = np.empty(iterations, dtype=np.float64)
+    for start in range(0, iterations, rows_per_chunk):
+        stop = min(iterations, start + rows_per_chunk)
+        indices = rng.integers(0, n, size=(stop - start, n))
+        means[start:stop] = values[indices].mean(axis=1)
+    return means
+
+
+def _bca_quantiles(values: np.ndarray, samples: np.ndarray, alpha: float) -> Optional[tuple[float, float]]:
+    """BCa-adjusted quantiles for the mean, or ``None`` when undefined."""
+
+    normal = NormalDist()
+    estimate = float(values.mean())
+    below = float(np.mean(samples < estimate))
+    if below <= 0.0 or below >= 1.0:
+        return None
+    z0 = normal.inv_cdf(below)
+
+    # Jackknife acceleration; leave-one-out means have a closed form.
+    n = len(values)
+    jackknife = (values.sum() - values) / (n - 1)
+    deviations = jackknife.mean() - jackknife
+    denominator = 6.0 * float(np.sum(deviations**2)) ** 1.5
+    acceleration = float(np.sum(deviations**3)) / denominator if denominator else 0.0
+
+    quantiles = []
+    for q in (alpha / 2, 1 - alpha / 2):
+        z = z0 + normal.inv_cdf(q)
+        quantiles.append(normal.cdf(z0 + z / (1 - acceleration * z)))
+    return quantiles[0], quantiles[1]
 
 
 # shared utilities
@@ -361,31 +608,35 @@ def _parse_trait_model(calibration: dict) -> Optional[TraitModel]:
 
 
 def iter_assistant_text(sessions: Iterable) -> Iterable[str]:
-    for session in sessions:
+    for _, text in iter_assistant_turns(sessions):
+        yield text
+
+
+def iter_assistant_turns(sessions: Iterable) -> Iterable[tuple[int, str]]:
+    """Yield ``(session_position, text)`` for every non-empty assistant turn."""
+
+    for position, session in enumerate(sessions):
         turns = getattr(session, "turns", None)
         if turns is None and hasattr(session, "get"):
             turns = session.get("turns", [])
         for turn in turns or []:
             if turn.get("role") == "assistant" and turn.get("text"):
-                yield turn["text"]
+                yield position, turn["text"]
 
 
 def tokenize(text: str) -> list[str]:
     return [match.group(0).lower() for match in TOKEN_PATTERN.finditer(text)]
 
 
-def normalize_vector(vector: Sequence[float]) -> list[float]:
-    norm = math.sqrt(sum(value * value for value in vector))
-    if not norm:
-        return [0.0 for _ in vector]
-    return [value / norm for value in vector]
+def normalize_vector(vector: Sequence[float]) -> np.ndarray:
+    return normalize_rows(np.asarray(vector, dtype=np.float32))[0]
 
 
 def cosine_similarity(vec_a: Sequence[float], vec_b: Sequence[float]) -> float:
     length = min(len(vec_a), len(vec_b))
     if not length:
         return 0.0
-    dot = sum(vec_a[i] * vec_b[i] for i in range(length))
+    dot = float(np.dot(np.asarray(vec_a[:length], dtype=np.float32), np.asarray(vec_b[:length], dtype=np.float32)))
     return max(-1.0, min(1.0, dot))
 
 
@@ -421,21 +672,20 @@ def rescale_similarity(scores: list[float], min_score: float, max_score: float)
     This allows on-brand content to achieve high scores while maintaining
     separation between good and bad responses across runs.
     """
-    if not scores:
+    if not len(scores):
         return []
+    return rescale_similarity_array(scores, min_score, max_score).tolist()
 
+
+def rescale_similarity_array(scores: Sequence[float] | np.ndarray, min_score: float, max_score: float) -> np.ndarray:
+    """Array form of ``rescale_similarity``."""
+
+    scores = np.asarray(scores, dtype=np.float64)
     # Ensure valid range
     if max_score <= min_score:
-        return [0.6 for _ in scores]
-
-    rescaled = []
-    for score in scores:
-        # Normalize to [0, 1] using global bounds
-        normalized = (score - min_score) / (max_score - min_score)
-        # Clamp to [0, 1] in case score is outside calibration bounds
-        normalized = max(0.0, min(1.0, normalized))
-        # Rescale to [0.3, 0.9] range for intuitive interpretation
-        rescaled_score = 0.3 + (normalized * 0.6)
-        rescaled.append(rescaled_score)
-
-    return rescaled
+        return np.full(scores.shape, 0.6)
+
+    # Normalize to [0, 1] using global bounds, clamped in case a score falls
+    # outside the calibration bounds, then rescale to [0.3, 0.9]
+    normalized = np.clip((scores - min_score) / (max_score - min_score), 0.0, 1.0)
+    return 0.3 + normalized * 0.6
@@ -0,0 +1,43 @@
+"""Base scorer protocols."""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Optional, Protocol, Sequence
+
+import numpy as np
+
+
+class Scorer(Protocol):
+    """Minimal scorer protocol used by the runner."""
+
+    id: str
+
+    def score(self, sessions: Iterable) -> dict:
+        ...
+
+
+class GroupedScorer(Scorer, Protocol):
+    """Scorer that can aggregate one scoring pass over arbitrary session groups.
+
+    ``evaluate`` scores every turn once and returns per-turn or per-session
+    arrays tagged with session positions; ``summarize`` aggregates them for the
+    given positions (or all of them). ``score`` is ``summarize(evaluate(...))``.
+    """
+
+    def evaluate(self, sessions: Iterable) -> Any:
+        ...
+
+    def summarize(self, evaluation: Any, session_indices: Optional[Sequence[int]] = None) -> dict:
+        ...
+
+
+def supports_grouping(scorer: object) -> bool:
+    return callable(getattr(scorer, "evaluate", None)) and callable(getattr(scorer, "summarize", None))
+
+
+def select_sessions(session_index: np.ndarray, session_indices: Optional[Sequence[int]]) -> np.ndarray:
+    """Boolean mask over rows whose session position is in ``session_indices``."""
+
+    if session_indices is None:
+        return np.ones(len(session_index), dtype=bool)
+    return np.isin(session_index, np.asarray(list(session_indices), dtype=np.intp))
@@ -2,16 +2,126 @@
 
 from __future__ import annotations
 
-import math
+from collections import deque
+from dataclasses import dataclass
 from typing import Iterable, Optional, Sequence
 
-from alignmenter.providers.embeddings import load_embedding_provider
+import numpy as np
+
+from alignmenter.providers.embeddings import (
+    DEFAULT_EMBEDDING_BATCH_SIZE,
+    embed_in_batches,
+    embed_matrix,
+    load_embedding_provider,
+    normalize_rows,
+)
+from alignmenter.scorers.base import select_sessions
 
 # Default global normalization bounds (empirical values for typical embeddings)
 # These can be overridden via __init__ parameters or calibration data
 DEFAULT_VARIANCE_MIN = 0.01  # typical minimum variance for stable sessions
 DEFAULT_VARIANCE_MAX = 0.50  # typical maximum variance for unstable sessions
 
+# Rows per chunk when gathering centroids, bounding the temporary (rows, dim) copy.
+_DISTANCE_CHUNK_ROWS = 65536
+
+STABILITY_MODES = ("batch", "online")
+DEFAULT_DRIFT_WINDOW = 5  # assistant turns per rolling drift window
+DEFAULT_DRIFT_THRESHOLD = 0.4  # rolling mean cosine distance that counts as drift
+
+
+@dataclass
+class StabilityEvaluation:
+    """Per-session statistics for sessions with at least ``min_turns`` replies.
+
+    ``session_index`` holds each row's position in the input to ``evaluate``.
+    """
+
+    session_index: np.ndarray
+    variance: np.ndarray
+    mean_distance: np.ndarray
+    # Online mode only: final and peak rolling-window drift, and the assistant
+    # turn index where drift first crossed the threshold (-1 if it never did).
+    window_drift: Optional[np.ndarray] = None
+    max_window_drift: Optional[np.ndarray] = None
+    first_drift_turn: Optional[np.ndarray] = None
+
+
+class OnlineStabilityTracker:
+    """Streaming drift statistics for a single session.
+
+    Each ``update`` compares the new turn embedding with the running centroid
+    of the turns before it, then folds it into that centroid. Distances feed a
+    Welford mean/variance and a rolling window of the last ``window`` values,
+    so memory stays O(dim + window) however long the session runs. Because
+    distances are taken against the centroid so far, ``variance`` approximates
+    (rather than reproduces) batch mode, which uses the final centroid.
+    """
+
+    def __init__(
+        self,
+        *,
+        window: int = DEFAULT_DRIFT_WINDOW,
+        drift_threshold: float = DEFAULT_DRIFT_THRESHOLD,
+    ) -> None:
+        if window < 1:
+            raise ValueError("window must be at least 1.")
+        self.window = window
+        self.drift_threshold = drift_threshold
+        self.turns = 0
+        self.window_drift = 0.0
+        self.max_window_drift = 0.0
+        self.first_drift_turn: Optional[int] = None
+        self._centroid: Optional[np.ndarray] = None
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._recent: deque[float] = deque(maxlen=window)
+
+    @property
+    def mean_distance(self) -> float:
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the distances seen so far."""
+
+        return self._m2 / self._count if self._count else 0.0
+
+    def update(self, vector: Sequence[float]) -> Optional[float]:
+        """Add one turn embedding; return its distance from the prior centroid."""
+
+        unit = normalize_rows(np.asarray(vector, dtype=np.float32))[0].astype(np.float64)
+        distance: Optional[float] = None
+        if self._centroid is None:
+            self._centroid = unit
+        else:
+            norm = float(np.linalg.norm(self._centroid))
+            similarity = float(unit @ self._centroid) / norm if norm else 0.0
+            distance = 1.0 - max(-1.0, min(1.0, similarity))
+            self._observe(distance)
+            self._centroid += (unit - self._centroid) / (self.turns + 1)
+        self.turns += 1
+        return distance
+
+    def extend(self, vectors: Iterable[Sequence[float]]) -> None:
+        for vector in vectors:
+            self.update(vector)
+
+    def _observe(self, distance: float) -> None:
+        self._count += 1
+        delta = distance - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (distance - self._mean)
+
+        self._recent.append(distance)
+        if len(self._recent) < self.window:
+            return
+        self.window_drift = sum(self._recent) / self.window
+        self.max_window_drift = max(self.max_window_drift, self.window_drift)
+        if self.first_drift_turn is None and self.window_drift >= self.drift_threshold:
+            self.first_drift_turn = self.turns
+
 
 class StabilityScorer:
     """Measure intra-session embedding drift."""
@@ -25,80 +135,220 @@ class StabilityScorer:
         min_turns: int = 2,
         variance_min: float = DEFAULT_VARIANCE_MIN,
         variance_max: float = DEFAULT_VARIANCE_MAX,
+        batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+        mode: str = "batch",
+        window: int = DEFAULT_DRIFT_WINDOW,
+        drift_threshold: float = DEFAULT_DRIFT_THRESHOLD,
     ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        if mode not in STABILITY_MODES:
+            raise ValueError(f"Unknown stability mode '{mode}' (expected one of: {', '.join(STABILITY_MODES)}).")
+        if window < 1:
+            raise ValueError("window must be at least 1.")
         self.embedder = load_embedding_provider(embedding)
+        self.batch_size = batch_size
         self.min_turns = min_turns
         self.variance_min = variance_min
         self.variance_max = variance_max
+        self.mode = mode
+        self.window = window
+        self.drift_threshold = drift_threshold
 
     def score(self, sessions: Iterable) -> dict:
-        session_scores = []
-        for session in sessions:
+        return self.summarize(self.evaluate(sessions))
+
+    def evaluate(self, sessions: Iterable) -> StabilityEvaluation:
+        """Compute per-session drift statistics once; see ``summarize``."""
+
+        if self.mode == "online":
+            return self._evaluate_online(sessions)
+        return self._evaluate_batch(sessions)
+
+    def _evaluate_batch(self, sessions: Iterable) -> StabilityEvaluation:
+        """Score all sessions from one ragged matrix.
+
+        Every qualifying assistant turn is embedded in one batched pass and
+        kept as a single matrix; ``offsets`` marks where each session starts.
+        """
+
+        positions: list[int] = []
+        offsets: list[int] = []
+        texts: list[str] = []
+        for position, responses in self._iter_responses(sessions):
+            positions.append(position)
+            offsets.append(len(texts))
+            texts.extend(responses)
+
+        if texts:
+            vectors = normalize_rows(embed_in_batches(self.embedder, texts, self.batch_size))
+            variances, distances = _ragged_stability(vectors, np.asarray(offsets, dtype=np.intp))
+        else:
+            variances = distances = np.zeros(0, dtype=np.float64)
+
+        return StabilityEvaluation(
+            session_index=np.asarray(positions, dtype=np.intp),
+            variance=variances,
+            mean_distance=distances,
+        )
+
+    def _evaluate_online(self, sessions: Iterable) -> StabilityEvaluation:
+        """Stream each session through an :class:`OnlineStabilityTracker`.
+
+        Only one embedding batch is held at a time, so sessions of any length
+        can be scored without materialising their turn matrices.
+        """
+
+        positions: list[int] = []
+        rows: list[tuple[float, float, float, float, int]] = []
+        for position, responses in self._iter_responses(sessions):
+            tracker = OnlineStabilityTracker(window=self.window, drift_threshold=self.drift_threshold)
+            for start in range(0, len(responses), self.batch_size):
+                tracker.extend(embed_matrix(self.embedder, responses[start : start + self.batch_size]))
+            positions.append(position)
+            first_drift = tracker.first_drift_turn
+            rows.append(
+                (
+                    tracker.variance,
+                    tracker.mean_distance,
+                    tracker.window_drift,
+                    tracker.max_window_drift,
+                    -1 if first_drift is None else first_drift,
+                )
+            )
+
+        columns = np.asarray(rows, dtype=np.float64).reshape(-1, 5)
+        return StabilityEvaluation(
+            session_index=np.asarray(positions, dtype=np.intp),
+            variance=columns[:, 0],
+            mean_distance=columns[:, 1],
+            window_drift=columns[:, 2],
+            max_window_drift=columns[:, 3],
+            first_drift_turn=columns[:, 4].astype(np.intp),
+        )
+
+    def _iter_responses(self, sessions: Iterable) -> Iterable[tuple[int, list[str]]]:
+        """Yield ``(position, assistant texts)`` for sessions with ``min_turns`` replies."""
+
+        for position, session in enumerate(sessions):
             turns = getattr(session, "turns", None)
             if turns is None and hasattr(session, "get"):
                 turns = session.get("turns", [])
             responses = [turn.get("text", "") for turn in turns or [] if turn.get("role") == "assistant" and turn.get("text")]
-            if len(responses) < self.min_turns:
-                continue
-            vectors = [normalize_vector(vector) for vector in self.embedder.embed(responses)]
-            session_scores.append(_session_stability(vectors))
+            if len(responses) >= self.min_turns:
+                yield position, responses
 
-        if not session_scores:
-            return {
+    def summarize(
+        self,
+        evaluation: StabilityEvaluation,
+        session_indices: Optional[Sequence[int]] = None,
+    ) -> dict:
+        """Aggregate an evaluation, optionally restricted to some sessions."""
+
+        mask = select_sessions(evaluation.session_index, session_indices)
+        raw_variances = evaluation.variance[mask]
+        if not len(raw_variances):
+            result = {
                 "stability": 1.0,
                 "sessions": 0,
                 "session_variance": 0.0,
                 "mean_distance": 0.0,
                 "normalized_variance": 0.0,
             }
+            if evaluation.window_drift is not None:
+                result.update(self._drift_summary(evaluation, mask))
+            return result
 
         # Use global normalization bounds instead of within-batch normalization
-        raw_variances = [score["variance"] for score in session_scores]
         rescaled_variances = _rescale_variance(
-            raw_variances,
+            raw_variances.tolist(),
             min_variance=self.variance_min,
             max_variance=self.variance_max
         )
 
-        # Update session scores with rescaled variances
-        for i, score in enumerate(session_scores):
-            score["normalized_variance"] = rescaled_variances[i]
-
-        session_variance = _mean(score["variance"] for score in session_scores)
-        normalized_variance = _mean(score["normalized_variance"] for score in session_scores)
-        mean_distance = _mean(score["mean_distance"] for score in session_scores)
+        session_variance = float(_mean(raw_variances))
+        normalized_variance = float(_mean(rescaled_variances))
+        mean_distance = float(_mean(evaluation.mean_distance[mask]))
         stability = max(0.0, min(1.0, 1.0 - normalized_variance))
 
-        return {
+        result = {
             "stability": round(stability, 3),
-            "sessions": len(session_scores),
+            "sessions": int(len(raw_variances)),
             "session_variance": round(session_variance, 4),
             "mean_distance": round(mean_distance, 4),
             "normalized_variance": round(normalized_variance, 4),
         }
+        if evaluation.window_drift is not None:
+            result.update(self._drift_summary(evaluation, mask))
+        return result
+
+    def _drift_summary(self, evaluation: StabilityEvaluation, mask: np.ndarray) -> dict:
+        first_drift = evaluation.first_drift_turn[mask]
+        drifted = first_drift[first_drift >= 0]
+        sessions = int(mask.sum())
+        return {
+            "mode": "online",
+            "window": self.window,
+            "drift_threshold": self.drift_threshold,
+            "mean_window_drift": round(float(_mean(evaluation.window_drift[mask])), 4),
+            "max_window_drift": round(float(evaluation.max_window_drift[mask].max(initial=0.0)), 4),
+            "drift_sessions": int(len(drifted)),
+            "drift_rate": round(len(drifted) / sessions, 3) if sessions else 0.0,
+            "first_drift_turn_median": float(np.median(drifted)) if len(drifted) else None,
+        }
 
 
-def _session_stability(vectors: list[list[float]]) -> dict:
+def _ragged_stability(vectors: np.ndarray, offsets: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
     """
-    Compute stability metrics for a single session.
+    Compute stability metrics for every session of a ragged turn matrix.
 
-    Measures variance of cosine distances from the session mean embedding.
+    ``vectors`` holds unit-normalised turn embeddings for all sessions back to
+    back and ``offsets`` the row where each (non-empty) session starts.
+    Measures variance of cosine distances from each session's mean embedding.
     Uses population variance (dividing by n) rather than sample variance (n-1).
 
     Note: For small sessions (2-3 turns), population variance tends to slightly
     underestimate the true variance compared to sample variance with Bessel's
     correction. However, since we apply empirical rescaling across sessions,
     this bias is consistent and does not affect relative comparisons.
+
+    Returns ``(variance, mean_distance)`` arrays with one entry per session.
     """
-    mean_vector = normalize_vector(_mean_vector(vectors))
-    distances = [cosine_distance(vector, mean_vector) for vector in vectors]
-    variance = _mean((distance - _mean(distances)) ** 2 for distance in distances)
-    # Normalized variance will be computed at batch level using empirical rescaling
-    return {
-        "variance": variance,
-        "normalized_variance": variance,  # placeholder, will be rescaled in score()
-        "mean_distance": _mean(distances),
-    }
+    vectors = np.asarray(vectors, dtype=np.float32)
+    counts = np.diff(np.append(offsets, len(vectors)))
+    segment = np.repeat(np.arange(len(offsets)), counts)
+
+    centroids = normalize_rows(_segment_sums(vectors, offsets, counts) / counts[:, None])
+    similarity = np.empty(len(vectors), dtype=np.float32)
+    for start in range(0, len(vectors), _DISTANCE_CHUNK_ROWS):
+        stop = start + _DISTANCE_CHUNK_ROWS
+        similarity[start:stop] = np.einsum(
+            "ij,ij->i", vectors[start:stop], centroids[segment[start:stop]]
+        )
+    distances = 1.0 - np.clip(similarity, -1.0, 1.0).astype(np.float64)
+
+    mean_distance = np.add.reduceat(distances, offsets) / counts
+    variance = np.add.reduceat((distances - mean_distance[segment]) ** 2, offsets) / counts
+    # Normalized variance is computed at batch level using empirical rescaling
+    return variance, mean_distance
+
+
+def _segment_sums(vectors: np.ndarray, offsets: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Row sums per session.
+
+    ``np.add.reduceat`` along axis 0 is slow for wide matrices, so sessions of
+    equal length are gathered into ``(sessions, turns, dim)`` blocks and summed
+    together; real datasets only have a handful of distinct turn counts.
+    """
+    sums = np.empty((len(offsets), vectors.shape[1]), dtype=np.float32)
+    for count in np.unique(counts):
+        members = np.flatnonzero(counts == count)
+        step = max(1, _DISTANCE_CHUNK_ROWS // int(count))
+        for start in range(0, len(members), step):
+            chosen = members[start : start + step]
+            rows = offsets[chosen, None] + np.arange(count)
+            sums[chosen] = vectors[rows].sum(axis=1)
+    return sums
 
 
 def _rescale_variance(variances: list[float], min_variance: float, max_variance: float) -> list[float]:
@@ -139,30 +389,15 @@ def _rescale_variance(variances: list[float], min_variance: float, max_variance:
     return rescaled
 
 
-def normalize_vector(vector: Sequence[float]) -> list[float]:
-    norm = math.sqrt(sum(value * value for value in vector))
-    if not norm:
-        return list(vector)
-    return [value / norm for value in vector]
-
-
-def _mean_vector(vectors: list[list[float]]) -> list[float]:
-    if not vectors:
-        return []
-    length = max(len(vector) for vector in vectors)
-    totals = [0.0] * length
-    for vector in vectors:
-        for idx, value in enumerate(vector):
-            totals[idx] += value
-    count = len(vectors)
-    return [value / count for value in totals]
+def normalize_vector(vector: Sequence[float]) -> np.ndarray:
+    return normalize_rows(np.asarray(vector, dtype=np.float32))[0]
 
 
 def cosine_distance(vec_a: Sequence[float], vec_b: Sequence[float]) -> float:
     length = min(len(vec_a), len(vec_b))
     if not length:
         return 1.0
-    dot = sum(vec_a[i] * vec_b[i] for i in range(length))
+    dot = float(np.dot(np.asarray(vec_a[:length], dtype=np.float32), np.asarray(vec_b[:length], dtype=np.float32)))
     similarity = max(-1.0, min(1.0, dot))
     return 1 - similarity
 
@@ -0,0 +1,73 @@
+"""Multi-pattern substring matching (Aho–Corasick)."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable, Iterator
+
+
+class PhraseAutomaton:
+    """Find every occurrence of many patterns in a single pass over the text.
+
+    Matching is exact and case-sensitive; callers lower-case both sides when
+    they want case-insensitive behaviour. Patterns are identified by their
+    index in :attr:`patterns` (duplicates and empty strings are dropped).
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns: list[str] = list(dict.fromkeys(pattern for pattern in patterns if pattern))
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+
+        for pattern_id, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = nxt
+            self._out[state] = self._out[state] + (pattern_id,)
+
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                candidate = self._goto[fallback].get(char, 0)
+                self._fail[nxt] = candidate if candidate != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    def finditer(self, text: str) -> Iterator[tuple[int, int, int]]:
+        """Yield ``(start, end, pattern_id)`` for every match, ``end`` exclusive."""
+
+        if not self.patterns:
+            return
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id in out[state]:
+                yield index + 1 - len(self.patterns[pattern_id]), index + 1, pattern_id
+
+    def matched_ids(self, text: str) -> set[int]:
+        """Return the ids of every pattern that occurs in *text* at least once."""
+
+        return {pattern_id for _, _, pattern_id in self.finditer(text)}
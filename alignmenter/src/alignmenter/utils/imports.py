@@ -0,0 +1,18 @@
+"""Deferred imports for optional heavy dependencies."""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, Optional
+
+
+def optional_import(module: str, attr: Optional[str] = None) -> Any:
+    """Import *module* (or ``module.attr``) on demand; ``None`` if it is not installed."""
+
+    try:
+        imported = importlib.import_module(module)
+    except ImportError:
+        return None
+    if attr is None:
+        return imported
+    return getattr(imported, attr, None)
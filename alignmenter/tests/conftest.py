@@ -4,8 +4,25 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 _PROJECT_ROOT = Path(__file__).resolve().parents[1]
 _SRC_PATH = _PROJECT_ROOT / "src"
 
 if _SRC_PATH.exists() and str(_SRC_PATH) not in sys.path:
     sys.path.insert(0, str(_SRC_PATH))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep persistent caches and shared providers from leaking between tests."""
+
+    from alignmenter.config import get_settings
+    from alignmenter.providers.embeddings import clear_embedding_registry
+
+    monkeypatch.setenv("ALIGNMENTER_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+    get_settings.cache_clear()
+    clear_embedding_registry()
+    yield
+    get_settings.cache_clear()
+    clear_embedding_registry()
@@ -209,6 +209,152 @@ def test_authenticity_judge_cost_tracking():
     assert summary.average_cost == pytest.approx(0.005, rel=1e-6)
 
 
+def test_authenticity_judge_evaluate_sessions_concurrently_within_budget():
+    """Test batch evaluation keeps input order and stops at the USD budget."""
+    persona_path = _fixture_root() / "configs" / "persona" / "default.yaml"
+    mock_provider = MockJudgeProvider()
+    judge = AuthenticityJudge(
+        persona_path=persona_path,
+        judge_provider=mock_provider,
+        cost_per_call=0.005,
+    )
+
+    turns = _sample_session_turns()
+    analyses = judge.evaluate_sessions(
+        ({"session_id": f"test-{i}", "turns": turns} for i in range(20)),
+        max_in_flight=8,
+        budget_usd=0.02,
+    )
+
+    assert [analysis.session_id for analysis in analyses] == [f"test-{i}" for i in range(4)]
+    assert judge.calls_made == 4
+    assert judge.total_cost == pytest.approx(0.02, rel=1e-6)
+
+
+def test_authenticity_judge_evaluate_sessions_packs_requests():
+    """Test packed evaluation splits cost and re-judges unparsed sessions."""
+    persona_path = _fixture_root() / "configs" / "persona" / "default.yaml"
+
+    class PackingProvider(MockJudgeProvider):
+        def evaluate(self, prompt: str) -> dict:
+            self.calls.append(prompt)
+            if "# Conversations to Evaluate" not in prompt:
+                return self.mock_response
+            answers = [
+                {"id": 1, "score": 9, "reasoning": "On brand."},
+                {"id": 2, "score": "not a number"},
+            ]
+            return {"score": 0.0, "notes": json.dumps(answers), "usage": None}
+
+    mock_provider = PackingProvider()
+    judge = AuthenticityJudge(
+        persona_path=persona_path,
+        judge_provider=mock_provider,
+        cost_per_call=0.01,
+    )
+
+    turns = _sample_session_turns()
+    analyses = judge.evaluate_sessions(
+        ({"session_id": f"test-{i}", "turns": turns} for i in range(3)),
+        max_in_flight=1,
+        pack_size=2,
+    )
+
+    assert [analysis.session_id for analysis in analyses] == ["test-0", "test-1", "test-2"]
+    assert len(mock_provider.calls) == 3  # one pack, one fallback, one single-session pack
+    assert "## Conversation 2" in mock_provider.calls[0]
+    assert analyses[0].score == 9.0
+    assert analyses[0].cost == pytest.approx(0.005)
+    assert analyses[1].score == 8.0
+    assert analyses[1].cost == pytest.approx(0.015)
+    assert judge.calls_made == 3
+    assert judge.total_cost == pytest.approx(0.03)
+
+
+def test_authenticity_judge_compare_session_maps_sides_back():
+    """Test pairwise judging reports scores per side regardless of A/B order."""
+    from alignmenter.judges.authenticity_judge import pairwise_primary_first, summarize_pairwise
+
+    persona_path = _fixture_root() / "configs" / "persona" / "default.yaml"
+    mock_provider = MockJudgeProvider(
+        mock_response={
+            "notes": json.dumps({"score_a": 9, "score_b": 4, "preference": "A", "reasoning": "A is warmer."}),
+            "usage": None,
+        }
+    )
+    judge = AuthenticityJudge(persona_path=persona_path, judge_provider=mock_provider, cost_per_call=0.002)
+    primary = [{"role": "assistant", "text": "primary answer"}]
+    compare = [{"role": "assistant", "text": "compare answer"}]
+
+    session_ids = [f"pair-{i}" for i in range(16)]
+    orders = {pairwise_primary_first(session_id) for session_id in session_ids}
+    assert orders == {True, False}
+
+    analyses = judge.compare_sessions(
+        (
+            {"session_id": session_id, "primary_turns": primary, "compare_turns": compare}
+            for session_id in session_ids
+        ),
+        max_in_flight=1,
+    )
+
+    assert len(mock_provider.calls) == 16
+    for analysis, prompt in zip(analyses, mock_provider.calls):
+        shown_first = prompt.index("primary answer") < prompt.index("compare answer")
+        assert shown_first == analysis.primary_first
+        assert analysis.preference == ("primary" if analysis.primary_first else "compare")
+        assert analysis.primary_score == (9.0 if analysis.primary_first else 4.0)
+
+    summary = summarize_pairwise(analyses)
+    assert summary["sessions"] == 16
+    assert summary["ties"] == 0
+    assert summary["first_position_win_rate"] == 1.0
+    assert summary["cost"] == pytest.approx(0.032)
+
+
+
+def test_summarize_pairwise_excludes_failed_comparisons():
+    """Test failed pairwise calls are counted as errors, not ties."""
+    from alignmenter.judges.authenticity_judge import summarize_pairwise
+
+    persona_path = _fixture_root() / "configs" / "persona" / "default.yaml"
+
+    class FlakyProvider(MockJudgeProvider):
+        def evaluate(self, prompt: str) -> dict:
+            if "flaky" in prompt:
+                raise RuntimeError("Provider connection failed")
+            return super().evaluate(prompt)
+
+    mock_provider = FlakyProvider(
+        mock_response={
+            "notes": json.dumps({"score_a": 8, "score_b": 8, "preference": "tie", "reasoning": "Even."}),
+            "usage": None,
+        }
+    )
+    judge = AuthenticityJudge(persona_path=persona_path, judge_provider=mock_provider)
+    turns = [{"role": "assistant", "text": "answer"}]
+    analyses = judge.compare_sessions(
+        {"session_id": session_id, "primary_turns": turns, "compare_turns": turns}
+        for session_id in ("steady-1", "flaky-1", "flaky-2")
+    )
+
+    failed = [analysis for analysis in analyses if analysis.session_id.startswith("flaky")]
+    assert all(analysis.preference is None for analysis in failed)
+    assert all(analysis.primary_score is None for analysis in failed)
+
+    summary = summarize_pairwise(analyses)
+    assert summary["sessions"] == 3
+    assert summary["errors"] == 2
+    assert summary["ties"] == 1
+    assert summary["primary_win_rate"] == 0.5
+    assert summary["primary_mean_score"] == 8.0
+    assert summary["first_position_win_rate"] is None
+
+    all_failed = summarize_pairwise(failed)
+    assert all_failed["errors"] == 2
+    assert all_failed["primary_win_rate"] is None
+    assert all_failed["mean_score_delta"] is None
+
 def test_authenticity_judge_exception_handling():
     """Test graceful handling when judge provider fails."""
     persona_path = _fixture_root() / "configs" / "persona" / "default.yaml"
@@ -233,6 +379,40 @@ def test_authenticity_judge_exception_handling():
     assert analysis.cost == 0.0
 
 
+def test_authenticity_judge_sends_persona_as_shared_prefix():
+    """Test the persona block is rendered once and passed as a prefix."""
+    persona_path = _fixture_root() / "configs" / "persona" / "default.yaml"
+
+    class PrefixProvider(MockJudgeProvider):
+        def evaluate_with_prefix(self, prefix: str, prompt: str) -> dict:
+            self.calls.append((prefix, prompt))
+            return self.mock_response
+
+    provider = PrefixProvider()
+    judge = AuthenticityJudge(persona_path=persona_path, judge_provider=provider)
+    turns = _sample_session_turns()
+
+    judge.evaluate_session(session_id="s1", turns=turns, scenario_tag="billing")
+    judge.evaluate_session(session_id="s2", turns=turns)
+
+    (prefix_one, suffix_one), (prefix_two, suffix_two) = provider.calls
+    assert prefix_one is prefix_two is judge.persona_prefix
+    assert "s1" in suffix_one and "s2" in suffix_two
+    assert "Brand Voice Definition" not in suffix_one
+    assert prefix_one + suffix_one == format_authenticity_prompt(
+        persona_id=judge.persona_id,
+        persona_description=judge.persona_description,
+        persona_tone=judge.persona_tone,
+        persona_formality=judge.persona_formality,
+        preferred_words=judge.preferred_words,
+        avoided_words=judge.avoided_words,
+        exemplars=judge.exemplars,
+        scenario_tag="billing",
+        session_id="s1",
+        conversation_turns=turns,
+    )
+
+
 def test_format_authenticity_prompt():
     """Test prompt formatting."""
     prompt = format_authenticity_prompt(
@@ -0,0 +1,27 @@
+"""Tests for the multi-pattern phrase automaton."""
+
+from __future__ import annotations
+
+from alignmenter.utils.automaton import PhraseAutomaton
+
+
+def test_automaton_finds_overlapping_patterns() -> None:
+    automaton = PhraseAutomaton(["he", "she", "his", "hers", "she"])
+    assert automaton.patterns == ["he", "she", "his", "hers"]
+
+    matches = sorted((start, end, automaton.patterns[pid]) for start, end, pid in automaton.finditer("ushers"))
+    assert matches == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+
+def test_automaton_matches_substring_semantics() -> None:
+    phrases = ["signal", "clear signal", "a", "nal c", "missing"]
+    automaton = PhraseAutomaton(phrases)
+    text = "a clear signal cuts through"
+    found = {automaton.patterns[pid] for pid in automaton.matched_ids(text)}
+    assert found == {phrase for phrase in phrases if phrase in text}
+
+
+def test_empty_automaton() -> None:
+    automaton = PhraseAutomaton(["", ""])
+    assert not automaton
+    assert list(automaton.finditer("anything")) == []
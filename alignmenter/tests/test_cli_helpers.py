@@ -337,3 +337,72 @@ def test_run_command_invalid_model() -> None:
 
     assert result.exit_code != 0
     assert "Path not found" not in result.output
+
+
+def test_cache_commands(tmp_path: Path) -> None:
+    from alignmenter.providers.embedding_cache import EmbeddingDiskCache
+
+    cache = EmbeddingDiskCache(tmp_path, "openai", "text-embedding-3-small")
+    cache.put_many(["k1", "k2"], [[1.0, 0.0], [0.0, 1.0]])
+    cache.flush()
+
+    stats = runner.invoke(app, ["cache", "stats", "--cache-dir", str(tmp_path)])
+    assert stats.exit_code == 0, stats.output
+    assert "openai:text-embedding-3-small" in stats.output
+    assert "2 vectors" in stats.output
+
+    prune = runner.invoke(app, ["cache", "prune", "--max-size", "0", "--cache-dir", str(tmp_path)])
+    assert prune.exit_code == 0, prune.output
+    assert "Removed 1 shards" in prune.output
+
+    clear = runner.invoke(app, ["cache", "clear", "--yes", "--cache-dir", str(tmp_path)])
+    assert clear.exit_code == 0, clear.output
+    assert "Embedding cache is empty" in runner.invoke(app, ["cache", "stats", "--cache-dir", str(tmp_path)]).output
+
+
+def test_cache_commands_cover_judge_responses(tmp_path: Path) -> None:
+    from alignmenter.providers.judge_cache import JudgeResponseCache
+
+    cache = JudgeResponseCache(tmp_path)
+    cache.put("k1", "openai", "gpt-4o-mini", {"score": 1.0})
+    cache.close()
+
+    stats = runner.invoke(app, ["cache", "stats", "--cache-dir", str(tmp_path)])
+    assert stats.exit_code == 0, stats.output
+    assert "openai:gpt-4o-mini — 1 responses" in stats.output
+
+    clear = runner.invoke(app, ["cache", "clear", "--judge", "--yes", "--cache-dir", str(tmp_path)])
+    assert clear.exit_code == 0, clear.output
+    assert "Cleared 1 judge responses" in clear.output
+    assert "Judge cache is empty" in runner.invoke(app, ["cache", "stats", "--cache-dir", str(tmp_path)]).output
+
+
+def test_calibrate_commands_pass_pack_size(tmp_path: Path, monkeypatch) -> None:
+    from alignmenter.calibration import analyze, diagnose, validate
+
+    seen: dict[str, int] = {}
+
+    def capture(name):
+        def fake(**kwargs):
+            seen[name] = kwargs["judge_pack_size"]
+            return {}
+
+        return fake
+
+    monkeypatch.setattr(validate, "validate_calibration", capture("validate"))
+    monkeypatch.setattr(diagnose, "diagnose_calibration_errors", capture("diagnose"))
+    monkeypatch.setattr(analyze, "analyze_scenario_performance", capture("analyze"))
+
+    common = ["--persona", str(tmp_path / "p.yaml"), "--output", str(tmp_path / "out.json"), "--pack-size", "4"]
+    for command, source in (
+        ("validate", "--labeled"),
+        ("diagnose-errors", "--labeled"),
+        ("analyze-scenarios", "--dataset"),
+    ):
+        args = ["calibrate", command, source, str(tmp_path / "data.jsonl"), *common]
+        if command != "validate":
+            args += ["--judge", "openai:gpt-4o-mini"]
+        result = runner.invoke(app, args)
+        assert result.exit_code == 0, result.output
+
+    assert seen == {"validate": 4, "diagnose": 4, "analyze": 4}
@@ -0,0 +1,89 @@
+"""Tests for concurrent judge execution with admission control."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from alignmenter.judges.executor import JudgeExecutor
+
+
+class _TrackingJudge:
+    def __init__(self, delay: float = 0.0, cost: float = 1.0) -> None:
+        self.delay = delay
+        self.cost = cost
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, item: int) -> dict:
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+        return {"item": item, "cost": self.cost}
+
+
+def test_executor_runs_calls_concurrently_within_limit() -> None:
+    judge = _TrackingJudge(delay=0.05)
+    executor = JudgeExecutor(max_in_flight=8)
+
+    started = time.perf_counter()
+    run = executor.run(judge, range(32), cost_of=lambda result: result["cost"])
+    elapsed = time.perf_counter() - started
+
+    assert sorted(call.item for call in run.completed) == list(range(32))
+    assert run.stopped is None
+    assert 1 < judge.peak <= 8
+    assert elapsed < 32 * 0.05 / 2
+
+
+def test_executor_reserves_cost_before_admitting_calls() -> None:
+    judge = _TrackingJudge(delay=0.02, cost=1.0)
+    executor = JudgeExecutor(max_in_flight=32, cost_limit=5.0, cost_estimate=1.0)
+
+    run = executor.run(judge, range(100), cost_of=lambda result: result["cost"])
+
+    assert len(run.completed) == 5
+    assert run.cost_spent == 5.0
+    assert run.stopped == "cost"
+    assert list(run.unstarted) == list(range(5, 100))
+
+
+def test_executor_respects_call_budget() -> None:
+    judge = _TrackingJudge(delay=0.01)
+    executor = JudgeExecutor(max_in_flight=32, call_budget=3)
+
+    run = executor.run(judge, range(10), cost_of=lambda result: 0.0)
+
+    assert len(run.completed) == 3
+    assert run.stopped == "budget"
+    assert judge.peak <= 3
+
+
+def test_executor_probes_cost_without_estimate() -> None:
+    judge = _TrackingJudge(delay=0.02, cost=2.0)
+    executor = JudgeExecutor(max_in_flight=8, cost_limit=3.0)
+
+    run = executor.run(judge, range(10), cost_of=lambda result: result["cost"])
+
+    # The first call runs alone; its actual cost then sizes later reservations.
+    assert len(run.completed) == 2
+    assert run.stopped == "cost"
+    assert judge.peak == 1
+
+
+def test_executor_revalues_in_flight_calls_when_estimate_is_low() -> None:
+    judge = _TrackingJudge(delay=0.02, cost=0.01)
+    executor = JudgeExecutor(max_in_flight=4, cost_limit=0.05, cost_estimate=0.001)
+
+    run = executor.run(judge, range(100), cost_of=lambda result: result["cost"])
+
+    # Only the first wave is admitted on the low estimate; later admissions
+    # count every in-flight call at the most expensive cost seen.
+    assert judge.peak > 1
+    assert run.stopped == "cost"
+    assert run.cost_spent <= 0.05 + 0.01 + 1e-9
+    assert run.max_call_cost == 0.01
@@ -0,0 +1,46 @@
+"""Tests for packed judge prompts and responses."""
+
+from __future__ import annotations
+
+import json
+
+from alignmenter.judges.packing import (
+    format_safety_pack,
+    parse_packed_response,
+    split_usage,
+)
+
+
+def test_format_safety_pack_numbers_each_response():
+    prompt = format_safety_pack(["first", "second"])
+
+    assert "## Response 1\n\nfirst" in prompt
+    assert "## Response 2\n\nsecond" in prompt
+    assert "JSON array" in prompt
+
+
+def test_parse_packed_response_matches_ids_and_tolerates_prose():
+    text = "Here you go:\n```json\n" + json.dumps(
+        [{"id": 2, "score": 0.1}, {"id": 1, "score": 0.9}, {"id": 7, "score": 0.5}]
+    ) + "\n```"
+
+    items = parse_packed_response(text, 3)
+
+    assert items[0] == {"id": 1, "score": 0.9}
+    assert items[1] == {"id": 2, "score": 0.1}
+    assert items[2] is None
+
+
+def test_parse_packed_response_falls_back_to_position_only_on_exact_count():
+    assert parse_packed_response(json.dumps([{"score": 1}, {"score": 0}]), 2) == [{"score": 1}, {"score": 0}]
+    assert parse_packed_response(json.dumps([{"score": 1}]), 2) == [None, None]
+    assert parse_packed_response("not json", 2) == [None, None]
+
+
+def test_split_usage_divides_numeric_fields():
+    assert split_usage({"prompt_tokens": 900, "completion_tokens": 30, "model": "m"}, 3) == {
+        "prompt_tokens": 300,
+        "completion_tokens": 10,
+        "model": "m",
+    }
+    assert split_usage(None, 3) is None
@@ -136,6 +136,36 @@ def test_anthropic_judge_returns_raw_json():
     assert parsed["suggestion"] == "Use more casual language"
 
 
+def test_anthropic_judge_marks_prefix_cacheable():
+    """Test that the shared prefix is sent as a cache_control block."""
+
+    class CachingAnthropicClient(MockAnthropicClient):
+        def __init__(self, response_content: str):
+            super().__init__(response_content)
+            self.requests = []
+
+        def create(self, **kwargs):
+            self.requests.append(kwargs)
+            response = super().create(**kwargs)
+            response.usage.cache_read_input_tokens = 800
+            response.usage.cache_creation_input_tokens = 0
+            return response
+
+    client = CachingAnthropicClient(json.dumps({"score": 0.9}))
+    judge = AnthropicJudge(model="claude-3-5-haiku-20241022", client=client)
+
+    result = judge.evaluate_with_prefix("PERSONA", "SESSION")
+
+    content = client.requests[0]["messages"][0]["content"]
+    assert content == [
+        {"type": "text", "text": "PERSONA", "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": "SESSION"},
+    ]
+    assert result["usage"]["prompt_tokens"] == 900
+    assert result["usage"]["cached_prompt_tokens"] == 800
+    assert result["usage"]["total_tokens"] == 950
+
+
 def test_safety_scorer_format_compatibility():
     """Test that safety scorer format still works (backward compatibility)."""
     # Mock response with safety judge format (simpler)
@@ -106,3 +106,85 @@ def test_context_blindness():
 
     # Would need ML model to understand context
     # This demonstrates why distilled-safety-roberta is better
+
+
+class FakePipeline:
+    """Stand-in for a text-classification pipeline that records each call."""
+
+    def __init__(self, fail_batches: bool = False) -> None:
+        self.calls = []
+        self.fail_batches = fail_batches
+
+    def __call__(self, inputs, **kwargs):
+        self.calls.append((inputs, kwargs))
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        elif self.fail_batches:
+            raise RuntimeError("batch failed")
+        return [
+            {"label": "unsafe" if "attack" in text else "safe", "score": 0.9}
+            for text in inputs
+        ]
+
+
+def test_pipeline_classifier_batches_by_length_and_restores_order():
+    from alignmenter.providers.classifiers import PipelineSafetyClassifier
+
+    pipe = FakePipeline()
+    classifier = PipelineSafetyClassifier(pipe, batch_size=2)
+    texts = ["a much longer attack description", "", "short", "attack now"]
+
+    scores = classifier.classify_batch(texts)
+
+    assert [round(value, 3) for value in scores] == [0.1, 1.0, 0.9, 0.1]
+    assert [batch for batch, _ in pipe.calls] == [["short", "attack now"], ["a much longer attack description"]]
+    assert all(kwargs == {"batch_size": 2, "truncation": True} for _, kwargs in pipe.calls)
+    assert round(classifier("attack"), 3) == 0.1
+
+
+def test_pipeline_classifier_retries_failed_batches_per_text():
+    from alignmenter.providers.classifiers import PipelineSafetyClassifier
+
+    pipe = FakePipeline(fail_batches=True)
+    scores = PipelineSafetyClassifier(pipe, batch_size=8).classify_batch(["attack", "hello"])
+
+    assert [round(value, 3) for value in scores] == [0.1, 0.9]
+    assert sorted(inputs for inputs, _ in pipe.calls[1:]) == ["attack", "hello"]
+
+
+def test_classify_texts_falls_back_for_plain_callables():
+    import math
+
+    from alignmenter.providers.classifiers import classify_texts
+
+    def flaky(text: str) -> float:
+        if text == "boom":
+            raise ValueError(text)
+        return 0.5
+
+    scores = classify_texts(flaky, ["ok", "boom"])
+    assert scores[0] == 0.5
+    assert math.isnan(scores[1])
+
+
+def test_safety_scorer_classifies_turns_in_batches(tmp_path):
+    from pathlib import Path
+
+    from alignmenter.providers.classifiers import PipelineSafetyClassifier
+    from alignmenter.scorers.safety import SafetyScorer
+
+    keywords = Path(__file__).resolve().parents[1] / "configs" / "safety_keywords.yaml"
+    pipe = FakePipeline()
+    scorer = SafetyScorer(
+        keyword_path=keywords,
+        classifier=PipelineSafetyClassifier(pipe),
+        classifier_batch_size=3,
+    )
+    sessions = [
+        {"turns": [{"role": "assistant", "text": f"reply number {index}"} for index in range(7)]},
+    ]
+
+    result = scorer.score(sessions)
+
+    assert result["classifier_calls"] == 7
+    assert [len(batch) for batch, _ in pipe.calls] == [3, 3, 1]
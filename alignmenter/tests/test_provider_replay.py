@@ -0,0 +1,151 @@
+"""Tests for the chat record/replay cache."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from alignmenter.providers.base import ChatResponse
+from alignmenter.providers.replay import (
+    ChatReplayCache,
+    ReplayChatProvider,
+    ReplayMissError,
+    chat_cache_key,
+)
+from alignmenter.runner import RunConfig, Runner
+
+
+class CountingProvider:
+    name = "openai"
+    model = "gpt-4o-mini"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def chat(self, messages, **kwargs):
+        self.calls += 1
+        return ChatResponse(
+            text=f"reply {self.calls} to {messages[-1]['content']}",
+            usage={"prompt_tokens": 7, "completion_tokens": 3, "total_tokens": 10},
+        )
+
+    def tokenizer(self):  # pragma: no cover - not used in tests
+        return None
+
+
+def test_chat_cache_key_is_canonical() -> None:
+    first = chat_cache_key("openai", "gpt-4o", [{"role": "user", "content": "hi"}], {"temperature": 0, "seed": 1})
+    reordered = chat_cache_key("openai", "gpt-4o", [{"content": "hi", "role": "user"}], {"seed": 1, "temperature": 0})
+    assert first == reordered
+    assert first != chat_cache_key("openai", "gpt-4o", [{"role": "user", "content": "hi"}], {"temperature": 1, "seed": 1})
+    assert first != chat_cache_key("openai", "gpt-4o-mini", [{"role": "user", "content": "hi"}], {"temperature": 0, "seed": 1})
+
+
+def test_replay_modes(tmp_path: Path) -> None:
+    messages = [{"role": "user", "content": "hello"}]
+    base = CountingProvider()
+
+    recorder = ReplayChatProvider(base, ChatReplayCache(tmp_path), mode="record-missing")
+    first = recorder.chat(messages)
+    again = recorder.chat(messages)
+    assert base.calls == 1
+    assert again == first
+    assert recorder.replay_stats == {"mode": "record-missing", "hits": 1, "misses": 1, "recorded": 1, "hit_rate": 0.5}
+
+    # Record mode refreshes the stored response even when one exists.
+    ReplayChatProvider(base, ChatReplayCache(tmp_path), mode="record").chat(messages)
+    assert base.calls == 2
+
+    offline = ReplayChatProvider.from_model_identifier(
+        "openai:gpt-4o-mini", None, ChatReplayCache(tmp_path), mode="replay"
+    )
+    assert offline.chat(messages).text == "reply 2 to hello"
+    with pytest.raises(ReplayMissError):
+        offline.chat([{"role": "user", "content": "never recorded"}])
+
+    with pytest.raises(ValueError):
+        ReplayChatProvider(None, ChatReplayCache(tmp_path), mode="record")
+    with pytest.raises(ValueError):
+        ReplayChatProvider(base, ChatReplayCache(tmp_path), mode="rewind")
+
+
+class StubScorer:
+    id = "stub"
+
+    def score(self, sessions):
+        return {"mean": 0.5}
+
+
+def _write_dataset(tmp_path: Path) -> Path:
+    dataset_path = tmp_path / "dataset.jsonl"
+    records = [
+        {"session_id": "s1", "turn_index": turn, "role": "user" if turn % 2 == 0 else "assistant", "text": f"turn {turn}"}
+        for turn in range(4)
+    ]
+    dataset_path.write_text("\n".join(json.dumps(record) for record in records) + "\n", encoding="utf-8")
+    return dataset_path
+
+
+def _run_config(tmp_path: Path, out: str, **overrides) -> RunConfig:
+    repo_root = Path(__file__).resolve().parents[1]
+    return RunConfig(
+        model="openai:gpt-4o-mini",
+        dataset_path=_write_dataset(tmp_path),
+        persona_path=repo_root / "configs" / "persona" / "default.yaml",
+        report_out_dir=tmp_path / out,
+        run_id="replay",
+        **overrides,
+    )
+
+
+def test_runner_replays_recorded_transcripts_offline(tmp_path: Path) -> None:
+    def run(provider, out: str) -> Path:
+        config = _run_config(tmp_path, out)
+        return Runner(config=config, scorers=[StubScorer()], provider=provider, generate_transcripts=True).execute()
+
+    store = tmp_path / "store"
+    base = CountingProvider()
+    recorded_dir = run(ReplayChatProvider(base, ChatReplayCache(store), mode="record-missing"), "recorded")
+    replayed_dir = run(
+        ReplayChatProvider.from_model_identifier("openai:gpt-4o-mini", None, ChatReplayCache(store), mode="replay"),
+        "replayed",
+    )
+
+    assert base.calls == 2
+    transcript = "transcripts/openai_gpt-4o-mini.jsonl"
+    assert (recorded_dir / transcript).read_text() == (replayed_dir / transcript).read_text()
+    replay = json.loads((replayed_dir / "run.json").read_text())["replay"]["primary"]
+    assert replay["hits"] == 2 and replay["misses"] == 0
+
+
+def test_runner_reports_replay_stats_per_provider(tmp_path: Path) -> None:
+    store = tmp_path / "store"
+    base = CountingProvider()
+    config = _run_config(tmp_path, "warm")
+    Runner(
+        config=config,
+        scorers=[StubScorer()],
+        provider=ReplayChatProvider(base, ChatReplayCache(store), mode="record-missing"),
+        generate_transcripts=True,
+    ).execute()
+
+    # Primary replays the warm run; compare uses another model and records fresh.
+    cache = ChatReplayCache(store)
+    compare_base = CountingProvider()
+    compare_base.model = "gpt-4o"
+    run_dir = Runner(
+        config=_run_config(tmp_path, "compare", compare_model="openai:gpt-4o"),
+        scorers=[StubScorer()],
+        provider=ReplayChatProvider(base, cache, mode="record-missing"),
+        compare_provider=ReplayChatProvider(compare_base, cache, mode="record-missing"),
+        compare_scorers=[StubScorer()],
+        generate_transcripts=True,
+    ).execute()
+
+    replay = json.loads((run_dir / "run.json").read_text())["replay"]
+    assert replay["primary"]["hits"] == 2 and replay["primary"]["misses"] == 0
+    assert replay["compare"]["hits"] == 0 and replay["compare"]["misses"] == 2
+    assert replay["compare"]["recorded"] == 2
+    assert cache.hits == 2 and cache.misses == 2
@@ -2,9 +2,25 @@
 
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 
-from alignmenter.providers.embeddings import CachedEmbeddingProvider, load_embedding_provider
+from alignmenter.providers.embedding_cache import (
+    EmbeddingDiskCache,
+    cache_stats,
+    clear_cache,
+    flush_all,
+    prune_cache,
+)
+from alignmenter.providers.embeddings import (
+    CachedEmbeddingProvider,
+    PersistentEmbeddingProvider,
+    clear_embedding_registry,
+    embed_in_batches,
+    embed_matrix,
+    load_embedding_provider,
+    normalize_rows,
+)
 from alignmenter.providers.judges import CachedJudgeProvider
 
 
@@ -27,7 +43,7 @@ class DummyJudge:
 
     def evaluate(self, prompt: str) -> dict:
         self.calls += 1
-        return {"score": 0.5, "notes": prompt}
+        return {"score": 0.5, "notes": prompt, "usage": {"prompt_tokens": 10, "completion_tokens": 2}}
 
 
 def test_cached_embedding_provider_reuses_vectors():
@@ -54,6 +70,126 @@ def test_cached_judge_provider_reuses_evaluations():
     assert base.calls == 2
 
 
+def test_cached_judge_provider_persists_across_processes(tmp_path) -> None:
+    from alignmenter.providers.judge_cache import JudgeResponseCache, judge_cache_stats
+
+    base = DummyJudge()
+    base.model = "judge-model"
+    first = CachedJudgeProvider(base, JudgeResponseCache(tmp_path))
+    response = first.evaluate("prompt")
+    assert "cached" not in response
+    assert base.calls == 1
+
+    # A fresh provider (as in a new run) is served from disk.
+    disk_cache = JudgeResponseCache(tmp_path)
+    second = CachedJudgeProvider(base, disk_cache)
+    replay = second.evaluate("prompt")
+    assert replay["cached"] is True
+    assert replay["notes"] == "prompt"
+    assert base.calls == 1
+    assert (disk_cache.hits, disk_cache.misses) == (1, 0)
+
+    # Changing decoding parameters changes the key.
+    base.decoding_params = {"temperature": 0.5}
+    CachedJudgeProvider(base, JudgeResponseCache(tmp_path)).evaluate("prompt")
+    assert base.calls == 2
+
+    stats = judge_cache_stats(tmp_path)
+    assert stats["entries"] == 2
+    assert stats["models"] == {"dummy:judge-model": 2}
+
+
+
+def test_cached_judge_provider_skips_unusable_responses(tmp_path) -> None:
+    from alignmenter.providers.judge_cache import JudgeResponseCache
+    from alignmenter.providers.judges import OpenAIJudge
+
+    replies = iter(["I think this is fine.", "```json\n{\"score\": 0.9}\n```"])
+
+    class Completions:
+        calls = 0
+
+        def create(self, **kwargs):
+            Completions.calls += 1
+            message = Mock(content=next(replies))
+            usage = Mock(prompt_tokens=10, completion_tokens=2, total_tokens=12, prompt_tokens_details=None)
+            return Mock(choices=[Mock(message=message)], usage=usage)
+
+    client = Mock()
+    client.chat.completions = Completions()
+    base = OpenAIJudge("gpt-4o-mini", client=client)
+
+    garbled = CachedJudgeProvider(base, JudgeResponseCache(tmp_path)).evaluate("prompt")
+    assert garbled["parsed"] is False
+
+    # The garbled answer was not stored, so a new run asks again; a fenced
+    # JSON answer parses to its real score and is kept.
+    provider = CachedJudgeProvider(base, JudgeResponseCache(tmp_path))
+    fenced = provider.evaluate("prompt")
+    assert fenced["score"] == 0.9
+    assert provider.evaluate("prompt")["cached"] is True
+    assert CachedJudgeProvider(base, JudgeResponseCache(tmp_path)).evaluate("prompt")["cached"] is True
+    assert Completions.calls == 2
+    assert provider.cache_stats == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    class NoUsageJudge(DummyJudge):
+        def evaluate(self, prompt: str) -> dict:
+            self.calls += 1
+            return {"score": 1.0, "notes": prompt}
+
+    no_usage = NoUsageJudge()
+    uncached = CachedJudgeProvider(no_usage)
+    uncached.evaluate("prompt")
+    uncached.evaluate("prompt")
+    assert no_usage.calls == 2
+
+
+def test_cached_judge_provider_shares_concurrent_identical_calls() -> None:
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    class SlowJudge(DummyJudge):
+        def __init__(self) -> None:
+            super().__init__()
+            self._lock = threading.Lock()
+
+        def evaluate(self, prompt: str) -> dict:
+            with self._lock:
+                self.calls += 1
+            time.sleep(0.05)
+            return {"score": 0.5, "notes": prompt, "usage": {"prompt_tokens": 10}}
+
+    base = SlowJudge()
+    provider = CachedJudgeProvider(base)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        responses = list(pool.map(provider.evaluate, ["same"] * 8))
+
+    assert base.calls == 1
+    assert sum(1 for response in responses if response.get("cached")) == 7
+    assert provider.cache_stats == {"hits": 7, "misses": 1, "hit_rate": 0.875}
+
+def test_judge_response_cache_ttl_and_prune(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import time
+
+    from alignmenter.providers import judge_cache
+    from alignmenter.providers.judge_cache import JudgeResponseCache, clear_judge_cache, prune_judge_cache
+
+    cache = JudgeResponseCache(tmp_path, ttl_seconds=60)
+    cache.put("key", "openai", "gpt-4o-mini", {"score": 0.9})
+    assert cache.get("key") == {"score": 0.9}
+
+    later = time.time() + 120
+    monkeypatch.setattr(judge_cache.time, "time", lambda: later)
+    assert cache.get("key") is None
+    assert prune_judge_cache(tmp_path, older_than_seconds=60) == {"removed_entries": 1}
+
+    cache.put("other", "openai", "gpt-4o-mini", {"score": 0.1})
+    cache.close()
+    assert clear_judge_cache(tmp_path)["removed_entries"] == 1
+    assert JudgeResponseCache(tmp_path).get("other") is None
+
+
 def test_load_embedding_provider_hashed_fallback() -> None:
     provider = load_embedding_provider(None)
     vectors = provider.embed(["foo", "foo"])
@@ -72,3 +208,151 @@ def test_load_embedding_provider_sentence_transformer(monkeypatch: pytest.Monkey
     provider.embed(["foo"])
     # second embed uses cached value, so underlying model should not run again
     assert dummy_model.encode.call_count == 1
+
+
+def test_persistent_embedding_provider_survives_new_instances(tmp_path) -> None:
+    base = DummyEmbedder()
+    cache = EmbeddingDiskCache(tmp_path, "dummy", "model-a")
+    provider = PersistentEmbeddingProvider(base, cache)
+
+    assert provider.embed(["alpha", "beta", "alpha"]) == [[5.0], [4.0], [5.0]]
+    assert base.calls == 2
+    cache.flush()
+
+    fresh_base = DummyEmbedder()
+    reopened = PersistentEmbeddingProvider(fresh_base, EmbeddingDiskCache(tmp_path, "dummy", "model-a"))
+    assert reopened.embed(["beta", "alpha", "gamma"]) == [[4.0], [5.0], [5.0]]
+    assert fresh_base.calls == 1
+
+    # A different model gets its own namespace.
+    other_base = DummyEmbedder()
+    other = PersistentEmbeddingProvider(other_base, EmbeddingDiskCache(tmp_path, "dummy", "model-b"))
+    other.embed(["alpha"])
+    assert other_base.calls == 1
+
+
+def test_embedding_disk_cache_prune_and_clear(tmp_path) -> None:
+    cache = EmbeddingDiskCache(tmp_path, "dummy", "model", flush_rows=1)
+    cache.put_many(["k1"], [[1.0, 2.0]])
+    cache.put_many(["k2"], [[3.0, 4.0]])
+
+    stats = cache_stats(tmp_path)
+    assert stats["entries"] == 2
+    assert stats["shards"] == 2
+
+    result = prune_cache(tmp_path, max_bytes=stats["bytes"] - 1)
+    assert result["removed_shards"] == 1
+
+    reopened = EmbeddingDiskCache(tmp_path, "dummy", "model")
+    first, second = reopened.get_many(["k1", "k2"])
+    assert first is None
+    assert list(second) == [3.0, 4.0]
+
+    clear_cache(tmp_path)
+    assert cache_stats(tmp_path)["entries"] == 0
+
+
+
+def test_embedding_disk_cache_prunes_only_past_max_bytes(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from alignmenter.providers import embedding_cache
+
+    prunes = []
+    real_prune = embedding_cache.prune_cache
+
+    def counting_prune(root, **kwargs):
+        prunes.append(kwargs)
+        return real_prune(root, **kwargs)
+
+    monkeypatch.setattr(embedding_cache, "prune_cache", counting_prune)
+
+    probe = EmbeddingDiskCache(tmp_path / "probe", "dummy", "model", flush_rows=1)
+    probe.put_many(["k0"], [[0.0, 0.0]])
+    shard_bytes = cache_stats(tmp_path / "probe")["bytes"]
+
+    cache = EmbeddingDiskCache(tmp_path, "dummy", "model", flush_rows=1, max_bytes=3 * shard_bytes + shard_bytes // 2)
+    for position in range(3):
+        cache.put_many([f"k{position}"], [[float(position), 1.0]])
+    assert prunes == []
+
+    cache.put_many(["k3"], [[3.0, 1.0]])
+    assert len(prunes) == 1
+    stats = cache_stats(tmp_path)
+    assert stats["shards"] == 3
+    assert stats["bytes"] <= cache.max_bytes
+
+    # Eviction is first-in first-out: reading the oldest shard does not save it.
+    assert cache.get_many(["k1"])[0] is not None
+    cache.put_many(["k4"], [[4.0, 1.0]])
+    assert len(prunes) == 2
+    reopened = EmbeddingDiskCache(tmp_path, "dummy", "model")
+    assert [vector is not None for vector in reopened.get_many(["k1", "k2", "k3", "k4"])] == [False, True, True, True]
+
+def test_load_embedding_provider_respects_cache_toggle(monkeypatch: pytest.MonkeyPatch) -> None:
+    from alignmenter.config import get_settings
+
+    dummy_model = Mock()
+    dummy_model.encode.side_effect = lambda texts, convert_to_numpy=False: [[float(len(t))] for t in texts]
+    monkeypatch.setattr("alignmenter.providers.embeddings.SentenceTransformer", lambda name: dummy_model)
+
+    load_embedding_provider("sentence-transformer:dummy-model").embed(["foo"])
+    flush_all()
+    clear_embedding_registry()
+    load_embedding_provider("sentence-transformer:dummy-model").embed(["foo"])
+    assert dummy_model.encode.call_count == 1
+
+    monkeypatch.setenv("ALIGNMENTER_EMBEDDING_CACHE", "false")
+    get_settings.cache_clear()
+    load_embedding_provider("sentence-transformer:dummy-model").embed(["foo"])
+    assert dummy_model.encode.call_count == 2
+
+
+def test_embed_matrix_returns_contiguous_float32() -> None:
+    provider = load_embedding_provider("hashed")
+    matrix = provider.embed_array(["alpha beta", "gamma"])
+    assert matrix.dtype == np.float32
+    assert matrix.flags["C_CONTIGUOUS"]
+    assert matrix.shape == (2, 512)
+    assert provider.embed(["gamma"]) == [matrix[1].tolist()]
+
+    # List-only providers go through the compatibility path.
+    fallback = embed_matrix(DummyEmbedder(), ["abc", "de"])
+    assert fallback.dtype == np.float32
+    assert fallback.tolist() == [[3.0], [2.0]]
+
+    batched = embed_in_batches(DummyEmbedder(), ["a", "bb", "ccc"], batch_size=2)
+    assert batched.shape == (3, 1)
+
+
+def test_normalize_rows_handles_zero_vectors() -> None:
+    normalized = normalize_rows(np.array([[3.0, 4.0], [0.0, 0.0]]))
+    assert np.allclose(normalized, [[0.6, 0.8], [0.0, 0.0]])
+
+
+def test_embedding_registry_shares_models_across_scorers(monkeypatch: pytest.MonkeyPatch) -> None:
+    from pathlib import Path
+
+    from alignmenter.scorers.authenticity import AuthenticityScorer
+    from alignmenter.scorers.stability import StabilityScorer
+
+    loads = []
+
+    def _factory(name):
+        loads.append(name)
+        model = Mock()
+        model.encode.side_effect = lambda texts, convert_to_numpy=False: [[float(len(t)), 1.0] for t in texts]
+        return model
+
+    monkeypatch.setattr("alignmenter.providers.embeddings.SentenceTransformer", _factory)
+
+    persona_path = Path(__file__).resolve().parents[1] / "configs" / "persona" / "default.yaml"
+    identifier = "sentence-transformer:dummy-model"
+    scorers = [
+        AuthenticityScorer(persona_path, embedding=identifier),
+        StabilityScorer(embedding=identifier),
+        AuthenticityScorer(persona_path, embedding=identifier),
+        StabilityScorer(embedding=identifier),
+    ]
+
+    assert loads == ["dummy-model"]
+    assert len({id(scorer.embedder) for scorer in scorers}) == 1
+    assert load_embedding_provider(None) is load_embedding_provider("hashed")
@@ -33,6 +33,9 @@ scorers:
     judge:
       provider: none
       budget: 3
+      max_in_flight: 16
+      pack_size: 4
+      pairwise: true
 report:
   out_dir: ../reports
   include_raw: false
@@ -48,5 +51,75 @@ report:
     assert options["embedding"] == "hashed"
     assert options["judge_provider"] == "none"
     assert options["judge_budget"] == 3
+    assert options["judge_max_in_flight"] == 16
+    assert options["judge_pack_size"] == 4
+    assert options["judge_pairwise"] is True
     assert options["report_out_dir"] == (tmp_path / "reports").resolve()
     assert options["include_raw"] is False
+
+
+def test_load_run_options_authenticity_settings(tmp_path: Path) -> None:
+    config_path = tmp_path / "run.yaml"
+    config_path.write_text(
+        """
+scorers:
+  authenticity:
+    batch_size: 16
+    bootstrap_iterations: 10000
+    ci_method: BCa
+"""
+    )
+
+    options = load_run_options(config_path)
+    assert options["embedding_batch_size"] == 16
+    assert options["bootstrap_iterations"] == 10000
+    assert options["ci_method"] == "bca"
+
+
+def test_load_run_options_concurrency(tmp_path: Path) -> None:
+    config_path = tmp_path / "run.yaml"
+    config_path.write_text(
+        """
+providers:
+  primary: openai:gpt-4o-mini
+  concurrency: 8
+  context:
+    mode: tokens
+    max_tokens: 2000
+  replay:
+    mode: Replay
+    dir: recordings
+"""
+    )
+
+    options = load_run_options(config_path)
+    assert options["replay_mode"] == "replay"
+    assert options["replay_dir"] == (tmp_path / "recordings").resolve()
+    assert options["concurrency"] == 8
+    assert options["context_policy"] == {"mode": "tokens", "max_tokens": 2000}
+
+
+def test_load_run_options_stability_settings(tmp_path: Path) -> None:
+    config_path = tmp_path / "run.yaml"
+    config_path.write_text(
+        """
+scorers:
+  stability:
+    mode: Online
+    window: 10
+    drift_threshold: 0.25
+  safety:
+    classifier_batch_size: 16
+    judge_strategy: Priority
+    cascade:
+      safe_above: 0.85
+"""
+    )
+
+    options = load_run_options(config_path)
+    assert options["stability_mode"] == "online"
+    assert options["stability_window"] == 10
+    assert options["stability_drift_threshold"] == 0.25
+    assert options["classifier_batch_size"] == 16
+    assert options["judge_strategy"] == "priority"
+    assert options["safety_cascade"] == {"safe_above": 0.85}
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 from pathlib import Path
 
 from alignmenter.providers.base import ChatResponse
@@ -74,6 +76,66 @@ def test_runner_execute_with_compare(tmp_path: Path) -> None:
     assert "scorecards" in payload
 
 
+def test_runner_compare_with_pairwise_judge(tmp_path: Path) -> None:
+    from alignmenter.judges.authenticity_judge import AuthenticityJudge
+    from alignmenter.providers.judges import CachedJudgeProvider
+
+    root = Path(__file__).resolve().parents[2]
+    base = root / "alignmenter"
+    config = RunConfig(
+        model="openai:gpt-4o-mini",
+        dataset_path=base / "datasets" / "demo_conversations.jsonl",
+        persona_path=base / "configs" / "persona" / "default.yaml",
+        compare_model="openai:gpt-4o-mini",
+        run_id="test",
+        report_out_dir=tmp_path,
+    )
+
+    class PairwiseProvider:
+        name = "mock"
+
+        def __init__(self) -> None:
+            self.prompts = []
+
+        def evaluate(self, prompt: str) -> dict:
+            self.prompts.append(prompt)
+            return {
+                "notes": json.dumps({"score_a": 8, "score_b": 6, "preference": "A"}),
+                "usage": {"prompt_tokens": 100, "completion_tokens": 10},
+            }
+
+    provider = PairwiseProvider()
+    cached = CachedJudgeProvider(provider)
+    judge = AuthenticityJudge(persona_path=config.persona_path, judge_provider=cached, cost_per_call=0.0)
+
+    def run() -> Path:
+        return Runner(
+            config=config,
+            scorers=[StubScorer()],
+            compare_scorers=[StubScorer()],
+            pairwise_judge=judge,
+            pairwise_options={"max_in_flight": 2},
+            judge_provider=cached,
+        ).execute()
+
+    run_dir = run()
+
+    pairwise = json.loads((run_dir / "results.json").read_text())["scores"]["pairwise"]
+    sessions = pairwise["sessions"]
+    assert sessions == len(provider.prompts) > 1
+    assert pairwise["primary_wins"] + pairwise["compare_wins"] == sessions
+    assert pairwise["first_position_win_rate"] == 1.0
+    assert len(pairwise["results"]) == sessions
+    aggregates = json.loads((run_dir / "aggregates.json").read_text())["aggregates"]
+    assert aggregates["pairwise"]["sessions"] == sessions
+    judge_cache = json.loads((run_dir / "run.json").read_text())["judge_cache"]["all_calls"]
+    assert judge_cache == {"hits": 0, "misses": sessions, "hit_rate": 0.0}
+
+    rerun = json.loads((run() / "run.json").read_text())
+    assert rerun["judge_cache"]["all_calls"] == {"hits": sessions, "misses": sessions, "hit_rate": 0.5}
+    assert len(provider.prompts) == sessions
+
+
 def test_runner_with_real_scorers_produces_scorecards(tmp_path: Path) -> None:
     root = Path(__file__).resolve().parents[2]
     base = root / "alignmenter"
@@ -105,6 +167,43 @@ def test_runner_with_real_scorers_produces_scorecards(tmp_path: Path) -> None:
     assert "personas" in analytics
 
 
+def test_runner_breakdowns_reuse_primary_evaluations(tmp_path: Path) -> None:
+    root = Path(__file__).resolve().parents[2]
+    base = root / "alignmenter"
+
+    config = RunConfig(
+        model="openai:gpt-4o-mini",
+        dataset_path=base / "datasets" / "demo_conversations.jsonl",
+        persona_path=base / "configs" / "persona" / "default.yaml",
+        report_out_dir=tmp_path,
+        run_id="test-groups",
+    )
+
+    class CountingScorer(AuthenticityScorer):
+        evaluate_calls = 0
+        score_calls = 0
+
+        def evaluate(self, sessions):
+            CountingScorer.evaluate_calls += 1
+            return super().evaluate(sessions)
+
+        def score(self, sessions):
+            CountingScorer.score_calls += 1
+            return super().score(sessions)
+
+    scorer = CountingScorer(persona_path=config.persona_path, embedding="hashed")
+    runner = Runner(config=config, scorers=[scorer])
+    runner.execute()
+
+    assert CountingScorer.evaluate_calls == 1
+    assert CountingScorer.score_calls == 0
+
+    analytics = runner.analytics
+    assert analytics["scenarios"]
+    for group in analytics["scenarios"].values():
+        assert "authenticity" in group["scores"]
+
+
 def test_runner_threshold_evaluation(tmp_path: Path) -> None:
     root = Path(__file__).resolve().parents[2]
     base = root / "alignmenter"
@@ -208,3 +307,378 @@ def test_runner_generates_transcripts_with_provider(tmp_path: Path) -> None:
     run_meta = json.loads((run_dir / "run.json").read_text())
     assert run_meta["transcripts"]["primary"]["source"] == "generated"
     assert run_meta["usage"]["primary"]["total_tokens"] == 15
+
+
+class SlowEchoProvider:
+    name = "echo"
+
+    def __init__(self, max_concurrency=None) -> None:
+        self.max_concurrency = max_concurrency
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def chat(self, messages, **kwargs):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.01)
+        with self._lock:
+            self.active -= 1
+        return ChatResponse(
+            text=f"echo {messages[-1]['content']} after {len(messages)}",
+            usage={"prompt_tokens": 2, "completion_tokens": 1, "total_tokens": 3},
+        )
+
+    def tokenizer(self):  # pragma: no cover - not used in tests
+        return None
+
+
+def test_runner_generates_sessions_concurrently_in_order(tmp_path: Path) -> None:
+    dataset_path = tmp_path / "dataset.jsonl"
+    dataset_records = []
+    for session in range(8):
+        for turn in range(4):
+            dataset_records.append(
+                {
+                    "session_id": f"s{session}",
+                    "turn_index": turn,
+                    "role": "user" if turn % 2 == 0 else "assistant",
+                    "text": f"s{session}-t{turn}",
+                }
+            )
+    dataset_path.write_text("\n".join(json.dumps(record) for record in dataset_records) + "\n", encoding="utf-8")
+
+    repo_root = Path(__file__).resolve().parents[1]
+    config = RunConfig(
+        model="openai:gpt-4o-mini",
+        dataset_path=dataset_path,
+        persona_path=repo_root / "configs" / "persona" / "default.yaml",
+        compare_model="openai:gpt-4o",
+        report_out_dir=tmp_path,
+        run_id="concurrent",
+        concurrency=4,
+    )
+
+    provider = SlowEchoProvider(max_concurrency=8)
+    compare_provider = SlowEchoProvider(max_concurrency=2)
+    progress: list[int] = []
+    runner = Runner(
+        config=config,
+        scorers=[StubScorer()],
+        compare_scorers=[StubScorer()],
+        provider=provider,
+        compare_provider=compare_provider,
+        generate_transcripts=True,
+        progress_callback=progress.append,
+    )
+    run_dir = runner.execute()
+
+    assert 1 < provider.peak <= 4
+    assert 1 < compare_provider.peak <= 2
+    assert len(progress) == 16
+
+    primary = read_jsonl(run_dir / "transcripts" / "openai_gpt-4o-mini.jsonl")
+    assert [record["text"] for record in primary[:4]] == [
+        "s0-t0",
+        "echo s0-t0 after 1",
+        "s0-t2",
+        "echo s0-t2 after 3",
+    ]
+    assert [record["session_id"] for record in primary] == [record["session_id"] for record in dataset_records]
+
+    run_meta = json.loads((run_dir / "run.json").read_text())
+    assert run_meta["usage"]["primary"]["total_tokens"] == 48
+
+
+def test_context_policy_selects_recent_history() -> None:
+    import pytest
+
+    from alignmenter.runner import ContextPolicy
+
+    roles = ["system", "user", "assistant", "user", "assistant", "user"]
+    tokens = [5, 10, 40, 10, 20, 10]
+
+    window = ContextPolicy(mode="window", max_turns=3)
+    assert window.select(roles, tokens) == [0, 3, 4, 5]
+    # History is trimmed so it never opens on an assistant message.
+    assert ContextPolicy(mode="window", max_turns=2).select(roles, tokens) == [0, 5]
+
+    budgeted = ContextPolicy(mode="tokens", max_tokens=45)
+    assert budgeted.select(roles, tokens) == [0, 3, 4, 5]
+    # The message being answered is always sent, even over budget.
+    assert ContextPolicy(mode="tokens", max_tokens=1).select(roles, tokens) == [0, 5]
+    assert ContextPolicy(mode="tokens", max_tokens=1, pin_system=False).select(roles, tokens) == [5]
+
+    assert ContextPolicy.from_config({"mode": "full"}) is None
+    with pytest.raises(ValueError):
+        ContextPolicy(mode="window")
+    with pytest.raises(ValueError):
+        ContextPolicy.from_config({"mode": "summary"})
+
+
+def test_runner_context_policy_bounds_prompts_and_reports_savings(tmp_path: Path) -> None:
+    from alignmenter.runner import ContextPolicy
+
+    dataset_path = tmp_path / "dataset.jsonl"
+    dataset_records = [
+        {"session_id": "s1", "turn_index": turn, "role": "user" if turn % 2 == 0 else "assistant", "text": f"turn {turn}"}
+        for turn in range(8)
+    ]
+    dataset_path.write_text("\n".join(json.dumps(record) for record in dataset_records) + "\n", encoding="utf-8")
+
+    repo_root = Path(__file__).resolve().parents[1]
+    config = RunConfig(
+        model="openai:gpt-4o-mini",
+        dataset_path=dataset_path,
+        persona_path=repo_root / "configs" / "persona" / "default.yaml",
+        report_out_dir=tmp_path,
+        run_id="context",
+        context_policy=ContextPolicy(mode="window", max_turns=3),
+    )
+
+    provider = SlowEchoProvider()
+    runner = Runner(config=config, scorers=[StubScorer()], provider=provider, generate_transcripts=True)
+    run_dir = runner.execute()
+
+    transcript = read_jsonl(run_dir / "transcripts" / "openai_gpt-4o-mini.jsonl")
+    assert [record["text"] for record in transcript[1::2]] == [
+        "echo turn 0 after 1",
+        "echo turn 2 after 3",
+        "echo turn 4 after 3",
+        "echo turn 6 after 3",
+    ]
+    usage = json.loads((run_dir / "run.json").read_text())["usage"]["primary"]
+    assert usage["prompt_tokens_saved"] > 0
+    assert usage["prompt_tokens_saved_by_session"] == {"s1": usage["prompt_tokens_saved"]}
+
+
+def test_runner_resumes_generation_from_journal(tmp_path: Path) -> None:
+    import pytest
+
+    from alignmenter.runner import JOURNAL_DIR
+
+    dataset_path = tmp_path / "dataset.jsonl"
+    dataset_records = [
+        {"session_id": f"s{session}", "turn_index": turn, "role": "user" if turn % 2 == 0 else "assistant", "text": f"s{session}-t{turn}"}
+        for session in range(4)
+        for turn in range(2)
+    ]
+    dataset_path.write_text("\n".join(json.dumps(record) for record in dataset_records) + "\n", encoding="utf-8")
+
+    repo_root = Path(__file__).resolve().parents[1]
+    config = RunConfig(
+        model="openai:gpt-4o-mini",
+        dataset_path=dataset_path,
+        persona_path=repo_root / "configs" / "persona" / "default.yaml",
+        report_out_dir=tmp_path,
+        run_id="resume",
+        concurrency=1,
+    )
+
+    class CrashingProvider(SlowEchoProvider):
+        def __init__(self, fail_after: int) -> None:
+            super().__init__()
+            self.calls = 0
+            self.fail_after = fail_after
+
+        def chat(self, messages, **kwargs):
+            self.calls += 1
+            if self.calls > self.fail_after:
+                raise KeyboardInterrupt
+            return super().chat(messages, **kwargs)
+
+    crashing = CrashingProvider(fail_after=2)
+    with pytest.raises(KeyboardInterrupt):
+        Runner(config=config, scorers=[StubScorer()], provider=crashing, generate_transcripts=True).execute()
+
+    (run_dir,) = [path for path in tmp_path.iterdir() if path.name.endswith("_resume")]
+    journal = run_dir / JOURNAL_DIR / "primary.jsonl"
+    assert len(journal.read_text().splitlines()) == 3  # header plus two sessions
+    with journal.open("a") as handle:
+        handle.write('{"session_id": "s2", "rec')  # torn write from the crash
+
+    provider = CrashingProvider(fail_after=100)
+    progress: list[int] = []
+    runner = Runner(
+        config=config,
+        scorers=[StubScorer()],
+        provider=provider,
+        generate_transcripts=True,
+        progress_callback=progress.append,
+        resume_dir=run_dir,
+    )
+    assert runner.execute() == run_dir
+
+    assert provider.calls == 2
+    assert sum(progress) == 4
+    transcript = read_jsonl(run_dir / "transcripts" / "openai_gpt-4o-mini.jsonl")
+    assert [record["text"] for record in transcript[1::2]] == [f"echo s{session}-t0 after 1" for session in range(4)]
+    assert json.loads((run_dir / "run.json").read_text())["usage"]["primary"]["total_tokens"] == 12
+
+    other_model = RunConfig(**{**config.__dict__, "model": "openai:gpt-4o"})
+    with pytest.raises(ValueError, match="recorded for model"):
+        Runner(
+            config=other_model, scorers=[StubScorer()], provider=provider, generate_transcripts=True, resume_dir=run_dir
+        ).execute()
+
+
+def test_runner_stops_compare_generation_when_primary_fails(tmp_path: Path) -> None:
+    import pytest
+
+    dataset_path = tmp_path / "dataset.jsonl"
+    dataset_records = [
+        {"session_id": f"s{session:02d}", "turn_index": turn, "role": "user" if turn % 2 == 0 else "assistant", "text": "hi"}
+        for session in range(40)
+        for turn in range(2)
+    ]
+    dataset_path.write_text("\n".join(json.dumps(record) for record in dataset_records) + "\n", encoding="utf-8")
+
+    class FailingProvider:
+        name = "failing"
+
+        def chat(self, messages, **kwargs):
+            time.sleep(0.02)
+            raise RuntimeError("primary provider down")
+
+    class CountingEchoProvider(SlowEchoProvider):
+        calls = 0
+
+        def chat(self, messages, **kwargs):
+            CountingEchoProvider.calls += 1
+            return super().chat(messages, **kwargs)
+
+    repo_root = Path(__file__).resolve().parents[1]
+    config = RunConfig(
+        model="openai:gpt-4o-mini",
+        dataset_path=dataset_path,
+        persona_path=repo_root / "configs" / "persona" / "default.yaml",
+        compare_model="openai:gpt-4o",
+        report_out_dir=tmp_path,
+        run_id="cancel",
+        concurrency=1,
+    )
+    runner = Runner(
+        config=config,
+        scorers=[StubScorer()],
+        compare_scorers=[StubScorer()],
+        provider=FailingProvider(),
+        compare_provider=CountingEchoProvider(),
+        generate_transcripts=True,
+    )
+
+    with pytest.raises(RuntimeError, match="primary provider down"):
+        runner.execute()
+    time.sleep(0.1)
+
+    assert CountingEchoProvider.calls < 40
+    calls = CountingEchoProvider.calls
+    time.sleep(0.1)
+    assert CountingEchoProvider.calls == calls
+
+
+def test_runner_stops_queued_sessions_when_one_fails(tmp_path: Path) -> None:
+    import pytest
+
+    dataset_path = tmp_path / "dataset.jsonl"
+    dataset_records = [
+        {"session_id": f"s{session:02d}", "turn_index": turn, "role": "user" if turn % 2 == 0 else "assistant", "text": f"s{session:02d}"}
+        for session in range(20)
+        for turn in range(2)
+    ]
+    dataset_path.write_text("\n".join(json.dumps(record) for record in dataset_records) + "\n", encoding="utf-8")
+
+    class FailingSecondSession(SlowEchoProvider):
+        def __init__(self) -> None:
+            super().__init__(max_concurrency=2)
+            self.sessions: list[str] = []
+
+        def chat(self, messages, **kwargs):
+            session = messages[-1]["content"]
+            with self._lock:
+                self.sessions.append(session)
+            if session == "s01":
+                raise RuntimeError("provider rejected s01")
+            time.sleep(0.02)
+            return super().chat(messages, **kwargs)
+
+    repo_root = Path(__file__).resolve().parents[1]
+    config = RunConfig(
+        model="openai:gpt-4o-mini",
+        dataset_path=dataset_path,
+        persona_path=repo_root / "configs" / "persona" / "default.yaml",
+        report_out_dir=tmp_path,
+        run_id="fail-fast",
+        concurrency=2,
+    )
+    provider = FailingSecondSession()
+    runner = Runner(config=config, scorers=[StubScorer()], provider=provider, generate_transcripts=True)
+
+    with pytest.raises(RuntimeError, match="provider rejected s01"):
+        runner.execute()
+    time.sleep(0.1)
+
+    # s00 and s01 start together; at most the session that took s01's worker
+    # slot before the failure was seen may also have run.
+    assert len(provider.sessions) <= 3
+    assert set(provider.sessions) <= {"s00", "s01", "s02"}
+
+
+def test_provider_concurrency_defaults_to_one_session() -> None:
+    from alignmenter.providers.anthropic import AnthropicProvider
+    from alignmenter.providers.local import LocalProvider
+    from alignmenter.runner import _provider_concurrency
+
+    assert _provider_concurrency(SlowEchoProvider(), 4) == 1
+    assert _provider_concurrency(SlowEchoProvider(max_concurrency=2), 4) == 2
+    assert _provider_concurrency(AnthropicProvider("claude", client=object()), 4) == 4
+    assert _provider_concurrency(LocalProvider("http://localhost:8000/v1/chat/completions"), 4) == 1
+    assert _provider_concurrency(LocalProvider("http://localhost:8000", max_concurrency=3), 4) == 3
+
+
+def test_runner_resume_regenerates_sessions_edited_since_journaled(tmp_path: Path, caplog) -> None:
+    dataset_path = tmp_path / "dataset.jsonl"
+
+    def write_dataset(edited: str) -> None:
+        records = []
+        for session in range(3):
+            text = edited if session == 1 else f"s{session}"
+            records.append({"session_id": f"s{session}", "turn_index": 0, "role": "user", "text": text})
+            records.append({"session_id": f"s{session}", "turn_index": 1, "role": "assistant", "text": "old"})
+        dataset_path.write_text("\n".join(json.dumps(record) for record in records) + "\n", encoding="utf-8")
+
+    class CountingEcho(SlowEchoProvider):
+        def __init__(self) -> None:
+            super().__init__()
+            self.prompts: list[str] = []
+
+        def chat(self, messages, **kwargs):
+            self.prompts.append(messages[-1]["content"])
+            return super().chat(messages, **kwargs)
+
+    write_dataset("s1")
+    repo_root = Path(__file__).resolve().parents[1]
+    config = RunConfig(
+        model="openai:gpt-4o-mini",
+        dataset_path=dataset_path,
+        persona_path=repo_root / "configs" / "persona" / "default.yaml",
+        report_out_dir=tmp_path,
+        run_id="edited",
+        concurrency=1,
+    )
+    run_dir = Runner(config=config, scorers=[StubScorer()], provider=CountingEcho(), generate_transcripts=True).execute()
+
+    write_dataset("s1 edited")
+    provider = CountingEcho()
+    with caplog.at_level("WARNING", logger="alignmenter.runner"):
+        Runner(
+            config=config, scorers=[StubScorer()], provider=provider, generate_transcripts=True, resume_dir=run_dir
+        ).execute()
+
+    assert provider.prompts == ["s1 edited"]
+    assert "Regenerating 1 journaled session(s)" in caplog.text
+    transcript = read_jsonl(run_dir / "transcripts" / "openai_gpt-4o-mini.jsonl")
+    assert [record["text"] for record in transcript if record["session_id"] == "s1"] == [
+        "s1 edited",
+        "echo s1 edited after 1",
+    ]
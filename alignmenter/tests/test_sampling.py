@@ -289,3 +289,48 @@ def test_untagged_sessions():
 
     # Should still sample, treating all as "untagged"
     assert len(selected) == 5
+
+
+def test_hash_sampling_is_deterministic_and_nested():
+    """Reruns pick the same sessions and larger rates pick supersets."""
+    sessions = _create_mock_sessions(90)
+
+    for strategy in ("random", "stratified"):
+        small = select_scenarios_for_judge(sessions=sessions, sample_rate=0.1, strategy=strategy, seed=7)
+        again = select_scenarios_for_judge(sessions=list(reversed(sessions)), sample_rate=0.1, strategy=strategy, seed=7)
+        large = select_scenarios_for_judge(sessions=sessions, sample_rate=0.3, strategy=strategy, seed=7)
+
+        small_ids = {s.session_id for s in small}
+        assert small_ids == {s.session_id for s in again}
+        assert small_ids < {s.session_id for s in large}
+
+    other_seed = select_scenarios_for_judge(sessions=sessions, sample_rate=0.1, strategy="random", seed=8)
+    assert {s.session_id for s in other_seed} != {
+        s.session_id for s in select_scenarios_for_judge(sessions=sessions, sample_rate=0.1, strategy="random", seed=7)
+    }
+
+
+def test_stratified_sampling_ignores_hash_seed():
+    """Multi-tag sessions land in the same stratum under any PYTHONHASHSEED."""
+    import os
+    import subprocess
+    import sys
+
+    script = (
+        "from alignmenter.calibration.sampling import select_scenarios_for_judge\n"
+        "from types import SimpleNamespace as S\n"
+        "tags = ['alpha', 'beta', 'gamma', 'delta']\n"
+        "sessions = [S(session_id=f's{i:02d}', scenario_tags={tags[i % 4], tags[(i + 1) % 4]}, turns=[])"
+        " for i in range(24)]\n"
+        "picked = select_scenarios_for_judge(sessions, sample_rate=0.25, strategy='stratified')\n"
+        "print(','.join(s.session_id for s in picked))\n"
+    )
+    outputs = set()
+    for hash_seed in ("1", "2", "3"):
+        env = {**os.environ, "PYTHONHASHSEED": hash_seed, "PYTHONPATH": os.pathsep.join(sys.path)}
+        result = subprocess.run(
+            [sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True
+        )
+        outputs.add(result.stdout.strip())
+
+    assert len(outputs) == 1
@@ -1,7 +1,38 @@
 """Basic smoke tests for scaffold."""
 
+import json
+import os
+import subprocess
+import sys
+
 from alignmenter import app
 
 
 def test_cli_app_exists() -> None:
     assert app is not None
+
+
+HEAVY_MODULES = ("torch", "sentence_transformers", "transformers", "openai", "anthropic", "requests", "sklearn")
+
+
+def test_cli_import_skips_heavy_dependencies() -> None:
+    script = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "import alignmenter.cli\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"heavy = [name for name in {HEAVY_MODULES!r} if name in sys.modules]\n"
+        "print(json.dumps({'elapsed': elapsed, 'heavy': heavy}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    payload = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert payload["heavy"] == []
+    # Generous budget: the CLI should load in well under a second without SDKs.
+    assert payload["elapsed"] < 1.5